@@ -14,14 +14,16 @@ from bloodgas.models.disorders import (
     ClinicalCondition,
     ChronicCondition,
 )
-from bloodgas.models.blood_gas_result import BloodGasResult, ClinicalInterpretation
+from bloodgas.models.blood_gas_result import BloodGasBatch, BloodGasResult, ClinicalInterpretation
 from bloodgas.models.patient_state import PatientFactors
-from bloodgas.generator import generate_blood_gas
+from bloodgas.generator import generate_blood_gas, generate_blood_gas_batch
 
 __version__ = "0.1.0"
 __all__ = [
     "generate_blood_gas",
+    "generate_blood_gas_batch",
     "BloodGasResult",
+    "BloodGasBatch",
     "ClinicalInterpretation",
     "PatientFactors",
     "Disorder",
@@ -0,0 +1,33 @@
+"""
+Optional fast JSON encoding.
+
+orjson is used for to_json() when it is installed, then msgspec, and
+otherwise the standard library encoder. orjson only supports two-space
+indentation, so other indent values fall through to msgspec or json
+(msgspec has no equivalent of json's newline-only indent=0).
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def dumps(obj, indent=None) -> str:
+    """Serialize obj to a JSON string, preferring orjson or msgspec when available."""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+    if msgspec is not None and (indent is None or indent > 0):
+        encoded = msgspec.json.encode(obj)
+        if indent:
+            encoded = msgspec.json.format(encoded, indent=indent)
+        return encoded.decode()
+    return json.dumps(obj, indent=indent)
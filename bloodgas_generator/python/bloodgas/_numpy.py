@@ -0,0 +1,24 @@
+"""
+Optional NumPy support.
+
+NumPy is only needed for the batch generation paths. The scalar
+generator stays dependency-free, so NumPy is not imported until a
+caller asks for the module via require_numpy().
+"""
+
+from importlib.util import find_spec
+
+# Checked without importing NumPy, which would add tens of milliseconds to
+# every short-lived scalar-only run
+NUMPY_AVAILABLE = find_spec("numpy") is not None
+
+
+def require_numpy():
+    """Return the numpy module, raising a helpful ImportError if it is missing."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "NumPy is required for batch generation. "
+            "Install it with: pip install bloodgas-generator[batch]"
+        )
+    import numpy
+    return numpy
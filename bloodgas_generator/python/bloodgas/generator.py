@@ -5,7 +5,10 @@ Main generation engine that orchestrates all components to produce
 physiologically accurate blood gas values.
 """
 
-from typing import Dict, List, Optional, Union
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple, Union
+from bloodgas._numpy import require_numpy
 from bloodgas.models.disorders import (
     Disorder,
     Severity,
@@ -14,19 +17,61 @@ from bloodgas.models.disorders import (
     ClinicalCondition,
 )
 from bloodgas.models.blood_gas_result import (
+    BloodGasBatch,
     BloodGasResult,
     ClinicalInterpretation,
     GenerationParams,
 )
 from bloodgas.models.patient_state import PatientFactors
+from bloodgas.interpretation import InterpretationEngine
 from bloodgas.physiology.acid_base import AcidBaseEngine
 from bloodgas.physiology.oxygenation import OxygenationEngine
 from bloodgas.physiology.electrolytes import ElectrolyteEngine
-from bloodgas.physiology.variability import VariabilityEngine, create_variability_engine
+from bloodgas.physiology.variability import (
+    PANEL_FIELDS,
+    VariabilityEngine,
+    create_variability_engine,
+)
 from bloodgas.scenarios.scenario_mapper import ScenarioMapper
 from bloodgas.scenarios.clinical_conditions import get_condition_effect
 
 
+# Oxygenation parameters assumed for each primary disorder:
+# (aa_gradient_elevated, target_aa_gradient, shunt_fraction)
+# For pure acid-base disorders, assume appropriate pathology
+OXY_PARAMS_BY_DISORDER: Mapping[Disorder, Tuple[bool, Optional[float], float]] = MappingProxyType({
+    # Lung pathology: moderate V/Q mismatch with a small shunt component
+    Disorder.RESPIRATORY_ACIDOSIS: (True, 30.0, 0.10),
+})
+NORMAL_OXY_PARAMS: Tuple[bool, Optional[float], float] = (False, None, 0.0)
+
+# Primary disorders generated with an elevated anion gap (assume HAGMA by default)
+AG_ELEVATED_DISORDERS = frozenset({Disorder.METABOLIC_ACIDOSIS})
+
+# Shared default patient (PatientFactors is immutable, so one instance suffices)
+_DEFAULT_PATIENT = PatientFactors()
+
+
+@dataclass(slots=True)
+class _TargetValues:
+    """Pre-variability values shared by the scalar and batch generators."""
+    ph: float
+    pco2: float
+    po2: float
+    hco3: float
+    sodium: float
+    potassium: float
+    chloride: float
+    glucose: float
+    lactate: float
+    hemoglobin: float
+    albumin: float
+    
+    def panel(self) -> List[float]:
+        """Values to be varied, in PANEL_FIELDS order."""
+        return [getattr(self, name) for name in PANEL_FIELDS]
+
+
 def generate_blood_gas(
     # Disorder-based mode parameters
     primary_disorder: Optional[Disorder] = None,
@@ -100,27 +145,26 @@ def generate_blood_gas(
     """
     # Initialize patient factors
     if patient_factors is None:
-        patient_factors = PatientFactors()
+        patient_factors = _DEFAULT_PATIENT
+    
+    # Initialize variability engine (none at all for deterministic output)
+    variability = create_variability_engine(seed=seed) if add_variability else None
     
-    # Initialize variability engine
-    variability = create_variability_engine(enabled=add_variability, seed=seed)
+    # Bind the optional severities once for target generation and params
+    severities = condition_severities or {}
     
-    # Determine generation mode and create result
+    # Determine generation mode and compute target values
     if conditions is not None:
         # Scenario-based mode
-        result = _generate_from_scenarios(
+        targets = _scenario_targets(
             conditions=conditions,
-            severities=condition_severities or {},
+            severities=severities,
             patient=patient_factors,
             fio2=fio2,
-            variability=variability,
         )
-        mode = "scenario"
-        condition_names = [c.name for c in conditions]
-        severity_names = {c.name: s.name for c, s in (condition_severities or {}).items()}
     else:
         # Disorder-based mode
-        result = _generate_from_disorder(
+        targets = _disorder_targets(
             primary_disorder=primary_disorder or Disorder.NORMAL,
             severity=severity or Severity.MODERATE,
             compensation=compensation,
@@ -128,34 +172,277 @@ def generate_blood_gas(
             duration=duration,
             patient=patient_factors,
             fio2=fio2,
-            variability=variability,
         )
-        mode = "disorder"
-        condition_names = []
-        severity_names = {}
-    
-    # Create generation params
-    result.generation_params = GenerationParams(
-        mode=mode,
-        primary_disorder=primary_disorder.name if primary_disorder else None,
-        secondary_disorder=secondary_disorder.name if secondary_disorder else None,
-        specified_compensation=compensation.name if compensation else None,
-        conditions=condition_names,
-        condition_severities=severity_names,
-        patient_age=patient_factors.age,
-        chronic_conditions=[c.name for c in patient_factors.chronic_conditions],
+    
+    # Create generation params and pass them in, so the result does not
+    # build a placeholder that would immediately be replaced
+    generation_params = _build_generation_params(
+        primary_disorder=primary_disorder,
+        secondary_disorder=secondary_disorder,
+        compensation=compensation,
+        conditions=conditions,
+        condition_severities=severities,
+        patient=patient_factors,
         fio2=fio2,
         seed=seed,
     )
     
+    result = _finalize(
+        targets,
+        fio2=fio2,
+        expected_aa=patient_factors.get_expected_aa_gradient(),
+        variability=variability,
+        generation_params=generation_params,
+    )
+    
     # Generate interpretation
-    from bloodgas.interpretation import InterpretationEngine
     result.interpretation = InterpretationEngine.interpret(result, conditions)
     
     return result
 
 
-def _generate_from_disorder(
+def generate_blood_gas_batch(
+    n: int,
+    # Disorder-based mode parameters
+    primary_disorder: Optional[Disorder] = None,
+    severity: Optional[Severity] = None,
+    compensation: Compensation = Compensation.APPROPRIATE,
+    secondary_disorder: Optional[Disorder] = None,
+    duration: Duration = Duration.ACUTE,
+    
+    # Clinical scenario mode parameters
+    conditions: Optional[List[ClinicalCondition]] = None,
+    condition_severities: Optional[Dict[ClinicalCondition, Severity]] = None,
+    
+    # Patient factors
+    patient_factors: Optional[PatientFactors] = None,
+    
+    # Environment
+    fio2: float = 0.21,
+    
+    # Variability
+    add_variability: bool = True,
+    seed: Optional[int] = None,
+) -> BloodGasBatch:
+    """
+    Generate n blood gases for the same specification as NumPy arrays.
+    
+    Takes the same arguments as generate_blood_gas(). The deterministic
+    target values are computed once, then variability and the derived
+    values are applied to whole arrays at a time. Requires NumPy
+    (pip install bloodgas-generator[batch]).
+    
+    Args:
+        n: Number of cases to generate
+        (remaining arguments as for generate_blood_gas)
+    
+    Returns:
+        BloodGasBatch holding one array of length n per value.
+        Cases are not interpreted; use BloodGasBatch.result(i) and
+        InterpretationEngine.interpret for individual cases.
+    
+    Example:
+        batch = generate_blood_gas_batch(
+            10_000,
+            conditions=[ClinicalCondition.DKA],
+            seed=42,
+        )
+        batch.ph.mean()
+    """
+    np = require_numpy()
+    
+    if n < 1:
+        raise ValueError("n must be at least 1")
+    
+    if patient_factors is None:
+        patient_factors = _DEFAULT_PATIENT
+    
+    severities = condition_severities or {}
+    
+    if conditions is not None:
+        targets = _scenario_targets(
+            conditions=conditions,
+            severities=severities,
+            patient=patient_factors,
+            fio2=fio2,
+        )
+    else:
+        targets = _disorder_targets(
+            primary_disorder=primary_disorder or Disorder.NORMAL,
+            severity=severity or Severity.MODERATE,
+            compensation=compensation,
+            secondary_disorder=secondary_disorder,
+            duration=duration,
+            patient=patient_factors,
+            fio2=fio2,
+        )
+    
+    # Noise comes from a dedicated NumPy generator; the global random module is untouched
+    variability = create_variability_engine(enabled=add_variability)
+    rng = np.random.default_rng(seed)
+    
+    # Apply variability to the whole (fields x cases) panel at once
+    panel = np.repeat(np.array(targets.panel())[:, None], n, axis=1)
+    (
+        ph, pco2, po2, hco3,
+        sodium, potassium, chloride, glucose, lactate, hemoglobin,
+    ) = variability.vary_panel_array(panel, rng)
+    
+    # Recalculate derived values after variability
+    sao2 = OxygenationEngine.calculate_sao2_array(po2, ph)
+    sao2 = variability.vary_array("sao2", sao2, rng)
+    
+    base_excess, pf_ratio, aa_gradient, anion_gap, corrected_ag, delta_gap = _derived_values(
+        ph, pco2, po2, hco3, sodium, chloride, hemoglobin, targets.albumin, fio2
+    )
+    expected_aa = patient_factors.get_expected_aa_gradient()
+    
+    return BloodGasBatch(
+        ph=ph,
+        pco2=pco2,
+        po2=po2,
+        hco3=hco3,
+        base_excess=base_excess,
+        sao2=sao2,
+        fio2=np.full(n, fio2),
+        pao2_fio2_ratio=pf_ratio,
+        aa_gradient=aa_gradient,
+        expected_aa_gradient=np.full(n, expected_aa),
+        sodium=sodium,
+        potassium=potassium,
+        chloride=chloride,
+        glucose=glucose,
+        anion_gap=anion_gap,
+        corrected_anion_gap=corrected_ag,
+        delta_gap=delta_gap,
+        lactate=lactate,
+        hemoglobin=hemoglobin,
+        albumin=np.full(n, targets.albumin),
+        generation_params=_build_generation_params(
+            primary_disorder=primary_disorder,
+            secondary_disorder=secondary_disorder,
+            compensation=compensation,
+            conditions=conditions,
+            condition_severities=severities,
+            patient=patient_factors,
+            fio2=fio2,
+            seed=seed,
+        ),
+    )
+
+
+def _clamp(value: float, low: float, high: float) -> float:
+    """Clamp a scalar to [low, high] with plain comparisons."""
+    return low if value < low else high if value > high else value
+
+
+def _build_generation_params(
+    primary_disorder: Optional[Disorder],
+    secondary_disorder: Optional[Disorder],
+    compensation: Compensation,
+    conditions: Optional[List[ClinicalCondition]],
+    condition_severities: Dict[ClinicalCondition, Severity],
+    patient: PatientFactors,
+    fio2: float,
+    seed: Optional[int],
+) -> GenerationParams:
+    """Record the arguments a result was generated from."""
+    return GenerationParams(
+        mode="scenario" if conditions is not None else "disorder",
+        primary_disorder=primary_disorder,
+        secondary_disorder=secondary_disorder,
+        specified_compensation=compensation,
+        conditions=list(conditions) if conditions is not None else (),
+        condition_severities=dict(condition_severities) if conditions is not None else {},
+        patient_age=patient.age,
+        chronic_conditions=patient.chronic_conditions,
+        fio2=fio2,
+        seed=seed,
+    )
+
+
+def _finalize(
+    targets: _TargetValues,
+    fio2: float,
+    expected_aa: float,
+    variability: Optional[VariabilityEngine],
+    generation_params: Optional[GenerationParams] = None,
+) -> BloodGasResult:
+    """
+    Apply variability to target values and compute the derived values.
+    
+    Passing variability=None skips the noise pipeline entirely.
+    """
+    
+    # Apply variability
+    values = targets.panel()
+    if variability is not None:
+        values = variability.vary_panel(values)
+    (
+        ph, pco2, po2, hco3,
+        sodium, potassium, chloride, glucose, lactate, hemoglobin,
+    ) = values
+    
+    # Recalculate derived values after variability
+    sao2 = OxygenationEngine.calculate_sao2(po2, ph)
+    if variability is not None:
+        sao2 = variability.vary_sao2(sao2)
+    
+    base_excess, pf_ratio, aa_gradient, anion_gap, corrected_ag, delta_gap = _derived_values(
+        ph, pco2, po2, hco3, sodium, chloride, hemoglobin, targets.albumin, fio2
+    )
+    
+    return BloodGasResult(
+        ph=ph,
+        pco2=pco2,
+        po2=po2,
+        hco3=hco3,
+        base_excess=base_excess,
+        sao2=sao2,
+        fio2=fio2,
+        pao2_fio2_ratio=pf_ratio,
+        aa_gradient=aa_gradient,
+        expected_aa_gradient=expected_aa,
+        sodium=sodium,
+        potassium=potassium,
+        chloride=chloride,
+        glucose=glucose,
+        anion_gap=anion_gap,
+        corrected_anion_gap=corrected_ag,
+        delta_gap=delta_gap,
+        lactate=lactate,
+        hemoglobin=hemoglobin,
+        albumin=targets.albumin,
+        generation_params=generation_params,
+    )
+
+
+def _derived_values(
+    ph, pco2, po2, hco3, sodium, chloride, hemoglobin, albumin, fio2
+) -> Tuple:
+    """
+    Compute the values derived from a measured panel.
+    
+    Uses only arithmetic, so the same code serves scalar floats and
+    NumPy arrays (the batch path).
+    
+    Returns:
+        (base_excess, pf_ratio, aa_gradient, anion_gap,
+         corrected_anion_gap, delta_gap)
+    """
+    base_excess = AcidBaseEngine.calculate_base_excess(ph, hco3, hemoglobin)
+    
+    pf_ratio = OxygenationEngine.calculate_pf_ratio(po2, fio2)
+    aa_gradient = OxygenationEngine.calculate_aa_gradient(po2, pco2, fio2)
+    
+    anion_gap = ElectrolyteEngine.calculate_anion_gap(sodium, chloride, hco3)
+    corrected_ag = ElectrolyteEngine.correct_anion_gap_for_albumin(anion_gap, albumin)
+    delta_gap = ElectrolyteEngine.calculate_delta_gap(corrected_ag)
+    
+    return base_excess, pf_ratio, aa_gradient, anion_gap, corrected_ag, delta_gap
+
+
+def _disorder_targets(
     primary_disorder: Disorder,
     severity: Severity,
     compensation: Compensation,
@@ -163,9 +450,8 @@ def _generate_from_disorder(
     duration: Duration,
     patient: PatientFactors,
     fio2: float,
-    variability: VariabilityEngine,
-) -> BloodGasResult:
-    """Generate blood gas from disorder specification."""
+) -> _TargetValues:
+    """Compute pre-variability values for a disorder specification."""
     
     # Get baseline values from patient
     baseline_pco2 = patient.get_baseline_pco2()
@@ -183,21 +469,14 @@ def _generate_from_disorder(
     
     # Apply secondary disorder if specified
     if secondary_disorder and secondary_disorder != Disorder.NORMAL:
-        ab_state = AcidBaseEngine.apply_secondary_disorder(
-            ab_state, secondary_disorder, Severity.MODERATE
+        AcidBaseEngine.apply_secondary_disorder(
+            ab_state, secondary_disorder, Severity.MODERATE, in_place=True
         )
     
     # Determine oxygenation parameters based on disorder
-    # For pure acid-base disorders, assume appropriate pathology
-    aa_elevated = False
-    target_aa_gradient = None
-    shunt_fraction = 0.0
-    
-    if primary_disorder == Disorder.RESPIRATORY_ACIDOSIS:
-        aa_elevated = True  # Assume lung pathology
-        # Moderate V/Q mismatch for respiratory acidosis
-        target_aa_gradient = 30.0  # Elevated A-a gradient
-        shunt_fraction = 0.10  # Small shunt component
+    aa_elevated, target_aa_gradient, shunt_fraction = OXY_PARAMS_BY_DISORDER.get(
+        primary_disorder, NORMAL_OXY_PARAMS
+    )
     
     # Generate oxygenation with pathology-based parameters
     oxy_state = OxygenationEngine.generate_oxygenation(
@@ -211,88 +490,39 @@ def _generate_from_disorder(
         temperature=patient.temperature_celsius,
     )
     
-    # Determine anion gap elevation
-    ag_elevated = False
-    if primary_disorder == Disorder.METABOLIC_ACIDOSIS:
-        ag_elevated = True  # Assume HAGMA by default
-    
     # Generate electrolytes
     lyte_state = ElectrolyteEngine.generate_electrolytes(
         hco3=ab_state.hco3,
         ph=ab_state.ph,
-        elevated_anion_gap=ag_elevated,
+        elevated_anion_gap=primary_disorder in AG_ELEVATED_DISORDERS,
         albumin=patient.get_baseline_albumin(),
     )
     
-    # Get hemoglobin
-    hemoglobin = patient.get_baseline_hemoglobin()
-    
-    # Apply variability
-    ph = variability.vary_ph(ab_state.ph)
-    pco2 = variability.vary_pco2(ab_state.pco2)
-    po2 = variability.vary_po2(oxy_state.pao2)
-    hco3 = variability.vary_hco3(ab_state.hco3)
-    
-    sodium = variability.vary_sodium(lyte_state.sodium)
-    potassium = variability.vary_potassium(lyte_state.potassium)
-    chloride = variability.vary_chloride(lyte_state.chloride)
-    glucose = variability.vary_glucose(lyte_state.glucose)
-    lactate = variability.vary_lactate(lyte_state.lactate)
-    hemoglobin = variability.vary_hemoglobin(hemoglobin)
-    
-    # Recalculate derived values
-    sao2 = OxygenationEngine.calculate_sao2(po2, ph)
-    sao2 = variability.vary_sao2(sao2)
-    
-    base_excess = AcidBaseEngine.calculate_base_excess(ph, hco3, hemoglobin)
-    
-    pf_ratio = OxygenationEngine.calculate_pf_ratio(po2, fio2)
-    aa_gradient = OxygenationEngine.calculate_aa_gradient(po2, pco2, fio2)
-    expected_aa = OxygenationEngine.expected_aa_gradient(patient.age)
-    
-    anion_gap = ElectrolyteEngine.calculate_anion_gap(sodium, chloride, hco3)
-    corrected_ag = ElectrolyteEngine.correct_anion_gap_for_albumin(
-        anion_gap, lyte_state.albumin
-    )
-    delta_gap = ElectrolyteEngine.calculate_delta_gap(corrected_ag)
-    
-    return BloodGasResult(
-        ph=ph,
-        pco2=pco2,
-        po2=po2,
-        hco3=hco3,
-        base_excess=base_excess,
-        sao2=sao2,
-        fio2=fio2,
-        pao2_fio2_ratio=pf_ratio,
-        aa_gradient=aa_gradient,
-        expected_aa_gradient=expected_aa,
-        sodium=sodium,
-        potassium=potassium,
-        chloride=chloride,
-        glucose=glucose,
-        anion_gap=anion_gap,
-        corrected_anion_gap=corrected_ag,
-        delta_gap=delta_gap,
-        lactate=lactate,
-        hemoglobin=hemoglobin,
+    return _TargetValues(
+        ph=ab_state.ph,
+        pco2=ab_state.pco2,
+        po2=oxy_state.pao2,
+        hco3=ab_state.hco3,
+        sodium=lyte_state.sodium,
+        potassium=lyte_state.potassium,
+        chloride=lyte_state.chloride,
+        glucose=lyte_state.glucose,
+        lactate=lyte_state.lactate,
+        hemoglobin=patient.get_baseline_hemoglobin(),
         albumin=lyte_state.albumin,
     )
 
 
-def _generate_from_scenarios(
+def _scenario_targets(
     conditions: List[ClinicalCondition],
     severities: Dict[ClinicalCondition, Severity],
     patient: PatientFactors,
     fio2: float,
-    variability: VariabilityEngine,
-) -> BloodGasResult:
-    """Generate blood gas from clinical scenario specification."""
+) -> _TargetValues:
+    """Compute pre-variability values for a clinical scenario specification."""
     
-    # Default severities to MODERATE
-    for condition in conditions:
-        if condition not in severities:
-            severities[condition] = Severity.MODERATE
+    # Default severities to MODERATE (without mutating the caller's dict)
+    severities = {c: Severity.MODERATE for c in conditions} | severities
     
     # Map conditions to physiological deltas
     deltas = ScenarioMapper.map_multiple_conditions(
@@ -310,18 +540,14 @@ def _generate_from_scenarios(
     target_hco3 = baseline_hco3 + deltas.hco3_delta
     
     # Clamp to physiological limits
-    target_pco2 = max(min(target_pco2, 120), 12)
-    target_hco3 = max(min(target_hco3, 50), 4)
+    target_pco2 = _clamp(target_pco2, 12.0, 120.0)
+    target_hco3 = _clamp(target_hco3, 4.0, 50.0)
     
     # Calculate pH from Henderson-Hasselbalch
     ph = AcidBaseEngine.calculate_ph(target_hco3, target_pco2)
     
     # Clamp pH
-    ph = max(min(ph, 7.80), 6.80)
-    
-    # Calculate base excess
-    hemoglobin = patient.get_baseline_hemoglobin()
-    base_excess = AcidBaseEngine.calculate_base_excess(ph, target_hco3, hemoglobin)
+    ph = _clamp(ph, 6.80, 7.80)
     
     # Generate oxygenation using pathology-based parameters
     # This calculates pO2 based on FiO2, A-a gradient, and shunt fraction
@@ -358,55 +584,16 @@ def _generate_from_scenarios(
         albumin=patient.get_baseline_albumin(),
     )
     
-    # Apply variability
-    ph = variability.vary_ph(ph)
-    pco2 = variability.vary_pco2(target_pco2)
-    po2 = variability.vary_po2(po2)
-    hco3 = variability.vary_hco3(target_hco3)
-    
-    sodium = variability.vary_sodium(lyte_state.sodium)
-    potassium = variability.vary_potassium(lyte_state.potassium)
-    chloride = variability.vary_chloride(lyte_state.chloride)
-    glucose = variability.vary_glucose(lyte_state.glucose)
-    lactate = variability.vary_lactate(lyte_state.lactate)
-    hemoglobin = variability.vary_hemoglobin(hemoglobin)
-    
-    # Recalculate derived values after variability
-    sao2 = OxygenationEngine.calculate_sao2(po2, ph)
-    sao2 = variability.vary_sao2(sao2)
-    
-    base_excess = AcidBaseEngine.calculate_base_excess(ph, hco3, hemoglobin)
-    
-    pf_ratio = OxygenationEngine.calculate_pf_ratio(po2, fio2)
-    aa_gradient = OxygenationEngine.calculate_aa_gradient(po2, pco2, fio2)
-    expected_aa = OxygenationEngine.expected_aa_gradient(patient.age)
-    
-    anion_gap = ElectrolyteEngine.calculate_anion_gap(sodium, chloride, hco3)
-    corrected_ag = ElectrolyteEngine.correct_anion_gap_for_albumin(
-        anion_gap, lyte_state.albumin
-    )
-    delta_gap = ElectrolyteEngine.calculate_delta_gap(corrected_ag)
-    
-    return BloodGasResult(
+    return _TargetValues(
         ph=ph,
-        pco2=pco2,
+        pco2=target_pco2,
         po2=po2,
-        hco3=hco3,
-        base_excess=base_excess,
-        sao2=sao2,
-        fio2=fio2,
-        pao2_fio2_ratio=pf_ratio,
-        aa_gradient=aa_gradient,
-        expected_aa_gradient=expected_aa,
-        sodium=sodium,
-        potassium=potassium,
-        chloride=chloride,
-        glucose=glucose,
-        anion_gap=anion_gap,
-        corrected_anion_gap=corrected_ag,
-        delta_gap=delta_gap,
-        lactate=lactate,
-        hemoglobin=hemoglobin,
+        hco3=target_hco3,
+        sodium=lyte_state.sodium,
+        potassium=lyte_state.potassium,
+        chloride=lyte_state.chloride,
+        glucose=lyte_state.glucose,
+        lactate=lyte_state.lactate,
+        hemoglobin=patient.get_baseline_hemoglobin(),
         albumin=lyte_state.albumin,
     )
-
@@ -5,8 +5,18 @@ Generates clinical interpretation text for blood gas results,
 including teaching points for educational use.
 """
 
-from typing import List, Optional
+from bisect import bisect_left, bisect_right
+from dataclasses import FrozenInstanceError, replace
+from enum import IntEnum
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from bloodgas._numpy import require_numpy
 from bloodgas.models.blood_gas_result import (
+    BATCH_VALUE_FIELDS,
+    BloodGasBatch,
+    INTERPRETATION_FIELDS,
     BloodGasResult,
     ClinicalInterpretation,
     InterpretationSeverity,
@@ -15,7 +25,143 @@ from bloodgas.models.disorders import ClinicalCondition, Disorder
 from bloodgas.physiology.acid_base import AcidBaseEngine, NORMAL_PH, NORMAL_PCO2, NORMAL_HCO3
 from bloodgas.physiology.oxygenation import OxygenationEngine
 from bloodgas.physiology.electrolytes import ElectrolyteEngine
-from bloodgas.scenarios.clinical_conditions import get_condition_effect
+from bloodgas.scenarios.clinical_conditions import (
+    COMPENSATION_BLOCKING_CONDITIONS,
+    get_condition_effect,
+)
+
+
+class PrimaryDisorder(IntEnum):
+    """Primary disorder as classified from a measured blood gas."""
+    NORMAL = 0
+    COMPENSATED_METABOLIC_ACIDOSIS = 1
+    COMPENSATED_RESPIRATORY_ACIDOSIS_OR_METABOLIC_ALKALOSIS = 2
+    RESPIRATORY_ACIDOSIS = 3
+    METABOLIC_ACIDOSIS = 4
+    MIXED_ACIDOSIS = 5
+    MIXED_ACIDEMIA = 6
+    RESPIRATORY_ALKALOSIS = 7
+    METABOLIC_ALKALOSIS = 8
+    MIXED_ALKALOSIS = 9
+    MIXED_ALKALEMIA = 10
+
+
+# Human-readable labels, indexed by PrimaryDisorder
+PRIMARY_DISORDER_LABELS = (
+    "Normal",
+    "Compensated Metabolic Acidosis",
+    "Compensated Respiratory Acidosis or Metabolic Alkalosis",
+    "Respiratory Acidosis",
+    "Metabolic Acidosis",
+    "Mixed Respiratory and Metabolic Acidosis",
+    "Acidemia - Mixed Disorder",
+    "Respiratory Alkalosis",
+    "Metabolic Alkalosis",
+    "Mixed Respiratory Alkalosis and Metabolic Alkalosis",
+    "Alkalemia - Mixed Disorder",
+)
+
+# Disorder whose expected compensation is assessed; absent = mixed picture
+COMPENSATION_TARGETS = {
+    PrimaryDisorder.COMPENSATED_METABOLIC_ACIDOSIS: Disorder.METABOLIC_ACIDOSIS,
+    PrimaryDisorder.METABOLIC_ACIDOSIS: Disorder.METABOLIC_ACIDOSIS,
+    PrimaryDisorder.MIXED_ACIDOSIS: Disorder.METABOLIC_ACIDOSIS,
+    PrimaryDisorder.COMPENSATED_RESPIRATORY_ACIDOSIS_OR_METABOLIC_ALKALOSIS: Disorder.METABOLIC_ALKALOSIS,
+    PrimaryDisorder.METABOLIC_ALKALOSIS: Disorder.METABOLIC_ALKALOSIS,
+    PrimaryDisorder.MIXED_ALKALOSIS: Disorder.METABOLIC_ALKALOSIS,
+    PrimaryDisorder.RESPIRATORY_ACIDOSIS: Disorder.RESPIRATORY_ACIDOSIS,
+    PrimaryDisorder.RESPIRATORY_ALKALOSIS: Disorder.RESPIRATORY_ALKALOSIS,
+}
+
+# Disorders reported on the acidemic side of the pH scale
+ACIDEMIC_DISORDERS = frozenset({
+    PrimaryDisorder.COMPENSATED_METABOLIC_ACIDOSIS,
+    PrimaryDisorder.COMPENSATED_RESPIRATORY_ACIDOSIS_OR_METABOLIC_ALKALOSIS,
+    PrimaryDisorder.RESPIRATORY_ACIDOSIS,
+    PrimaryDisorder.METABOLIC_ACIDOSIS,
+    PrimaryDisorder.MIXED_ACIDOSIS,
+    PrimaryDisorder.MIXED_ACIDEMIA,
+})
+
+# Description template per disorder; the severity word is filled in from pH
+PRIMARY_DESCRIPTION_TEMPLATES = {
+    PrimaryDisorder.COMPENSATED_METABOLIC_ACIDOSIS:
+        "{severity} metabolic acidosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.COMPENSATED_RESPIRATORY_ACIDOSIS_OR_METABOLIC_ALKALOSIS:
+        "{severity} metabolic acidosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.RESPIRATORY_ACIDOSIS:
+        "{severity} respiratory acidosis with pH {ph:.2f}, pCO2 {pco2:.0f} mmHg",
+    PrimaryDisorder.METABOLIC_ACIDOSIS:
+        "{severity} metabolic acidosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.MIXED_ACIDOSIS:
+        "{severity} metabolic acidosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.MIXED_ACIDEMIA: "{severity} acidemia with pH {ph:.2f}",
+    PrimaryDisorder.RESPIRATORY_ALKALOSIS:
+        "{severity} respiratory alkalosis with pH {ph:.2f}, pCO2 {pco2:.0f} mmHg",
+    PrimaryDisorder.METABOLIC_ALKALOSIS:
+        "{severity} metabolic alkalosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.MIXED_ALKALOSIS:
+        "{severity} metabolic alkalosis with pH {ph:.2f}, HCO3 {hco3:.0f} mEq/L",
+    PrimaryDisorder.MIXED_ALKALEMIA: "{severity} alkalemia with pH {ph:.2f}",
+}
+
+ANION_GAP_STATUS_LABELS = ("Normal", "Elevated", "Low")
+
+SECONDARY_DESCRIPTIONS = MappingProxyType({
+    "Respiratory Alkalosis": "Additional hyperventilation beyond expected compensation",
+    "Respiratory Acidosis": "Inadequate respiratory response or additional CO2 retention",
+    "Metabolic Alkalosis": "Additional bicarbonate elevation beyond compensation",
+    "Metabolic Acidosis": "Additional acid accumulation or bicarbonate loss",
+})
+
+# A-a gradient descriptions by level, formatted with (aa_gradient, expected_aa)
+AA_GRADIENT_TEMPLATES = (
+    "A-a gradient normal at {0:.0f} mmHg",
+    "A-a gradient mildly elevated at {0:.0f} mmHg",
+    "A-a gradient elevated at {0:.0f} mmHg (expected <{1:.0f} for age) - "
+    "suggests V/Q mismatch, shunt, or diffusion impairment",
+)
+
+# General teaching points added from the findings
+TEACHING_APPROACH = "ABG interpretation approach: pH → Primary disorder → Compensation → Anion gap"
+TEACHING_HIGH_AG_ACIDOSIS = (
+    "High anion gap acidosis: think MUDPILES (Methanol, Uremia, DKA, Propylene glycol, "
+    "INH, Lactic acidosis, Ethylene glycol, Salicylates)"
+)
+TEACHING_NORMAL_AG_ACIDOSIS = "Normal anion gap acidosis: think GI losses, RTA, or dilutional"
+TEACHING_ELEVATED_AA_GRADIENT = (
+    "Elevated A-a gradient indicates pulmonary pathology "
+    "(V/Q mismatch, shunt, or diffusion impairment)"
+)
+TEACHING_DELTA_DELTA = "Delta-delta ratio identifies hidden disorders in high AG acidosis"
+
+# Expected-compensation formulas, bound once for _assess_compensation
+_expected_pco2_metabolic_acidosis = AcidBaseEngine.expected_pco2_metabolic_acidosis
+_expected_pco2_metabolic_alkalosis = AcidBaseEngine.expected_pco2_metabolic_alkalosis
+_expected_hco3_respiratory_acidosis_acute = AcidBaseEngine.expected_hco3_respiratory_acidosis_acute
+_expected_hco3_respiratory_acidosis_chronic = AcidBaseEngine.expected_hco3_respiratory_acidosis_chronic
+_expected_hco3_respiratory_alkalosis_acute = AcidBaseEngine.expected_hco3_respiratory_alkalosis_acute
+_expected_hco3_respiratory_alkalosis_chronic = AcidBaseEngine.expected_hco3_respiratory_alkalosis_chronic
+
+# Severity levels in increasing order, indexed by batch severity codes
+SEVERITY_LEVELS = (
+    InterpretationSeverity.NORMAL,
+    InterpretationSeverity.MILD,
+    InterpretationSeverity.MODERATE,
+    InterpretationSeverity.SEVERE,
+    InterpretationSeverity.CRITICAL,
+)
+
+# Severity thresholds used by _determine_severity. Acidemia and pO2 severity
+# increases below each edge (ph < 7.10), alkalemia above each edge (ph > 7.60).
+ACIDEMIA_SEVERITY_BINS = (7.10, 7.20, 7.30, 7.35)
+ALKALEMIA_SEVERITY_BINS = (7.45, 7.50, 7.55, 7.60)
+PO2_SEVERITY_BINS = (40, 50, 60, 80)
+
+# Severity wording for primary disorder descriptions
+ACIDEMIA_DESCRIPTION_BINS = (7.20, 7.30)
+ALKALEMIA_DESCRIPTION_BINS = (7.50, 7.55)
+SEVERITY_WORDS = ("Mild", "Moderate", "Severe")
 
 
 class InterpretationEngine:
@@ -31,6 +177,17 @@ class InterpretationEngine:
     - Teaching points for education
     """
     
+    # Memoize interpret() on the exact result values and conditions. Only pays
+    # off when identical cases repeat (e.g. add_variability=False), so it is
+    # off by default.
+    cache_interpretations: bool = False
+    
+    # Hand out one shared ClinicalInterpretation per distinct interpretation
+    # (see _shared_interpretation). Saves memory on large case banks, where
+    # the rounded descriptions repeat, but the returned objects are
+    # read-only, so it is off by default.
+    share_interpretations: bool = False
+    
     @classmethod
     def interpret(
         cls,
@@ -47,42 +204,100 @@ class InterpretationEngine:
         Returns:
             ClinicalInterpretation with all analysis
         """
+        if cls.cache_interpretations:
+            values = tuple(getattr(result, name) for name in BATCH_VALUE_FIELDS)
+            interpretation = _interpret_values(cls, values, tuple(conditions) if conditions else ())
+            if not cls.share_interpretations:
+                # Copy the lists so callers may modify the result without touching
+                # the cache; the empty-tuple defaults are immutable and kept as is
+                return replace(
+                    interpretation,
+                    clinical_implications=_copy_list(interpretation.clinical_implications),
+                    teaching_points=_copy_list(interpretation.teaching_points),
+                    generating_conditions=_copy_list(interpretation.generating_conditions),
+                )
+        else:
+            interpretation = cls._interpret(result, conditions)
+        
+        if cls.share_interpretations:
+            return _shared_interpretation(_interpretation_key(interpretation))
+        return interpretation
+    
+    @classmethod
+    def _interpret(
+        cls,
+        result: BloodGasResult,
+        conditions: Optional[List[ClinicalCondition]]
+    ) -> ClinicalInterpretation:
+        """Uncached interpret()."""
+        # Every value is read from the result once; the helpers share these
+        # locals and the intermediate results below instead of re-deriving them
+        ph = result.ph
+        pco2 = result.pco2
+        hco3 = result.hco3
+        po2 = result.po2
+        fio2 = result.fio2
+        aa_gradient = result.aa_gradient
+        expected_aa = result.expected_aa_gradient
+        corrected_ag = result.corrected_anion_gap
+        delta_gap = result.delta_gap
+        
+        # A-a gradient: 0 = normal, 1 = mildly elevated, 2 = elevated
+        if aa_gradient > expected_aa + 10:
+            aa_level = 2
+        elif aa_gradient > expected_aa + 5:
+            aa_level = 1
+        else:
+            aa_level = 0
+        
+        # Delta ratio, defined only when both deltas are positive
+        delta_hco3 = 24 - hco3
+        if delta_hco3 > 0 and delta_gap > 0:
+            delta_ratio = delta_gap / delta_hco3
+        else:
+            delta_ratio = None
+        
         # Step 1: Identify primary disorder
-        primary_disorder = cls._identify_primary_disorder(result)
-        primary_desc = cls._describe_primary_disorder(result, primary_disorder)
+        primary_disorder = _identify_primary_disorder(ph, pco2, hco3)
+        primary_desc = _describe_primary_disorder(primary_disorder, ph, pco2, hco3)
         
         # Step 2: Assess compensation
-        compensation_status, compensation_desc, secondary = cls._assess_compensation(
-            result, primary_disorder
+        compensation_status, compensation_desc, secondary = _assess_compensation(
+            primary_disorder, pco2, hco3
         )
         
         # Step 3: Analyze oxygenation
-        oxy_status, oxy_desc = cls._analyze_oxygenation(result)
+        oxy_status, oxy_desc = _analyze_oxygenation(
+            po2, result.sao2, fio2, result.pao2_fio2_ratio, aa_gradient, expected_aa, aa_level
+        )
         
         # Step 4: Analyze anion gap
-        ag_status, ag_desc, delta_delta = cls._analyze_anion_gap(result)
+        ag_status, ag_desc, delta_delta = _analyze_anion_gap(
+            result.anion_gap, corrected_ag, delta_ratio
+        )
         
         # Step 5: Determine overall severity
-        severity = cls._determine_severity(result)
+        severity = _determine_severity(ph, po2, fio2)
         
         # Step 6: Generate clinical implications
-        implications = cls._generate_implications(
-            result, primary_disorder, secondary, conditions
+        implications = _generate_implications(
+            ph, po2, result.lactate, corrected_ag, result.potassium,
+            primary_disorder, secondary, conditions
         )
         
         # Step 7: Gather teaching points
-        teaching_points = cls._gather_teaching_points(
-            result, primary_disorder, conditions
+        teaching_points = _gather_teaching_points(
+            primary_disorder, conditions, corrected_ag, aa_level, delta_gap, delta_ratio
         )
         
         # Create interpretation
         return ClinicalInterpretation(
-            primary_disorder=primary_disorder,
+            primary_disorder=PRIMARY_DISORDER_LABELS[primary_disorder],
             primary_disorder_description=primary_desc,
             compensation_status=compensation_status,
             compensation_description=compensation_desc,
             secondary_disorder=secondary,
-            secondary_disorder_description=cls._describe_secondary(secondary) if secondary else None,
+            secondary_disorder_description=_describe_secondary(secondary) if secondary else None,
             oxygenation_status=oxy_status,
             oxygenation_description=oxy_desc,
             anion_gap_status=ag_status,
@@ -91,428 +306,563 @@ class InterpretationEngine:
             severity=severity,
             clinical_implications=implications,
             teaching_points=teaching_points,
-            generating_conditions=[c.name for c in conditions] if conditions else [],
+            generating_conditions=[c.name for c in conditions] if conditions else (),
         )
     
     @classmethod
-    def _identify_primary_disorder(cls, result: BloodGasResult) -> str:
-        """Identify the primary acid-base disorder."""
-        ph = result.ph
-        pco2 = result.pco2
-        hco3 = result.hco3
-        
-        # Check for normal pH
-        if NORMAL_PH[0] <= ph <= NORMAL_PH[1]:
-            if pco2 < NORMAL_PCO2[0] and hco3 < NORMAL_HCO3[0]:
-                return "Compensated Metabolic Acidosis"
-            elif pco2 > NORMAL_PCO2[1] and hco3 > NORMAL_HCO3[1]:
-                return "Compensated Respiratory Acidosis or Metabolic Alkalosis"
-            else:
-                return "Normal"
-        
-        # Acidemia
-        if ph < NORMAL_PH[0]:
-            if pco2 > NORMAL_PCO2[1] and hco3 <= NORMAL_HCO3[1]:
-                return "Respiratory Acidosis"
-            elif hco3 < NORMAL_HCO3[0] and pco2 <= NORMAL_PCO2[1]:
-                return "Metabolic Acidosis"
-            elif pco2 > NORMAL_PCO2[1] and hco3 < NORMAL_HCO3[0]:
-                return "Mixed Respiratory and Metabolic Acidosis"
-            else:
-                return "Acidemia - Mixed Disorder"
-        
-        # Alkalemia
-        if pco2 < NORMAL_PCO2[0] and hco3 >= NORMAL_HCO3[0]:
-            return "Respiratory Alkalosis"
-        elif hco3 > NORMAL_HCO3[1] and pco2 >= NORMAL_PCO2[0]:
-            return "Metabolic Alkalosis"
-        elif pco2 < NORMAL_PCO2[0] and hco3 > NORMAL_HCO3[1]:
-            return "Mixed Respiratory Alkalosis and Metabolic Alkalosis"
-        else:
-            return "Alkalemia - Mixed Disorder"
-    
-    @classmethod
-    def _describe_primary_disorder(cls, result: BloodGasResult, disorder: str) -> str:
-        """Generate description of the primary disorder."""
-        ph = result.ph
+    def classify(
+        cls,
+        ph: float,
+        pco2: float,
+        hco3: float,
+        po2: float,
+        fio2: float = 0.21
+    ) -> Tuple[PrimaryDisorder, InterpretationSeverity]:
+        """
+        Classify a single blood gas without building any interpretation text.
         
-        if "Normal" in disorder:
-            return f"pH {ph:.2f} is within normal range (7.35-7.45)"
+        Cheap path for bulk generation loops that only need labels.
         
-        if "Acidosis" in disorder or "Acidemia" in disorder:
-            if ph < 7.20:
-                severity_word = "severe"
-            elif ph < 7.30:
-                severity_word = "moderate"
-            else:
-                severity_word = "mild"
-            
-            if "Metabolic" in disorder:
-                return (f"{severity_word.capitalize()} metabolic acidosis with pH {ph:.2f}, "
-                       f"HCO3 {result.hco3:.0f} mEq/L")
-            elif "Respiratory" in disorder:
-                return (f"{severity_word.capitalize()} respiratory acidosis with pH {ph:.2f}, "
-                       f"pCO2 {result.pco2:.0f} mmHg")
-            else:
-                return f"{severity_word.capitalize()} acidemia with pH {ph:.2f}"
+        Args:
+            ph: Arterial pH
+            pco2: pCO2 in mmHg
+            hco3: HCO3 in mEq/L
+            po2: pO2 in mmHg
+            fio2: Fraction of inspired oxygen
         
-        else:  # Alkalosis
-            if ph > 7.55:
-                severity_word = "severe"
-            elif ph > 7.50:
-                severity_word = "moderate"
-            else:
-                severity_word = "mild"
-            
-            if "Metabolic" in disorder:
-                return (f"{severity_word.capitalize()} metabolic alkalosis with pH {ph:.2f}, "
-                       f"HCO3 {result.hco3:.0f} mEq/L")
-            elif "Respiratory" in disorder:
-                return (f"{severity_word.capitalize()} respiratory alkalosis with pH {ph:.2f}, "
-                       f"pCO2 {result.pco2:.0f} mmHg")
-            else:
-                return f"{severity_word.capitalize()} alkalemia with pH {ph:.2f}"
+        Returns:
+            Tuple of (primary disorder, overall severity)
+        """
+        return (
+            _identify_primary_disorder(ph, pco2, hco3),
+            _determine_severity(ph, po2, fio2),
+        )
     
     @classmethod
-    def _assess_compensation(
+    def interpret_batch(
         cls,
-        result: BloodGasResult,
-        primary: str
-    ) -> tuple[str, str, Optional[str]]:
-        """Assess compensation status and identify any secondary disorder."""
-        ph = result.ph
-        pco2 = result.pco2
-        hco3 = result.hco3
+        results: Union[Sequence[BloodGasResult], BloodGasBatch]
+    ) -> Dict[str, Any]:
+        """
+        Classify a batch of blood gases in one vectorized pass.
         
-        secondary = None
+        Mirrors the primary disorder, severity and anion gap logic of
+        interpret() without building the per-case text.
         
-        if "Normal" in primary:
-            return ("N/A", "No disorder to compensate", None)
+        Args:
+            results: A BloodGasBatch or a sequence of BloodGasResult
         
-        if "Metabolic Acidosis" in primary:
-            expected = AcidBaseEngine.expected_pco2_metabolic_acidosis(hco3)
-            
-            if pco2 < expected[0]:
-                status = "Excessive"
-                desc = (f"pCO2 {pco2:.0f} is lower than expected ({expected[0]:.0f}-{expected[1]:.0f}), "
-                       "suggesting concurrent respiratory alkalosis")
-                secondary = "Respiratory Alkalosis"
-            elif pco2 > expected[1]:
-                status = "Inadequate"
-                desc = (f"pCO2 {pco2:.0f} is higher than expected ({expected[0]:.0f}-{expected[1]:.0f}), "
-                       "suggesting concurrent respiratory acidosis or impaired compensation")
-                secondary = "Respiratory Acidosis"
-            else:
-                status = "Appropriate"
-                desc = f"pCO2 {pco2:.0f} is appropriate for the degree of acidosis (Winter's formula)"
+        Returns:
+            Dict of NumPy arrays keyed by "primary_disorder", "severity",
+            "anion_gap_status" and "delta_ratio" (NaN where undefined)
+        """
+        np = require_numpy()
         
-        elif "Metabolic Alkalosis" in primary:
-            expected = AcidBaseEngine.expected_pco2_metabolic_alkalosis(hco3)
-            
-            if pco2 > expected[1]:
-                status = "Excessive"
-                desc = (f"pCO2 {pco2:.0f} is higher than expected, "
-                       "suggesting concurrent respiratory acidosis")
-                secondary = "Respiratory Acidosis"
-            elif pco2 < expected[0]:
-                status = "Inadequate"
-                desc = (f"pCO2 {pco2:.0f} is lower than expected, "
-                       "suggesting concurrent respiratory alkalosis")
-                secondary = "Respiratory Alkalosis"
-            else:
-                status = "Appropriate"
-                desc = f"pCO2 {pco2:.0f} shows appropriate hypoventilatory compensation"
+        if isinstance(results, BloodGasBatch):
+            def column(name):
+                return np.asarray(getattr(results, name), dtype=np.float64)
+        else:
+            def column(name):
+                return np.fromiter(
+                    (getattr(r, name) for r in results), dtype=np.float64, count=len(results)
+                )
+        
+        ph = column("ph")
+        pco2 = column("pco2")
+        hco3 = column("hco3")
+        po2 = column("po2")
+        fio2 = column("fio2")
+        corrected_ag = column("corrected_anion_gap")
+        delta_gap = column("delta_gap")
+        
+        # Primary disorder from the low/normal/high state of each value
+        def state(values, limits):
+            return np.where(values < limits[0], 0, np.where(values > limits[1], 2, 1))
+        
+        primary = np.take(
+            np.array(PRIMARY_DISORDER_LUT),
+            9 * state(ph, NORMAL_PH) + 3 * state(pco2, NORMAL_PCO2) + state(hco3, NORMAL_HCO3),
+        )
         
-        elif "Respiratory Acidosis" in primary:
-            # Assume acute unless HCO3 very elevated
-            if hco3 > 30:
-                expected = AcidBaseEngine.expected_hco3_respiratory_acidosis_chronic(pco2)
-                duration = "chronic"
-            else:
-                expected = AcidBaseEngine.expected_hco3_respiratory_acidosis_acute(pco2)
-                duration = "acute"
-            
-            if hco3 > expected[1]:
-                status = "Excessive"
-                desc = (f"HCO3 {hco3:.0f} is higher than expected for {duration} respiratory acidosis, "
-                       "suggesting concurrent metabolic alkalosis")
-                secondary = "Metabolic Alkalosis"
-            elif hco3 < expected[0]:
-                status = "Inadequate"
-                desc = (f"HCO3 {hco3:.0f} is lower than expected, "
-                       "suggesting concurrent metabolic acidosis")
-                secondary = "Metabolic Acidosis"
-            else:
-                status = "Appropriate"
-                desc = f"HCO3 {hco3:.0f} is appropriate for {duration} respiratory acidosis"
+        # Severity: worst of the pH and pO2 levels, as in _determine_severity
+        ph_level = np.maximum(
+            4 - np.searchsorted(ACIDEMIA_SEVERITY_BINS, ph, side="right"),
+            np.searchsorted(ALKALEMIA_SEVERITY_BINS, ph, side="left"),
+        )
+        po2_level = 4 - np.searchsorted(PO2_SEVERITY_BINS, po2, side="right")
+        # pO2 < 40 is only critical on room air
+        po2_level = np.where((po2_level == 4) & (fio2 != 0.21), 3, po2_level)
+        severity = np.maximum(ph_level, po2_level)
         
-        elif "Respiratory Alkalosis" in primary:
-            if hco3 < 18:
-                expected = AcidBaseEngine.expected_hco3_respiratory_alkalosis_chronic(pco2)
-                duration = "chronic"
-            else:
-                expected = AcidBaseEngine.expected_hco3_respiratory_alkalosis_acute(pco2)
-                duration = "acute"
-            
-            if hco3 < expected[0]:
-                status = "Excessive"
-                desc = (f"HCO3 {hco3:.0f} is lower than expected, "
-                       "suggesting concurrent metabolic acidosis")
-                secondary = "Metabolic Acidosis"
-            elif hco3 > expected[1]:
-                status = "Inadequate"
-                desc = (f"HCO3 {hco3:.0f} is higher than expected, "
-                       "suggesting concurrent metabolic alkalosis")
-                secondary = "Metabolic Alkalosis"
-            else:
-                status = "Appropriate"
-                desc = f"HCO3 {hco3:.0f} is appropriate for {duration} respiratory alkalosis"
+        # Anion gap status and delta ratio, as in _analyze_anion_gap
+        ag_status = np.select([corrected_ag > 14, corrected_ag < 6], [1, 2], default=0)
+        delta_hco3 = 24 - hco3
+        delta_ratio = np.divide(
+            delta_gap,
+            delta_hco3,
+            out=np.full_like(delta_gap, np.nan),
+            where=(delta_hco3 > 0) & (delta_gap > 0),
+        )
         
+        return {
+            "primary_disorder": np.take(np.array(PRIMARY_DISORDER_LABELS, dtype=object), primary),
+            "severity": np.take(np.array(SEVERITY_LEVELS, dtype=object), severity),
+            "anion_gap_status": np.take(np.array(ANION_GAP_STATUS_LABELS, dtype=object), ag_status),
+            "delta_ratio": delta_ratio,
+        }
+
+
+def _identify_primary_disorder(
+    ph: float,
+    pco2: float,
+    hco3: float
+) -> PrimaryDisorder:
+    """Identify the primary acid-base disorder."""
+    return PRIMARY_DISORDER_LUT[
+        9 * _tristate(ph, NORMAL_PH)
+        + 3 * _tristate(pco2, NORMAL_PCO2)
+        + _tristate(hco3, NORMAL_HCO3)
+    ]
+
+
+def _classify_primary_disorder(
+    ph: float,
+    pco2: float,
+    hco3: float
+) -> PrimaryDisorder:
+    """Branching classifier that PRIMARY_DISORDER_LUT is built from."""
+    # Check for normal pH
+    if NORMAL_PH[0] <= ph <= NORMAL_PH[1]:
+        if pco2 < NORMAL_PCO2[0] and hco3 < NORMAL_HCO3[0]:
+            return PrimaryDisorder.COMPENSATED_METABOLIC_ACIDOSIS
+        elif pco2 > NORMAL_PCO2[1] and hco3 > NORMAL_HCO3[1]:
+            return PrimaryDisorder.COMPENSATED_RESPIRATORY_ACIDOSIS_OR_METABOLIC_ALKALOSIS
         else:
-            status = "Mixed"
-            desc = "Mixed disorder - compensation assessment complex"
-        
-        return (status, desc, secondary)
+            return PrimaryDisorder.NORMAL
     
-    @classmethod
-    def _describe_secondary(cls, secondary: str) -> str:
-        """Describe the secondary disorder."""
-        descriptions = {
-            "Respiratory Alkalosis": "Additional hyperventilation beyond expected compensation",
-            "Respiratory Acidosis": "Inadequate respiratory response or additional CO2 retention",
-            "Metabolic Alkalosis": "Additional bicarbonate elevation beyond compensation",
-            "Metabolic Acidosis": "Additional acid accumulation or bicarbonate loss",
-        }
-        return descriptions.get(secondary, "Additional acid-base disturbance")
+    # Acidemia
+    if ph < NORMAL_PH[0]:
+        if pco2 > NORMAL_PCO2[1] and hco3 <= NORMAL_HCO3[1]:
+            return PrimaryDisorder.RESPIRATORY_ACIDOSIS
+        elif hco3 < NORMAL_HCO3[0] and pco2 <= NORMAL_PCO2[1]:
+            return PrimaryDisorder.METABOLIC_ACIDOSIS
+        elif pco2 > NORMAL_PCO2[1] and hco3 < NORMAL_HCO3[0]:
+            return PrimaryDisorder.MIXED_ACIDOSIS
+        else:
+            return PrimaryDisorder.MIXED_ACIDEMIA
     
-    @classmethod
-    def _analyze_oxygenation(cls, result: BloodGasResult) -> tuple[str, str]:
-        """Analyze oxygenation status."""
-        po2 = result.po2
-        sao2 = result.sao2
-        pf_ratio = result.pao2_fio2_ratio
-        aa_gradient = result.aa_gradient
-        expected_aa = result.expected_aa_gradient
-        fio2 = result.fio2
-        
-        descriptions = []
-        
-        # PaO2 assessment
-        if fio2 == 0.21:  # Room air
-            if po2 >= 80:
-                status = "Normal"
-            elif po2 >= 60:
-                status = "Mild hypoxemia"
-            elif po2 >= 40:
-                status = "Moderate hypoxemia"
-            else:
-                status = "Severe hypoxemia"
+    # Alkalemia
+    if pco2 < NORMAL_PCO2[0] and hco3 >= NORMAL_HCO3[0]:
+        return PrimaryDisorder.RESPIRATORY_ALKALOSIS
+    elif hco3 > NORMAL_HCO3[1] and pco2 >= NORMAL_PCO2[0]:
+        return PrimaryDisorder.METABOLIC_ALKALOSIS
+    elif pco2 < NORMAL_PCO2[0] and hco3 > NORMAL_HCO3[1]:
+        return PrimaryDisorder.MIXED_ALKALOSIS
+    else:
+        return PrimaryDisorder.MIXED_ALKALEMIA
+
+
+def _describe_primary_disorder(
+    disorder: PrimaryDisorder,
+    ph: float,
+    pco2: float,
+    hco3: float
+) -> str:
+    """Generate description of the primary disorder."""
+    if disorder is PrimaryDisorder.NORMAL:
+        return f"pH {ph:.2f} is within normal range (7.35-7.45)"
+    
+    if disorder in ACIDEMIC_DISORDERS:
+        level = 2 - bisect_right(ACIDEMIA_DESCRIPTION_BINS, ph)
+    else:  # Alkalosis
+        level = bisect_left(ALKALEMIA_DESCRIPTION_BINS, ph)
+    
+    return PRIMARY_DESCRIPTION_TEMPLATES[disorder].format(
+        severity=SEVERITY_WORDS[level], ph=ph, pco2=pco2, hco3=hco3
+    )
+
+
+def _assess_compensation(
+    primary: PrimaryDisorder,
+    pco2: float,
+    hco3: float
+) -> tuple[str, str, Optional[str]]:
+    """Assess compensation status and identify any secondary disorder."""
+    secondary = None
+    
+    if primary is PrimaryDisorder.NORMAL:
+        return ("N/A", "No disorder to compensate", None)
+    
+    target = COMPENSATION_TARGETS.get(primary)
+    
+    if target is Disorder.METABOLIC_ACIDOSIS:
+        expected = _expected_pco2_metabolic_acidosis(hco3)
+        
+        if pco2 < expected[0]:
+            status = "Excessive"
+            desc = (f"pCO2 {pco2:.0f} is lower than expected ({expected[0]:.0f}-{expected[1]:.0f}), "
+                   "suggesting concurrent respiratory alkalosis")
+            secondary = "Respiratory Alkalosis"
+        elif pco2 > expected[1]:
+            status = "Inadequate"
+            desc = (f"pCO2 {pco2:.0f} is higher than expected ({expected[0]:.0f}-{expected[1]:.0f}), "
+                   "suggesting concurrent respiratory acidosis or impaired compensation")
+            secondary = "Respiratory Acidosis"
         else:
-            # On supplemental O2
-            status = f"On {fio2:.0%} O2"
-            if pf_ratio < 100:
-                status = f"Severe hypoxemia ({status})"
-            elif pf_ratio < 200:
-                status = f"Moderate hypoxemia ({status})"
-            elif pf_ratio < 300:
-                status = f"Mild hypoxemia ({status})"
-        
-        descriptions.append(f"PaO2 {po2:.0f} mmHg, SaO2 {sao2:.0f}%")
-        
-        # A-a gradient
-        if aa_gradient > expected_aa + 10:
-            descriptions.append(
-                f"A-a gradient elevated at {aa_gradient:.0f} mmHg "
-                f"(expected <{expected_aa:.0f} for age) - "
-                "suggests V/Q mismatch, shunt, or diffusion impairment"
-            )
-        elif aa_gradient > expected_aa + 5:
-            descriptions.append(
-                f"A-a gradient mildly elevated at {aa_gradient:.0f} mmHg"
-            )
+            status = "Appropriate"
+            desc = f"pCO2 {pco2:.0f} is appropriate for the degree of acidosis (Winter's formula)"
+    
+    elif target is Disorder.METABOLIC_ALKALOSIS:
+        expected = _expected_pco2_metabolic_alkalosis(hco3)
+        
+        if pco2 > expected[1]:
+            status = "Excessive"
+            desc = (f"pCO2 {pco2:.0f} is higher than expected, "
+                   "suggesting concurrent respiratory acidosis")
+            secondary = "Respiratory Acidosis"
+        elif pco2 < expected[0]:
+            status = "Inadequate"
+            desc = (f"pCO2 {pco2:.0f} is lower than expected, "
+                   "suggesting concurrent respiratory alkalosis")
+            secondary = "Respiratory Alkalosis"
         else:
-            descriptions.append(
-                f"A-a gradient normal at {aa_gradient:.0f} mmHg"
-            )
-        
-        # P/F ratio if on oxygen
-        if fio2 > 0.21:
-            ards_class = OxygenationEngine.classify_ards(pf_ratio)
-            descriptions.append(f"P/F ratio {pf_ratio:.0f} ({ards_class})")
-        
-        return (status, "; ".join(descriptions))
+            status = "Appropriate"
+            desc = f"pCO2 {pco2:.0f} shows appropriate hypoventilatory compensation"
     
-    @classmethod
-    def _analyze_anion_gap(cls, result: BloodGasResult) -> tuple[str, str, Optional[str]]:
-        """Analyze anion gap and delta-delta."""
-        ag = result.anion_gap
-        corrected_ag = result.corrected_anion_gap
-        delta_gap = result.delta_gap
-        hco3 = result.hco3
-        
-        # Calculate delta ratio
-        delta_hco3 = 24 - hco3
-        if delta_hco3 > 0 and delta_gap > 0:
-            delta_ratio = delta_gap / delta_hco3
+    elif target is Disorder.RESPIRATORY_ACIDOSIS:
+        # Assume acute unless HCO3 very elevated
+        if hco3 > 30:
+            expected = _expected_hco3_respiratory_acidosis_chronic(pco2)
+            duration = "chronic"
         else:
-            delta_ratio = None
-        
-        # Status
-        if corrected_ag > 14:
-            status = "Elevated"
-        elif corrected_ag < 6:
-            status = "Low"
+            expected = _expected_hco3_respiratory_acidosis_acute(pco2)
+            duration = "acute"
+        
+        if hco3 > expected[1]:
+            status = "Excessive"
+            desc = (f"HCO3 {hco3:.0f} is higher than expected for {duration} respiratory acidosis, "
+                   "suggesting concurrent metabolic alkalosis")
+            secondary = "Metabolic Alkalosis"
+        elif hco3 < expected[0]:
+            status = "Inadequate"
+            desc = (f"HCO3 {hco3:.0f} is lower than expected, "
+                   "suggesting concurrent metabolic acidosis")
+            secondary = "Metabolic Acidosis"
+        else:
+            status = "Appropriate"
+            desc = f"HCO3 {hco3:.0f} is appropriate for {duration} respiratory acidosis"
+    
+    elif target is Disorder.RESPIRATORY_ALKALOSIS:
+        if hco3 < 18:
+            expected = _expected_hco3_respiratory_alkalosis_chronic(pco2)
+            duration = "chronic"
+        else:
+            expected = _expected_hco3_respiratory_alkalosis_acute(pco2)
+            duration = "acute"
+        
+        if hco3 < expected[0]:
+            status = "Excessive"
+            desc = (f"HCO3 {hco3:.0f} is lower than expected, "
+                   "suggesting concurrent metabolic acidosis")
+            secondary = "Metabolic Acidosis"
+        elif hco3 > expected[1]:
+            status = "Inadequate"
+            desc = (f"HCO3 {hco3:.0f} is higher than expected, "
+                   "suggesting concurrent metabolic alkalosis")
+            secondary = "Metabolic Alkalosis"
         else:
+            status = "Appropriate"
+            desc = f"HCO3 {hco3:.0f} is appropriate for {duration} respiratory alkalosis"
+    
+    else:
+        status = "Mixed"
+        desc = "Mixed disorder - compensation assessment complex"
+    
+    return (status, desc, secondary)
+
+
+def _describe_secondary(secondary: str) -> str:
+    """Describe the secondary disorder."""
+    return SECONDARY_DESCRIPTIONS.get(secondary, "Additional acid-base disturbance")
+
+
+def _analyze_oxygenation(
+    po2: float,
+    sao2: float,
+    fio2: float,
+    pf_ratio: float,
+    aa_gradient: float,
+    expected_aa: float,
+    aa_level: int
+) -> tuple[str, str]:
+    """Analyze oxygenation status; aa_level is the A-a gradient level (0-2)."""
+    # PaO2 assessment
+    if fio2 == 0.21:  # Room air
+        if po2 >= 80:
             status = "Normal"
-        
-        # Description
-        if status == "Elevated":
-            desc = (f"Anion gap elevated at {ag:.0f} mEq/L "
-                   f"(corrected: {corrected_ag:.0f}) - "
-                   "indicates accumulation of unmeasured anions")
-            
-            # Delta-delta analysis
-            if delta_ratio is not None:
-                if delta_ratio < 1:
-                    delta_desc = (
-                        f"Delta ratio {delta_ratio:.1f} (<1) suggests concurrent "
-                        "non-anion gap metabolic acidosis"
-                    )
-                elif delta_ratio > 2:
-                    delta_desc = (
-                        f"Delta ratio {delta_ratio:.1f} (>2) suggests concurrent "
-                        "metabolic alkalosis or pre-existing elevated HCO3"
-                    )
-                else:
-                    delta_desc = f"Delta ratio {delta_ratio:.1f} (1-2) consistent with pure HAGMA"
+        elif po2 >= 60:
+            status = "Mild hypoxemia"
+        elif po2 >= 40:
+            status = "Moderate hypoxemia"
+        else:
+            status = "Severe hypoxemia"
+    else:
+        # On supplemental O2
+        status = f"On {fio2:.0%} O2"
+        if pf_ratio < 100:
+            status = f"Severe hypoxemia ({status})"
+        elif pf_ratio < 200:
+            status = f"Moderate hypoxemia ({status})"
+        elif pf_ratio < 300:
+            status = f"Mild hypoxemia ({status})"
+    
+    description = (
+        f"PaO2 {po2:.0f} mmHg, SaO2 {sao2:.0f}%; "
+        + AA_GRADIENT_TEMPLATES[aa_level].format(aa_gradient, expected_aa)
+    )
+    
+    # P/F ratio if on oxygen
+    if fio2 > 0.21:
+        ards_class = OxygenationEngine.classify_ards(pf_ratio)
+        description += f"; P/F ratio {pf_ratio:.0f} ({ards_class})"
+    
+    return (status, description)
+
+
+def _analyze_anion_gap(
+    ag: float,
+    corrected_ag: float,
+    delta_ratio: Optional[float]
+) -> tuple[str, str, Optional[str]]:
+    """Analyze anion gap and delta-delta."""
+    # Status
+    if corrected_ag > 14:
+        status = "Elevated"
+    elif corrected_ag < 6:
+        status = "Low"
+    else:
+        status = "Normal"
+    
+    # Description
+    if status == "Elevated":
+        desc = (f"Anion gap elevated at {ag:.0f} mEq/L "
+               f"(corrected: {corrected_ag:.0f}) - "
+               "indicates accumulation of unmeasured anions")
+        
+        # Delta-delta analysis
+        if delta_ratio is not None:
+            if delta_ratio < 1:
+                delta_desc = (
+                    f"Delta ratio {delta_ratio:.1f} (<1) suggests concurrent "
+                    "non-anion gap metabolic acidosis"
+                )
+            elif delta_ratio > 2:
+                delta_desc = (
+                    f"Delta ratio {delta_ratio:.1f} (>2) suggests concurrent "
+                    "metabolic alkalosis or pre-existing elevated HCO3"
+                )
             else:
-                delta_desc = None
-        elif status == "Low":
-            desc = (f"Anion gap low at {ag:.0f} mEq/L - "
-                   "consider hypoalbuminemia, paraproteinemia")
-            delta_desc = None
+                delta_desc = f"Delta ratio {delta_ratio:.1f} (1-2) consistent with pure HAGMA"
         else:
-            desc = f"Anion gap normal at {ag:.0f} mEq/L"
             delta_desc = None
-        
-        return (status, desc, delta_desc)
+    elif status == "Low":
+        desc = (f"Anion gap low at {ag:.0f} mEq/L - "
+               "consider hypoalbuminemia, paraproteinemia")
+        delta_desc = None
+    else:
+        desc = f"Anion gap normal at {ag:.0f} mEq/L"
+        delta_desc = None
     
-    @classmethod
-    def _determine_severity(cls, result: BloodGasResult) -> InterpretationSeverity:
-        """Determine overall severity of the blood gas abnormality."""
-        ph = result.ph
-        po2 = result.po2
-        
-        # Critical values
-        if ph < 7.10 or ph > 7.60:
-            return InterpretationSeverity.CRITICAL
-        if po2 < 40 and result.fio2 == 0.21:
-            return InterpretationSeverity.CRITICAL
-        
-        # Severe
-        if ph < 7.20 or ph > 7.55:
-            return InterpretationSeverity.SEVERE
-        if po2 < 50:
-            return InterpretationSeverity.SEVERE
-        
-        # Moderate
-        if ph < 7.30 or ph > 7.50:
-            return InterpretationSeverity.MODERATE
-        if po2 < 60:
-            return InterpretationSeverity.MODERATE
-        
-        # Mild
-        if ph < 7.35 or ph > 7.45:
-            return InterpretationSeverity.MILD
-        if po2 < 80:
-            return InterpretationSeverity.MILD
-        
-        return InterpretationSeverity.NORMAL
+    return (status, desc, delta_desc)
+
+
+def _determine_severity(ph: float, po2: float, fio2: float) -> InterpretationSeverity:
+    """Determine overall severity of the blood gas abnormality."""
+    # Levels 0-4 (normal to critical); the worse of pH and pO2 wins
+    ph_level = max(
+        4 - bisect_right(ACIDEMIA_SEVERITY_BINS, ph),
+        bisect_left(ALKALEMIA_SEVERITY_BINS, ph),
+    )
+    po2_level = 4 - bisect_right(PO2_SEVERITY_BINS, po2)
+    if po2_level == 4 and fio2 != 0.21:
+        po2_level = 3  # pO2 < 40 is only critical on room air
     
-    @classmethod
-    def _generate_implications(
-        cls,
-        result: BloodGasResult,
-        primary: str,
-        secondary: Optional[str],
-        conditions: Optional[List[ClinicalCondition]]
-    ) -> List[str]:
-        """Generate clinical implications."""
-        implications = []
-        
-        # pH-based implications
-        if result.ph < 7.20:
-            implications.append("Severe acidemia may cause cardiac dysfunction, vasodilation")
-        elif result.ph > 7.55:
-            implications.append("Severe alkalemia may cause arrhythmias, seizures")
-        
-        # Hypoxemia implications
-        if result.po2 < 60:
-            implications.append("Significant hypoxemia - tissue oxygen delivery compromised")
-        
-        # Lactate implications
-        if result.lactate > 4:
-            implications.append("Elevated lactate suggests tissue hypoperfusion")
-        
-        # Anion gap implications
-        if result.corrected_anion_gap > 20:
-            implications.append("High anion gap - investigate for ketoacidosis, lactic acidosis, toxins, renal failure")
-        
-        # Potassium implications
-        if result.potassium > 6.0:
-            implications.append("Hyperkalemia - cardiac monitoring required")
-        elif result.potassium < 3.0:
-            implications.append("Severe hypokalemia - risk of arrhythmias")
-        
-        # Mixed disorder implications
-        if secondary:
-            implications.append(f"Mixed disorder ({primary} + {secondary}) - more complex management required")
-        
-        # Condition-specific implications
-        if conditions:
-            for condition in conditions:
-                effect = get_condition_effect(condition)
-                if effect.compensation_blocked:
-                    implications.append(
-                        "Respiratory compensation impaired - monitor for rapid pH deterioration"
-                    )
-                    break
-        
-        return implications
+    return SEVERITY_LEVELS[max(ph_level, po2_level)]
+
+
+def _generate_implications(
+    ph: float,
+    po2: float,
+    lactate: float,
+    corrected_ag: float,
+    potassium: float,
+    primary: PrimaryDisorder,
+    secondary: Optional[str],
+    conditions: Optional[List[ClinicalCondition]]
+) -> List[str]:
+    """Generate clinical implications."""
+    implications = []
     
-    @classmethod
-    def _gather_teaching_points(
-        cls,
-        result: BloodGasResult,
-        primary: str,
-        conditions: Optional[List[ClinicalCondition]]
-    ) -> List[str]:
-        """Gather teaching points for educational purposes."""
-        points = []
-        
-        # Basic interpretation approach
-        points.append("ABG interpretation approach: pH → Primary disorder → Compensation → Anion gap")
-        
-        # Condition-specific teaching points
-        if conditions:
-            for condition in conditions:
-                effect = get_condition_effect(condition)
-                points.extend(effect.teaching_points)
-        
-        # General teaching based on findings
-        if "Metabolic Acidosis" in primary:
-            if result.corrected_anion_gap > 14:
-                points.append("High anion gap acidosis: think MUDPILES (Methanol, Uremia, DKA, Propylene glycol, INH, Lactic acidosis, Ethylene glycol, Salicylates)")
-            else:
-                points.append("Normal anion gap acidosis: think GI losses, RTA, or dilutional")
-        
-        if result.aa_gradient > result.expected_aa_gradient + 10:
-            points.append("Elevated A-a gradient indicates pulmonary pathology (V/Q mismatch, shunt, or diffusion impairment)")
-        
-        if result.delta_gap > 6 and 24 - result.hco3 > 0:
-            delta_ratio = result.delta_gap / (24 - result.hco3)
-            if delta_ratio < 1 or delta_ratio > 2:
-                points.append("Delta-delta ratio identifies hidden disorders in high AG acidosis")
-        
-        return points
+    # pH-based implications
+    if ph < 7.20:
+        implications.append("Severe acidemia may cause cardiac dysfunction, vasodilation")
+    elif ph > 7.55:
+        implications.append("Severe alkalemia may cause arrhythmias, seizures")
+    
+    # Hypoxemia implications
+    if po2 < 60:
+        implications.append("Significant hypoxemia - tissue oxygen delivery compromised")
+    
+    # Lactate implications
+    if lactate > 4:
+        implications.append("Elevated lactate suggests tissue hypoperfusion")
+    
+    # Anion gap implications
+    if corrected_ag > 20:
+        implications.append("High anion gap - investigate for ketoacidosis, lactic acidosis, toxins, renal failure")
+    
+    # Potassium implications
+    if potassium > 6.0:
+        implications.append("Hyperkalemia - cardiac monitoring required")
+    elif potassium < 3.0:
+        implications.append("Severe hypokalemia - risk of arrhythmias")
+    
+    # Mixed disorder implications
+    if secondary:
+        implications.append(f"Mixed disorder ({PRIMARY_DISORDER_LABELS[primary]} + {secondary}) - more complex management required")
+    
+    # Condition-specific implications
+    if conditions and not COMPENSATION_BLOCKING_CONDITIONS.isdisjoint(conditions):
+        implications.append(
+            "Respiratory compensation impaired - monitor for rapid pH deterioration"
+        )
+    
+    return implications
+
+
+def _gather_teaching_points(
+    primary: PrimaryDisorder,
+    conditions: Optional[List[ClinicalCondition]],
+    corrected_ag: float,
+    aa_level: int,
+    delta_gap: float,
+    delta_ratio: Optional[float]
+) -> List[str]:
+    """Gather teaching points for educational purposes."""
+    # Basic interpretation approach
+    points = [TEACHING_APPROACH]
+    
+    # Condition-specific teaching points
+    if conditions:
+        for condition in conditions:
+            effect = get_condition_effect(condition)
+            points.extend(effect.teaching_points)
+    
+    # General teaching based on findings
+    if COMPENSATION_TARGETS.get(primary) is Disorder.METABOLIC_ACIDOSIS:
+        if corrected_ag > 14:
+            points.append(TEACHING_HIGH_AG_ACIDOSIS)
+        else:
+            points.append(TEACHING_NORMAL_AG_ACIDOSIS)
+    
+    if aa_level == 2:
+        points.append(TEACHING_ELEVATED_AA_GRADIENT)
+    
+    if delta_ratio is not None and delta_gap > 6:
+        if delta_ratio < 1 or delta_ratio > 2:
+            points.append(TEACHING_DELTA_DELTA)
+    
+    return points
+
+
+def _tristate(value: float, limits: Tuple[float, float]) -> int:
+    """0 below, 1 within (inclusive) or 2 above a (low, high) range."""
+    if value < limits[0]:
+        return 0
+    if value > limits[1]:
+        return 2
+    return 1
+
+
+def _build_primary_disorder_lut() -> Tuple[PrimaryDisorder, ...]:
+    """Run the branching classifier once for every low/normal/high combination."""
+    def representatives(limits):
+        low, high = limits
+        return (low - 1, (low + high) / 2, high + 1)
+    
+    return tuple(
+        _classify_primary_disorder(ph, pco2, hco3)
+        for ph in representatives(NORMAL_PH)
+        for pco2 in representatives(NORMAL_PCO2)
+        for hco3 in representatives(NORMAL_HCO3)
+    )
+
+
+# Primary disorder indexed by 9 * pH state + 3 * pCO2 state + HCO3 state
+PRIMARY_DISORDER_LUT = _build_primary_disorder_lut()
+
+
+def _copy_list(value: Sequence[str]) -> Sequence[str]:
+    """Copy a list field; tuples are returned unchanged."""
+    return list(value) if isinstance(value, list) else value
+
+
+@lru_cache(maxsize=4096)
+def _interpret_values(
+    engine: type,
+    values: Tuple[float, ...],
+    conditions: Tuple[ClinicalCondition, ...]
+) -> ClinicalInterpretation:
+    """
+    Memoized InterpretationEngine._interpret keyed on a result's value fields.
+    
+    The result is rebuilt from BATCH_VALUE_FIELDS alone, which is only valid
+    while _interpret reads nothing else (e.g. not generation_params).
+    """
+    result = BloodGasResult(**dict(zip(BATCH_VALUE_FIELDS, values)))
+    return engine._interpret(result, list(conditions))
+
+
+# Reads the ClinicalInterpretation constructor fields, in order
+_get_interpretation_fields = attrgetter(*INTERPRETATION_FIELDS)
+
+
+def _interpretation_key(interpretation: ClinicalInterpretation) -> tuple:
+    """Hashable snapshot of an interpretation's fields, with lists as tuples."""
+    return tuple(
+        tuple(value) if isinstance(value, list) else value
+        for value in _get_interpretation_fields(interpretation)
+    )
+
+
+class _SharedInterpretation(ClinicalInterpretation):
+    """
+    Read-only ClinicalInterpretation handed out by the flyweight pool.
+    
+    Assigning a field raises FrozenInstanceError once the instance is built,
+    and the list fields are tuples, so an edit can't leak into the other
+    cases sharing the instance. add_teaching_points() returns a plain,
+    editable copy; dataclasses.replace() keeps the class, so its copies are
+    read-only too. Private caches such as the to_text() string are still
+    written.
+    """
+    __slots__ = ("_sealed",)
+    
+    def __post_init__(self):
+        super().__post_init__()
+        object.__setattr__(self, "_sealed", True)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name[0] != "_" and getattr(self, "_sealed", False):
+            raise FrozenInstanceError(f"cannot assign to field {name!r} of a shared interpretation")
+        object.__setattr__(self, name, value)
+    
+    def __reduce__(self):
+        # Unpickle through the pool rather than restoring the sealed slots
+        return _shared_interpretation, (_interpretation_key(self),)
+
 
+@lru_cache(maxsize=4096)
+def _shared_interpretation(key: tuple) -> ClinicalInterpretation:
+    """Flyweight pool: one read-only interpretation per distinct field snapshot."""
+    return _SharedInterpretation(*key)
@@ -8,7 +8,7 @@ from bloodgas.models.disorders import (
     ClinicalCondition,
     ChronicCondition,
 )
-from bloodgas.models.blood_gas_result import BloodGasResult, ClinicalInterpretation
+from bloodgas.models.blood_gas_result import BloodGasBatch, BloodGasResult, ClinicalInterpretation
 from bloodgas.models.patient_state import PatientFactors
 
 __all__ = [
@@ -19,6 +19,7 @@ __all__ = [
     "ClinicalCondition",
     "ChronicCondition",
     "BloodGasResult",
+    "BloodGasBatch",
     "ClinicalInterpretation",
     "PatientFactors",
 ]
@@ -1,9 +1,13 @@
 """Blood gas result dataclasses."""
 
-from dataclasses import dataclass, field, asdict
-from typing import List, Optional, Dict, Any
+import sys
+from dataclasses import dataclass, field, fields
+from typing import List, Optional, Dict, Any, Sequence, Union
 from enum import Enum
-import json
+from operator import attrgetter
+
+from bloodgas import _json
+from bloodgas.models.disorders import ChronicCondition, ClinicalCondition, Compensation, Disorder
 
 
 class InterpretationSeverity(Enum):
@@ -15,7 +19,41 @@ class InterpretationSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+# Severity members by their serialized value, for from_dict
+SEVERITY_BY_VALUE = {member.value: member for member in InterpretationSeverity}
+
+
+# to_text() sections, formatted against the interpretation itself
+_TEXT_PRIMARY = (
+    "PRIMARY DISORDER: {0.primary_disorder}\n"
+    "  {0.primary_disorder_description}\n"
+    "\nCOMPENSATION: {0.compensation_status}\n"
+    "  {0.compensation_description}"
+)
+_TEXT_SECONDARY = (
+    "\n\nSECONDARY DISORDER: {0.secondary_disorder}\n"
+    "  {0.secondary_disorder_description}"
+)
+_TEXT_OXYGENATION = "\n\nOXYGENATION: {0.oxygenation_status}\n  {0.oxygenation_description}"
+_TEXT_ANION_GAP = "\n\nANION GAP: {0.anion_gap_status}\n  {0.anion_gap_description}"
+_TEXT_DELTA_DELTA = "\n  Delta-delta: {0.delta_delta_analysis}"
+_TEXT_BULLET = "\n  • "
+_get_text_fields = attrgetter(
+    "primary_disorder",
+    "primary_disorder_description",
+    "compensation_status",
+    "compensation_description",
+    "secondary_disorder",
+    "secondary_disorder_description",
+    "oxygenation_status",
+    "oxygenation_description",
+    "anion_gap_status",
+    "anion_gap_description",
+    "delta_delta_analysis",
+)
+
+
+@dataclass(slots=True)
 class ClinicalInterpretation:
     """Clinical interpretation of blood gas results."""
     
@@ -44,83 +82,154 @@ class ClinicalInterpretation:
     severity: InterpretationSeverity = InterpretationSeverity.NORMAL
     
     # Clinical implications
-    clinical_implications: List[str] = field(default_factory=list)
+    clinical_implications: Sequence[str] = ()
     
     # Teaching points for education
-    teaching_points: List[str] = field(default_factory=list)
+    teaching_points: Sequence[str] = ()
     
     # Conditions that generated this result
-    generating_conditions: List[str] = field(default_factory=list)
+    generating_conditions: Sequence[str] = ()
+    
+    # (severity, severity.value) for to_dict()
+    _severity_value: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    
+    # (field snapshot, text) cache for to_text()
+    _text: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        # Status fields come from a small fixed vocabulary; interning them
+        # lets results loaded in bulk share one string per label
+        intern = sys.intern
+        self.primary_disorder = intern(self.primary_disorder)
+        self.compensation_status = intern(self.compensation_status)
+        if self.secondary_disorder is not None:
+            self.secondary_disorder = intern(self.secondary_disorder)
+        self.oxygenation_status = intern(self.oxygenation_status)
+        self.anion_gap_status = intern(self.anion_gap_status)
+        # Enum .value goes through a descriptor; keep the string alongside its member
+        self._severity_value = (self.severity, self.severity.value)
+    
+    def add_teaching_points(self, *points: str) -> "ClinicalInterpretation":
+        """
+        Return a copy with teaching points appended.
+        
+        The interpretation itself is left unchanged, so this is safe on
+        instances shared between cases (InterpretationEngine.share_interpretations).
+        The copy is always a plain, editable ClinicalInterpretation with list
+        fields, even when self is a read-only shared instance.
+        """
+        values = {name: getattr(self, name) for name in INTERPRETATION_FIELDS}
+        values["clinical_implications"] = list(self.clinical_implications)
+        values["teaching_points"] = [*self.teaching_points, *points]
+        values["generating_conditions"] = list(self.generating_conditions)
+        return ClinicalInterpretation(**values)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        result = asdict(self)
-        result['severity'] = self.severity.value
-        return result
+        severity, severity_value = self._severity_value
+        if severity is not self.severity:
+            severity_value = self.severity.value
+        return {
+            "primary_disorder": self.primary_disorder,
+            "primary_disorder_description": self.primary_disorder_description,
+            "compensation_status": self.compensation_status,
+            "compensation_description": self.compensation_description,
+            "secondary_disorder": self.secondary_disorder,
+            "secondary_disorder_description": self.secondary_disorder_description,
+            "oxygenation_status": self.oxygenation_status,
+            "oxygenation_description": self.oxygenation_description,
+            "anion_gap_status": self.anion_gap_status,
+            "anion_gap_description": self.anion_gap_description,
+            "delta_delta_analysis": self.delta_delta_analysis,
+            "severity": severity_value,
+            "clinical_implications": list(self.clinical_implications),
+            "teaching_points": list(self.teaching_points),
+            "generating_conditions": list(self.generating_conditions),
+        }
     
     def to_text(self) -> str:
-        """Generate human-readable interpretation text."""
-        lines = []
+        """
+        Generate human-readable interpretation text.
         
-        # Primary disorder
-        lines.append(f"PRIMARY DISORDER: {self.primary_disorder}")
-        lines.append(f"  {self.primary_disorder_description}")
-        
-        # Compensation
-        lines.append(f"\nCOMPENSATION: {self.compensation_status}")
-        lines.append(f"  {self.compensation_description}")
+        The text is cached on the instance and rebuilt only when a field
+        has changed since the last call.
+        """
+        key = (
+            *_get_text_fields(self),
+            tuple(self.clinical_implications),
+            tuple(self.teaching_points),
+        )
+        cached = self._text
+        if cached is None or cached[0] != key:
+            cached = (key, self._build_text())
+            self._text = cached
+        return cached[1]
+    
+    def _build_text(self) -> str:
+        """Uncached to_text()."""
+        parts = [_TEXT_PRIMARY.format(self)]
         
         # Secondary disorder if present
         if self.secondary_disorder:
-            lines.append(f"\nSECONDARY DISORDER: {self.secondary_disorder}")
-            lines.append(f"  {self.secondary_disorder_description}")
+            parts.append(_TEXT_SECONDARY.format(self))
         
         # Oxygenation
         if self.oxygenation_status != "normal":
-            lines.append(f"\nOXYGENATION: {self.oxygenation_status}")
-            lines.append(f"  {self.oxygenation_description}")
+            parts.append(_TEXT_OXYGENATION.format(self))
         
         # Anion gap
         if self.anion_gap_status != "normal":
-            lines.append(f"\nANION GAP: {self.anion_gap_status}")
-            lines.append(f"  {self.anion_gap_description}")
+            parts.append(_TEXT_ANION_GAP.format(self))
             if self.delta_delta_analysis:
-                lines.append(f"  Delta-delta: {self.delta_delta_analysis}")
+                parts.append(_TEXT_DELTA_DELTA.format(self))
         
         # Clinical implications
         if self.clinical_implications:
-            lines.append("\nCLINICAL IMPLICATIONS:")
-            for impl in self.clinical_implications:
-                lines.append(f"  • {impl}")
+            parts.append("\n\nCLINICAL IMPLICATIONS:")
+            parts.extend(_TEXT_BULLET + impl for impl in self.clinical_implications)
         
         # Teaching points
         if self.teaching_points:
-            lines.append("\nTEACHING POINTS:")
-            for point in self.teaching_points:
-                lines.append(f"  • {point}")
+            parts.append("\n\nTEACHING POINTS:")
+            parts.extend(_TEXT_BULLET + point for point in self.teaching_points)
         
-        return "\n".join(lines)
+        return "".join(parts)
 
 
-@dataclass
+# Constructor arguments of ClinicalInterpretation, in order
+INTERPRETATION_FIELDS = tuple(f.name for f in fields(ClinicalInterpretation) if f.init)
+
+
+def _enum_name(value: Any) -> Any:
+    """Return an enum member's name, passing other values (e.g. names) through."""
+    return value.name if isinstance(value, Enum) else value
+
+
+@dataclass(slots=True)
 class GenerationParams:
-    """Parameters used to generate the blood gas result."""
+    """
+    Parameters used to generate the blood gas result.
+    
+    Disorder, condition and severity fields hold the enum members the
+    generator was called with (or their names, when loaded via
+    from_dict). Names are only extracted when serializing.
+    """
     
     # Generation mode
     mode: str  # "disorder" or "scenario"
     
     # Disorder-based params
-    primary_disorder: Optional[str] = None
-    secondary_disorder: Optional[str] = None
-    specified_compensation: Optional[str] = None
+    primary_disorder: Optional[Union[Disorder, str]] = None
+    secondary_disorder: Optional[Union[Disorder, str]] = None
+    specified_compensation: Optional[Union[Compensation, str]] = None
     
     # Scenario-based params
-    conditions: List[str] = field(default_factory=list)
-    condition_severities: Dict[str, str] = field(default_factory=dict)
+    conditions: Sequence[Union[ClinicalCondition, str]] = ()
+    condition_severities: Dict[Any, Any] = field(default_factory=dict)
     
     # Patient factors
     patient_age: Optional[int] = None
-    chronic_conditions: List[str] = field(default_factory=list)
+    chronic_conditions: Sequence[Union[ChronicCondition, str]] = ()
     
     # Environment
     fio2: float = 0.21
@@ -129,12 +238,116 @@ class GenerationParams:
     # Random seed for reproducibility
     seed: Optional[int] = None
     
+    @property
+    def condition_names(self) -> List[str]:
+        """Names of the clinical conditions."""
+        return [_enum_name(c) for c in self.conditions]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {
+            "mode": self.mode,
+            "primary_disorder": _enum_name(self.primary_disorder),
+            "secondary_disorder": _enum_name(self.secondary_disorder),
+            "specified_compensation": _enum_name(self.specified_compensation),
+            "conditions": self.condition_names,
+            "condition_severities": {
+                _enum_name(c): _enum_name(s) for c, s in self.condition_severities.items()
+            },
+            "patient_age": self.patient_age,
+            "chronic_conditions": [_enum_name(c) for c in self.chronic_conditions],
+            "fio2": self.fio2,
+            "altitude_meters": self.altitude_meters,
+            "seed": self.seed,
+        }
 
 
-@dataclass
+# Reporting precision (decimal places) of each BloodGasResult value, in to_dict order
+VALUE_PRECISION = (
+    # Core ABG
+    ("ph", 3),
+    ("pco2", 1),
+    ("po2", 1),
+    ("hco3", 1),
+    ("base_excess", 1),
+    ("sao2", 1),
+    
+    # Oxygenation
+    ("fio2", 2),
+    ("pao2_fio2_ratio", 0),
+    ("aa_gradient", 1),
+    ("expected_aa_gradient", 1),
+    
+    # Electrolytes
+    ("sodium", 0),
+    ("potassium", 1),
+    ("chloride", 0),
+    ("glucose", 0),
+    
+    # Calculated
+    ("anion_gap", 1),
+    ("corrected_anion_gap", 1),
+    ("delta_gap", 1),
+    ("lactate", 1),
+    ("hemoglobin", 1),
+    ("albumin", 1),
+)
+_VALUE_NAMES = tuple(name for name, _ in VALUE_PRECISION)
+_get_values = attrgetter(*_VALUE_NAMES)
+
+
+def _build_round_values(precision):
+    """
+    Compile a function mapping a tuple of values to their rounded dict.
+    
+    Like the dataclass-generated methods, the source is built once from the
+    precision table, so the dict is a single fixed-shape literal with the
+    names and decimal places inlined instead of zipped per call.
+    """
+    names = [name for name, _ in precision]
+    items = ", ".join(f"{name!r}: round({name}, {decimals})" for name, decimals in precision)
+    source = (
+        "def round_values(values):\n"
+        f"    {', '.join(names)} = values\n"
+        f"    return {{{items}}}\n"
+    )
+    namespace = {}
+    exec(source, {"round": round}, namespace)
+    return namespace["round_values"]
+
+
+_round_values = _build_round_values(VALUE_PRECISION)
+
+# summary() layout, formatted against the result itself
+_SUMMARY_TEMPLATE = "\n".join([
+    "═" * 50,
+    "ARTERIAL BLOOD GAS RESULTS",
+    "═" * 50,
+    "  pH:     {0.ph:.2f}     (7.35-7.45)",
+    "  pCO2:   {0.pco2:.0f} mmHg  (35-45)",
+    "  pO2:    {0.po2:.0f} mmHg  (80-100)",
+    "  HCO3:   {0.hco3:.0f} mEq/L (22-26)",
+    "  BE:     {0.base_excess:+.0f} mEq/L (-2 to +2)",
+    "  SaO2:   {0.sao2:.0f}%     (95-100%)",
+    "─" * 50,
+    "  FiO2:   {0.fio2:.0%}",
+    "  P/F:    {0.pao2_fio2_ratio:.0f}    (>400 normal)",
+    "  A-a:    {0.aa_gradient:.0f} mmHg (expected: {0.expected_aa_gradient:.0f})",
+    "─" * 50,
+    "  Na:     {0.sodium:.0f} mEq/L",
+    "  K:      {0.potassium:.1f} mEq/L",
+    "  Cl:     {0.chloride:.0f} mEq/L",
+    "  Glucose:{0.glucose:.0f} mg/dL",
+    "  Lactate:{0.lactate:.1f} mmol/L",
+    "─" * 50,
+    "  AG:     {0.anion_gap:.0f} mEq/L (8-12)",
+    "  AG(corr):{0.corrected_anion_gap:.0f} mEq/L",
+    "  Delta:  {0.delta_gap:.1f}",
+    "═" * 50,
+])
+
+
+@dataclass(slots=True)
 class BloodGasResult:
     """Complete blood gas result with all parameters and interpretation."""
     
@@ -172,58 +385,69 @@ class BloodGasResult:
     interpretation: ClinicalInterpretation = None
     generation_params: GenerationParams = None
     
+    # (raw values, rounded dict) cache for rounded_values()
+    _rounded: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # (raw values, text) cache for summary()
+    _summary: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Placeholder (interpretation, generation_params) filled in by __post_init__
+    _placeholders: tuple = field(default=(None, None), init=False, repr=False, compare=False)
+    
     def __post_init__(self):
         """Ensure interpretation exists."""
+        placeholder_interpretation = placeholder_params = None
         if self.interpretation is None:
-            self.interpretation = ClinicalInterpretation(
+            self.interpretation = placeholder_interpretation = ClinicalInterpretation(
                 primary_disorder="Unknown",
                 primary_disorder_description="Not interpreted",
                 compensation_status="Unknown",
                 compensation_description="Not assessed"
             )
         if self.generation_params is None:
-            self.generation_params = GenerationParams(mode="unknown")
+            self.generation_params = placeholder_params = GenerationParams(mode="unknown")
+        self._placeholders = (placeholder_interpretation, placeholder_params)
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        result = {
-            # Core ABG
-            "ph": round(self.ph, 3),
-            "pco2": round(self.pco2, 1),
-            "po2": round(self.po2, 1),
-            "hco3": round(self.hco3, 1),
-            "base_excess": round(self.base_excess, 1),
-            "sao2": round(self.sao2, 1),
-            
-            # Oxygenation
-            "fio2": round(self.fio2, 2),
-            "pao2_fio2_ratio": round(self.pao2_fio2_ratio, 0),
-            "aa_gradient": round(self.aa_gradient, 1),
-            "expected_aa_gradient": round(self.expected_aa_gradient, 1),
-            
-            # Electrolytes
-            "sodium": round(self.sodium, 0),
-            "potassium": round(self.potassium, 1),
-            "chloride": round(self.chloride, 0),
-            "glucose": round(self.glucose, 0),
-            
-            # Calculated
-            "anion_gap": round(self.anion_gap, 1),
-            "corrected_anion_gap": round(self.corrected_anion_gap, 1),
-            "delta_gap": round(self.delta_gap, 1),
-            "lactate": round(self.lactate, 1),
-            "hemoglobin": round(self.hemoglobin, 1),
-            "albumin": round(self.albumin, 1),
-            
-            # Metadata
-            "interpretation": self.interpretation.to_dict() if self.interpretation else None,
-            "generation_params": self.generation_params.to_dict() if self.generation_params else None,
-        }
+        """
+        Convert to dictionary for JSON serialization.
+        
+        Placeholder interpretation / generation params (never set by the
+        caller) are emitted as None; from_dict restores them.
+        """
+        result = self.rounded_values()
+        placeholder_interpretation, placeholder_params = self._placeholders
+        
+        # Metadata
+        interpretation = self.interpretation
+        result["interpretation"] = (
+            interpretation.to_dict()
+            if interpretation and interpretation is not placeholder_interpretation
+            else None
+        )
+        params = self.generation_params
+        result["generation_params"] = (
+            params.to_dict() if params and params is not placeholder_params else None
+        )
         return result
     
+    def rounded_values(self) -> Dict[str, float]:
+        """
+        Value fields rounded to their reporting precision (VALUE_PRECISION).
+        
+        The rounded values are cached on the instance and recomputed only
+        when a field has changed since the last call.
+        """
+        values = _get_values(self)
+        cached = self._rounded
+        if cached is None or cached[0] != values:
+            cached = (values, _round_values(values))
+            self._rounded = cached
+        return dict(cached[1])
+    
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string."""
-        return json.dumps(self.to_dict(), indent=indent)
+        return _json.dumps(self.to_dict(), indent=indent)
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BloodGasResult":
@@ -236,7 +460,10 @@ class BloodGasResult:
         interpretation = None
         if interp_data:
             severity_str = interp_data.pop("severity", "normal")
-            interp_data["severity"] = InterpretationSeverity(severity_str)
+            severity = SEVERITY_BY_VALUE.get(severity_str)
+            if severity is None:
+                severity = InterpretationSeverity(severity_str)  # raises ValueError
+            interp_data["severity"] = severity
             interpretation = ClinicalInterpretation(**interp_data)
         
         # Create generation params if present
@@ -251,32 +478,88 @@ class BloodGasResult:
         )
     
     def summary(self) -> str:
-        """Generate a concise summary of the blood gas."""
-        lines = [
-            "═" * 50,
-            "ARTERIAL BLOOD GAS RESULTS",
-            "═" * 50,
-            f"  pH:     {self.ph:.2f}     (7.35-7.45)",
-            f"  pCO2:   {self.pco2:.0f} mmHg  (35-45)",
-            f"  pO2:    {self.po2:.0f} mmHg  (80-100)",
-            f"  HCO3:   {self.hco3:.0f} mEq/L (22-26)",
-            f"  BE:     {self.base_excess:+.0f} mEq/L (-2 to +2)",
-            f"  SaO2:   {self.sao2:.0f}%     (95-100%)",
-            "─" * 50,
-            f"  FiO2:   {self.fio2:.0%}",
-            f"  P/F:    {self.pao2_fio2_ratio:.0f}    (>400 normal)",
-            f"  A-a:    {self.aa_gradient:.0f} mmHg (expected: {self.expected_aa_gradient:.0f})",
-            "─" * 50,
-            f"  Na:     {self.sodium:.0f} mEq/L",
-            f"  K:      {self.potassium:.1f} mEq/L",
-            f"  Cl:     {self.chloride:.0f} mEq/L",
-            f"  Glucose:{self.glucose:.0f} mg/dL",
-            f"  Lactate:{self.lactate:.1f} mmol/L",
-            "─" * 50,
-            f"  AG:     {self.anion_gap:.0f} mEq/L (8-12)",
-            f"  AG(corr):{self.corrected_anion_gap:.0f} mEq/L",
-            f"  Delta:  {self.delta_gap:.1f}",
-            "═" * 50,
+        """
+        Generate a concise summary of the blood gas.
+        
+        Cached like rounded_values(), keyed on the raw values.
+        """
+        values = _get_values(self)
+        cached = self._summary
+        if cached is None or cached[0] != values:
+            cached = (values, _SUMMARY_TEMPLATE.format(self))
+            self._summary = cached
+        return cached[1]
+
+
+@dataclass
+class BloodGasBatch:
+    """
+    Struct-of-arrays container for a batch of generated blood gases.
+    
+    Each value field holds a NumPy array with one entry per case, in the
+    same units as the matching BloodGasResult field. Produced by
+    generate_blood_gas_batch(); cases are not interpreted.
+    """
+    
+    # Core ABG values
+    ph: Any
+    pco2: Any
+    po2: Any
+    hco3: Any
+    base_excess: Any
+    sao2: Any
+    
+    # Oxygenation parameters
+    fio2: Any
+    pao2_fio2_ratio: Any
+    aa_gradient: Any
+    expected_aa_gradient: Any
+    
+    # Electrolytes
+    sodium: Any
+    potassium: Any
+    chloride: Any
+    glucose: Any
+    
+    # Calculated values
+    anion_gap: Any
+    corrected_anion_gap: Any
+    delta_gap: Any
+    lactate: Any
+    hemoglobin: Any
+    albumin: Any
+    
+    # Metadata shared by every case in the batch
+    generation_params: GenerationParams = None
+    
+    def __len__(self) -> int:
+        return len(self.ph)
+    
+    def result(self, index: int) -> BloodGasResult:
+        """Build a BloodGasResult for a single case of the batch."""
+        return BloodGasResult(
+            **{name: float(getattr(self, name)[index]) for name in BATCH_VALUE_FIELDS},
+            generation_params=self.generation_params,
+        )
+    
+    def results(self) -> List[BloodGasResult]:
+        """
+        Build a BloodGasResult for every case of the batch.
+        
+        Each array is converted to Python floats with a single tolist()
+        call and the results are constructed positionally, which skips the
+        per-case keyword dict that result() builds.
+        """
+        # BATCH_VALUE_FIELDS are the leading BloodGasResult fields, in order
+        columns = [getattr(self, name).tolist() for name in BATCH_VALUE_FIELDS]
+        generation_params = self.generation_params
+        return [
+            BloodGasResult(*values, generation_params=generation_params)
+            for values in zip(*columns)
         ]
-        return "\n".join(lines)
 
+
+# Names of the per-case array fields of BloodGasBatch
+BATCH_VALUE_FIELDS = tuple(
+    f.name for f in fields(BloodGasBatch) if f.name != "generation_params"
+)
@@ -1,11 +1,30 @@
 """Disorder and condition type definitions."""
 
-from enum import Enum, auto
-from typing import Dict, List, Optional
+from enum import Enum, IntEnum, auto
+from typing import Dict, Optional
 from dataclasses import dataclass
 
 
-class Disorder(Enum):
+class _IndexEnum(IntEnum):
+    """
+    Int-valued enum whose members hash as ints and can index arrays directly.
+    
+    Keeps Enum's "Class.MEMBER" str() and format() on every supported
+    Python version. IntEnum switched str() to the bare number in 3.11, and
+    on 3.10 Enum.__format__ defers to int formatting for int mixins, so
+    format() goes through str() explicitly.
+    
+    Being ints, members of different enums with the same value compare and
+    hash equal (Severity.MILD == Disorder.NORMAL), so no dict or set may mix
+    keys from more than one of these enums.
+    """
+    __str__ = Enum.__str__
+    
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+class Disorder(_IndexEnum):
     """Primary acid-base disorder types."""
     NORMAL = auto()
     METABOLIC_ACIDOSIS = auto()
@@ -14,14 +33,14 @@ class Disorder(Enum):
     RESPIRATORY_ALKALOSIS = auto()
 
 
-class Severity(Enum):
+class Severity(_IndexEnum):
     """Severity levels for disorders and conditions."""
     MILD = auto()      # pH 7.30-7.35 or 7.45-7.50
     MODERATE = auto()  # pH 7.20-7.30 or 7.50-7.55
     SEVERE = auto()    # pH < 7.20 or > 7.55
 
 
-class Compensation(Enum):
+class Compensation(_IndexEnum):
     """Compensation status for acid-base disorders."""
     NONE = auto()           # Acute, no compensation yet
     PARTIAL = auto()        # Some compensation present
@@ -29,14 +48,14 @@ class Compensation(Enum):
     EXCESSIVE = auto()      # More compensation than expected (mixed disorder)
 
 
-class Duration(Enum):
+class Duration(_IndexEnum):
     """Duration of condition affecting compensation."""
     ACUTE = auto()      # Hours - minimal renal/respiratory compensation
     SUBACUTE = auto()   # Days - partial compensation
     CHRONIC = auto()    # Weeks+ - full compensation achieved
 
 
-class ClinicalCondition(Enum):
+class ClinicalCondition(_IndexEnum):
     """Clinical conditions that drive blood gas abnormalities."""
     # Respiratory conditions
     COPD_EXACERBATION = auto()
@@ -85,7 +104,7 @@ class ClinicalCondition(Enum):
     HIGH_ALTITUDE = auto()
 
 
-class ChronicCondition(Enum):
+class ChronicCondition(_IndexEnum):
     """Chronic conditions that modify baseline physiology."""
     TYPE1_DIABETES = auto()
     TYPE2_DIABETES = auto()
@@ -97,7 +116,7 @@ class ChronicCondition(Enum):
     ANEMIA_CHRONIC = auto()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False, repr=False)
 class ConditionEffect:
     """
     Defines the physiological effects of a clinical condition.
@@ -142,9 +161,12 @@ class ConditionEffect:
     
     # Description for interpretation
     description: str = ""
-    teaching_points: List[str] = None
+    teaching_points: tuple[str, ...] = None
     
     def __post_init__(self):
-        if self.teaching_points is None:
-            self.teaching_points = []
+        # Stored as a tuple so the shared definitions can't be mutated by callers
+        object.__setattr__(self, "teaching_points", tuple(self.teaching_points or ()))
+    
+    def __repr__(self) -> str:
+        return f"ConditionEffect({self.primary_disorder.name})"
 
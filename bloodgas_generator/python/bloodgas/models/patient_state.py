@@ -1,22 +1,50 @@
 """Patient state and factors modeling."""
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Any
+from typing import Tuple, Optional, Dict, Any
 from bloodgas.models.disorders import ChronicCondition
 
 
-@dataclass
+# Chronic conditions that shift the respiratory / metabolic baseline
+RESPIRATORY_BASELINE_CONDITIONS = frozenset({
+    ChronicCondition.COPD,
+    ChronicCondition.OBESITY_HYPOVENTILATION,
+})
+METABOLIC_BASELINE_CONDITIONS = frozenset({ChronicCondition.CHRONIC_KIDNEY_DISEASE})
+
+# Baseline lookup tables indexed by bit-packed condition flags (see the
+# _compute_baseline_* methods). Where conditions overlap, the higher bit
+# wins, e.g. pregnancy overrides the chronic conditions.
+
+# (pregnant << 2) | (obesity hypoventilation << 1) | COPD
+BASELINE_PCO2_TABLE = (40.0, 45.0, 48.0, 48.0, 32.0, 32.0, 32.0, 32.0)
+
+# (pregnant << 2) | (COPD << 1) | CKD
+BASELINE_HCO3_TABLE = (24.0, 20.0, 28.0, 28.0, 20.0, 20.0, 20.0, 20.0)
+
+# (pregnant << 2) | (chronic anemia << 1) | CKD
+BASELINE_HEMOGLOBIN_TABLE = (14.0, 10.5, 9.0, 9.0, 11.5, 11.5, 11.5, 11.5)
+
+# (cirrhosis << 1) | CKD
+BASELINE_ALBUMIN_TABLE = (4.0, 3.2, 2.5, 2.5)
+
+
+@dataclass(frozen=True, slots=True)
 class PatientFactors:
     """
     Patient characteristics that modify baseline physiology
     and expected normal ranges.
+    
+    Instances are immutable: baselines are derived once at construction
+    and reused for every case generated for the patient. Use
+    dataclasses.replace() to derive a modified patient.
     """
     
     # Demographics
     age: int = 40
     
-    # Chronic conditions that affect baseline
-    chronic_conditions: List[ChronicCondition] = field(default_factory=list)
+    # Chronic conditions that affect baseline (any iterable; stored as a tuple)
+    chronic_conditions: Tuple[ChronicCondition, ...] = ()
     
     # Baseline values (if known, otherwise calculated from age/conditions)
     baseline_hemoglobin: Optional[float] = None  # g/dL
@@ -31,13 +59,41 @@ class PatientFactors:
     is_pregnant: bool = False  # Chronic respiratory alkalosis
     is_mechanically_ventilated: bool = False
     
+    # Derived values, computed once in __post_init__
+    _chronic_set: frozenset = field(init=False, repr=False, compare=False)
+    _baseline_pco2: float = field(init=False, repr=False, compare=False)
+    _baseline_hco3: float = field(init=False, repr=False, compare=False)
+    _baseline_hemoglobin: float = field(init=False, repr=False, compare=False)
+    _baseline_albumin: float = field(init=False, repr=False, compare=False)
+    _expected_aa_gradient: float = field(init=False, repr=False, compare=False)
+    _expected_pao2: float = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        """Normalize chronic conditions and precompute baselines."""
+        object.__setattr__(self, "chronic_conditions", tuple(self.chronic_conditions))
+        object.__setattr__(self, "_chronic_set", frozenset(self.chronic_conditions))
+        object.__setattr__(self, "_baseline_pco2", self._compute_baseline_pco2())
+        object.__setattr__(self, "_baseline_hco3", self._compute_baseline_hco3())
+        object.__setattr__(self, "_baseline_hemoglobin", self._compute_baseline_hemoglobin())
+        object.__setattr__(self, "_baseline_albumin", self._compute_baseline_albumin())
+        object.__setattr__(self, "_expected_aa_gradient", self._compute_expected_aa_gradient())
+        object.__setattr__(self, "_expected_pao2", self._compute_expected_pao2())
+    
     def get_expected_aa_gradient(self) -> float:
+        """Get age-adjusted expected A-a gradient."""
+        return self._expected_aa_gradient
+    
+    def _compute_expected_aa_gradient(self) -> float:
         """Calculate age-adjusted expected A-a gradient."""
         # Formula: Expected A-a = (Age / 4) + 4
         # Normal range approximately: 2.5 + 0.21 × age
         return (self.age / 4) + 4
     
     def get_expected_pao2(self) -> float:
+        """Get age- and altitude-adjusted expected PaO2 on room air."""
+        return self._expected_pao2
+    
+    def _compute_expected_pao2(self) -> float:
         """Calculate age-adjusted expected PaO2 on room air at sea level."""
         # Formula: Expected PaO2 = 109 - (0.43 × age)
         # Another common formula: 100 - (age/4)
@@ -51,83 +107,81 @@ class PatientFactors:
     
     def get_baseline_pco2(self) -> float:
         """Get baseline pCO2 considering chronic conditions."""
-        baseline = 40.0
-        
-        # COPD patients may have chronic CO2 retention
-        if ChronicCondition.COPD in self.chronic_conditions:
-            baseline = 45.0  # Chronic retainers
-        
-        # Obesity hypoventilation
-        if ChronicCondition.OBESITY_HYPOVENTILATION in self.chronic_conditions:
-            baseline = 48.0
-        
-        # Pregnancy causes chronic hyperventilation
-        if self.is_pregnant:
-            baseline = 32.0
-        
-        return baseline
+        return self._baseline_pco2
     
     def get_baseline_hco3(self) -> float:
         """Get baseline HCO3 considering chronic conditions."""
-        baseline = 24.0
-        
-        # CKD patients often have chronic metabolic acidosis
-        if ChronicCondition.CHRONIC_KIDNEY_DISEASE in self.chronic_conditions:
-            baseline = 20.0
-        
-        # COPD with chronic respiratory acidosis has compensatory elevated HCO3
-        if ChronicCondition.COPD in self.chronic_conditions:
-            baseline = 28.0
-        
-        # Pregnancy has compensatory lowered HCO3
-        if self.is_pregnant:
-            baseline = 20.0
-        
-        return baseline
+        return self._baseline_hco3
     
     def get_baseline_hemoglobin(self) -> float:
+        """Get baseline hemoglobin."""
+        return self._baseline_hemoglobin
+    
+    def get_baseline_albumin(self) -> float:
+        """Get baseline albumin."""
+        return self._baseline_albumin
+    
+    def _compute_baseline_pco2(self) -> float:
+        """Get baseline pCO2 considering chronic conditions."""
+        # COPD: chronic retainers; obesity hypoventilation; pregnancy:
+        # chronic hyperventilation
+        chronic = self._chronic_set
+        index = (
+            (self.is_pregnant << 2)
+            | ((ChronicCondition.OBESITY_HYPOVENTILATION in chronic) << 1)
+            | (ChronicCondition.COPD in chronic)
+        )
+        return BASELINE_PCO2_TABLE[index]
+    
+    def _compute_baseline_hco3(self) -> float:
+        """Get baseline HCO3 considering chronic conditions."""
+        # CKD: chronic metabolic acidosis; COPD: compensatory elevated HCO3;
+        # pregnancy: compensatory lowered HCO3
+        chronic = self._chronic_set
+        index = (
+            (self.is_pregnant << 2)
+            | ((ChronicCondition.COPD in chronic) << 1)
+            | (ChronicCondition.CHRONIC_KIDNEY_DISEASE in chronic)
+        )
+        return BASELINE_HCO3_TABLE[index]
+    
+    def _compute_baseline_hemoglobin(self) -> float:
         """Get baseline hemoglobin."""
         if self.baseline_hemoglobin is not None:
             return self.baseline_hemoglobin
         
-        baseline = 14.0  # Default adult
-        
-        if ChronicCondition.ANEMIA_CHRONIC in self.chronic_conditions:
-            baseline = 9.0
-        elif ChronicCondition.CHRONIC_KIDNEY_DISEASE in self.chronic_conditions:
-            baseline = 10.5  # Anemia of CKD
-        
-        if self.is_pregnant:
-            baseline = 11.5  # Physiological anemia of pregnancy
-        
-        return baseline
+        # Chronic anemia; anemia of CKD; physiological anemia of pregnancy
+        chronic = self._chronic_set
+        index = (
+            (self.is_pregnant << 2)
+            | ((ChronicCondition.ANEMIA_CHRONIC in chronic) << 1)
+            | (ChronicCondition.CHRONIC_KIDNEY_DISEASE in chronic)
+        )
+        return BASELINE_HEMOGLOBIN_TABLE[index]
     
-    def get_baseline_albumin(self) -> float:
+    def _compute_baseline_albumin(self) -> float:
         """Get baseline albumin."""
         if self.baseline_albumin is not None:
             return self.baseline_albumin
         
-        baseline = 4.0
-        
-        if ChronicCondition.CIRRHOSIS in self.chronic_conditions:
-            baseline = 2.5
-        elif ChronicCondition.CHRONIC_KIDNEY_DISEASE in self.chronic_conditions:
-            baseline = 3.2
-        
-        return baseline
+        chronic = self._chronic_set
+        index = (
+            ((ChronicCondition.CIRRHOSIS in chronic) << 1)
+            | (ChronicCondition.CHRONIC_KIDNEY_DISEASE in chronic)
+        )
+        return BASELINE_ALBUMIN_TABLE[index]
     
     def has_respiratory_baseline_abnormality(self) -> bool:
         """Check if patient has chronic respiratory baseline changes."""
         return (
-            ChronicCondition.COPD in self.chronic_conditions or
-            ChronicCondition.OBESITY_HYPOVENTILATION in self.chronic_conditions or
+            not self._chronic_set.isdisjoint(RESPIRATORY_BASELINE_CONDITIONS) or
             self.is_pregnant
         )
     
     def has_metabolic_baseline_abnormality(self) -> bool:
         """Check if patient has chronic metabolic baseline changes."""
         return (
-            ChronicCondition.CHRONIC_KIDNEY_DISEASE in self.chronic_conditions or
+            not self._chronic_set.isdisjoint(METABOLIC_BASELINE_CONDITIONS) or
             self.is_pregnant
         )
     
@@ -1,9 +1,15 @@
 """Physiological calculation modules."""
 
-from bloodgas.physiology.acid_base import AcidBaseEngine
-from bloodgas.physiology.oxygenation import OxygenationEngine
-from bloodgas.physiology.electrolytes import ElectrolyteEngine
-from bloodgas.physiology.variability import VariabilityEngine
+from importlib import import_module
+
+# Engines are imported on first access (PEP 562) so that importing one
+# physiology module does not load the others
+_ENGINE_MODULES = {
+    "AcidBaseEngine": "bloodgas.physiology.acid_base",
+    "OxygenationEngine": "bloodgas.physiology.oxygenation",
+    "ElectrolyteEngine": "bloodgas.physiology.electrolytes",
+    "VariabilityEngine": "bloodgas.physiology.variability",
+}
 
 __all__ = [
     "AcidBaseEngine",
@@ -12,3 +18,15 @@ __all__ = [
     "VariabilityEngine",
 ]
 
+
+def __getattr__(name):
+    module_name = _ENGINE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    engine = getattr(import_module(module_name), name)
+    globals()[name] = engine
+    return engine
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -7,18 +7,220 @@ for generating physiologically accurate acid-base values.
 
 import math
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Iterator, Mapping, Tuple, Optional
+from bloodgas._numpy import require_numpy
 from bloodgas.models.disorders import Disorder, Severity, Compensation, Duration
 
 
+# Enum members used by the scalar hot paths, bound as module globals:
+# loading a member from its Enum class costs several times a global lookup
+_NORMAL = Disorder.NORMAL
+_METABOLIC_ACIDOSIS = Disorder.METABOLIC_ACIDOSIS
+_METABOLIC_ALKALOSIS = Disorder.METABOLIC_ALKALOSIS
+_RESPIRATORY_ACIDOSIS = Disorder.RESPIRATORY_ACIDOSIS
+_RESPIRATORY_ALKALOSIS = Disorder.RESPIRATORY_ALKALOSIS
+_ACUTE = Duration.ACUTE
+_SUBACUTE = Duration.SUBACUTE
+_CHRONIC = Duration.CHRONIC
+_NO_COMPENSATION = Compensation.NONE
+_PARTIAL = Compensation.PARTIAL
+_APPROPRIATE = Compensation.APPROPRIATE
+_EXCESSIVE = Compensation.EXCESSIVE
+
+
 # Normal ranges
 NORMAL_PH = (7.35, 7.45)
 NORMAL_PCO2 = (35.0, 45.0)
 NORMAL_HCO3 = (22.0, 26.0)
 NORMAL_BE = (-2.0, 2.0)
 
+# Henderson-Hasselbalch constants
+PK = 6.1  # pKa of carbonic acid
+CO2_SOLUBILITY = 0.03  # mmol/L per mmHg
+
+# 10^x is evaluated as exp(x × ln 10): one libm call instead of float pow
+LN10 = math.log(10)
+
+# Base excess slope (2.3 × Hb + 7.7) at the default hemoglobin of 15 g/dL
+DEFAULT_BE_SLOPE = 2.3 * 15.0 + 7.7
+
+
+# Henderson-Hasselbalch kernels. Plain functions over module constants, so
+# the generation paths below call them without classmethod dispatch or
+# class attribute lookups; the AcidBaseEngine methods wrap them.
+
+def _ph(hco3: float, pco2: float) -> float:
+    """pH = 6.1 + log10([HCO3] / (0.03 × pCO2))"""
+    if pco2 <= 0 or hco3 <= 0:
+        raise ValueError("pCO2 and HCO3 must be positive")
+    return PK + math.log10(hco3 / (CO2_SOLUBILITY * pco2))
+
+
+def _hco3(ph: float, pco2: float) -> float:
+    """[HCO3] = 0.03 × pCO2 × 10^(pH - 6.1)"""
+    return CO2_SOLUBILITY * pco2 * math.exp((ph - PK) * LN10)
+
+
+def _pco2(ph: float, hco3: float) -> float:
+    """pCO2 = [HCO3] / (0.03 × 10^(pH - 6.1))"""
+    return hco3 / (CO2_SOLUBILITY * math.exp((ph - PK) * LN10))
+
+
+def _base_excess(ph: float, hco3: float, hemoglobin: Optional[float] = None) -> float:
+    """BE = HCO3 - 24.4 + (2.3 × Hb + 7.7) × (pH - 7.4); Hb defaults to 15 g/dL"""
+    if hemoglobin is None:
+        return (hco3 - 24.4) + DEFAULT_BE_SLOPE * (ph - 7.4)
+    return (hco3 - 24.4) + (2.3 * hemoglobin + 7.7) * (ph - 7.4)
+
+
+# Expected compensation: expected = intercept + slope × (x - pivot) / per,
+# reported as (expected - 2, expected + 2) with an optional floor on the low
+# end. x is HCO3 for metabolic and pCO2 for respiratory disorders. Keyed on
+# (disorder, duration); metabolic rules do not depend on duration (None).
+# Rule: (slope, pivot, per, intercept, floor)
+EXPECTED_RANGE_RULES = {
+    # Winter's formula: pCO2 = 1.5 × HCO3 + 8
+    (Disorder.METABOLIC_ACIDOSIS, None): (1.5, 0, 1, 8, None),
+    # pCO2 = 0.7 × HCO3 + 21
+    (Disorder.METABOLIC_ALKALOSIS, None): (0.7, 0, 1, 21, None),
+    # HCO3 rises 1 mEq/L per 10 mmHg rise in pCO2
+    (Disorder.RESPIRATORY_ACIDOSIS, Duration.ACUTE): (1, 40, 10, 24, None),
+    # HCO3 rises 3.5 mEq/L per 10 mmHg rise in pCO2
+    (Disorder.RESPIRATORY_ACIDOSIS, Duration.CHRONIC): (3.5, 40, 10, 24, None),
+    # HCO3 falls 2 mEq/L per 10 mmHg fall in pCO2, floor at 8
+    (Disorder.RESPIRATORY_ALKALOSIS, Duration.ACUTE): (2, 40, 10, 24, 8),
+    # HCO3 falls 4-5 mEq/L per 10 mmHg fall in pCO2, floor at 12
+    (Disorder.RESPIRATORY_ALKALOSIS, Duration.CHRONIC): (5, 40, 10, 24, 12),
+}
+
+
+def _expected_range(x: float, rule: tuple) -> Tuple[float, float]:
+    """Evaluate an EXPECTED_RANGE_RULES entry at x."""
+    slope, pivot, per, intercept, floor = rule
+    expected = intercept + slope * ((x - pivot) / per)
+    low = expected - 2
+    # Floor with a comparison rather than a max() call; like max(), keeps
+    # low itself when the two are equal
+    if floor is not None and floor > low:
+        low = floor
+    return (low, expected + 2)
+
+
+def _expected_range_rule(primary_disorder: Disorder, duration: Duration) -> Optional[tuple]:
+    """Rule for a primary disorder; respiratory rules are acute or chronic."""
+    if primary_disorder in METABOLIC_DISORDERS:
+        return EXPECTED_RANGE_RULES[primary_disorder, None]
+    chronicity = _ACUTE if duration == _ACUTE else _CHRONIC
+    return EXPECTED_RANGE_RULES.get((primary_disorder, chronicity))
+
+
+# Metabolic disorders change HCO3 first; respiratory disorders change pCO2
+METABOLIC_DISORDERS = frozenset({Disorder.METABOLIC_ACIDOSIS, Disorder.METABOLIC_ALKALOSIS})
 
-@dataclass
+# Starting value of the primary variable (HCO3 for metabolic, pCO2 for
+# respiratory disorders) for each disorder and severity
+DISORDER_SEED_VALUES = {
+    (Disorder.METABOLIC_ACIDOSIS, Severity.MILD): 18.0,
+    (Disorder.METABOLIC_ACIDOSIS, Severity.MODERATE): 14.0,
+    (Disorder.METABOLIC_ACIDOSIS, Severity.SEVERE): 8.0,
+    (Disorder.METABOLIC_ALKALOSIS, Severity.MILD): 30.0,
+    (Disorder.METABOLIC_ALKALOSIS, Severity.MODERATE): 36.0,
+    (Disorder.METABOLIC_ALKALOSIS, Severity.SEVERE): 42.0,
+    (Disorder.RESPIRATORY_ACIDOSIS, Severity.MILD): 52.0,
+    (Disorder.RESPIRATORY_ACIDOSIS, Severity.MODERATE): 65.0,
+    (Disorder.RESPIRATORY_ACIDOSIS, Severity.SEVERE): 85.0,
+    (Disorder.RESPIRATORY_ALKALOSIS, Severity.MILD): 30.0,
+    (Disorder.RESPIRATORY_ALKALOSIS, Severity.MODERATE): 24.0,
+    (Disorder.RESPIRATORY_ALKALOSIS, Severity.SEVERE): 18.0,
+}
+
+# How the compensating variable is placed relative to its expected range:
+# (bound averaged with the baseline for PARTIAL, (bound, offset) for EXCESSIVE)
+COMPENSATION_GENERATION_RULES = {
+    Disorder.METABOLIC_ACIDOSIS: (1, (0, -4)),
+    Disorder.METABOLIC_ALKALOSIS: (0, (1, 4)),
+    Disorder.RESPIRATORY_ACIDOSIS: (0, (1, 4)),
+    Disorder.RESPIRATORY_ALKALOSIS: (1, (0, -2)),
+}
+
+# Compensating value from (baseline, expected range, rule) per compensation
+_COMPENSATED_VALUE = {
+    Compensation.NONE: lambda baseline, expected, rule: baseline,
+    Compensation.PARTIAL: lambda baseline, expected, rule: (baseline + expected[rule[0]]) / 2,
+    Compensation.APPROPRIATE: lambda baseline, expected, rule: (expected[0] + expected[1]) / 2,
+    Compensation.EXCESSIVE: lambda baseline, expected, rule: expected[rule[1][0]] + rule[1][1],
+}
+
+
+def _classify_primary_disorder(ph: float, pco2: float, hco3: float) -> Disorder:
+    """Branching classifier that PRIMARY_DISORDER_TABLE is built from."""
+    if NORMAL_PH[0] <= ph <= NORMAL_PH[1]:
+        # Normal pH - could be normal or compensated
+        if pco2 < NORMAL_PCO2[0] and hco3 < NORMAL_HCO3[0]:
+            # Both low - likely compensated metabolic acidosis
+            return Disorder.METABOLIC_ACIDOSIS
+        elif pco2 > NORMAL_PCO2[1] and hco3 > NORMAL_HCO3[1]:
+            # Both high - likely compensated metabolic alkalosis or resp acidosis
+            return Disorder.METABOLIC_ALKALOSIS
+        else:
+            return Disorder.NORMAL
+    
+    if ph < NORMAL_PH[0]:  # Acidemia
+        if pco2 > NORMAL_PCO2[1]:
+            return Disorder.RESPIRATORY_ACIDOSIS
+        elif hco3 < NORMAL_HCO3[0]:
+            return Disorder.METABOLIC_ACIDOSIS
+        else:
+            # Mixed or transitional
+            return Disorder.METABOLIC_ACIDOSIS
+    
+    else:  # Alkalemia (pH > 7.45)
+        if pco2 < NORMAL_PCO2[0]:
+            return Disorder.RESPIRATORY_ALKALOSIS
+        elif hco3 > NORMAL_HCO3[1]:
+            return Disorder.METABOLIC_ALKALOSIS
+        else:
+            return Disorder.METABOLIC_ALKALOSIS
+
+
+def _build_primary_disorder_table() -> Tuple[Disorder, ...]:
+    """Run the branching classifier once for every low/normal/high combination."""
+    def representatives(limits):
+        low, high = limits
+        return (low - 1, (low + high) / 2, high + 1)
+    
+    return tuple(
+        _classify_primary_disorder(ph, pco2, hco3)
+        for ph in representatives(NORMAL_PH)
+        for pco2 in representatives(NORMAL_PCO2)
+        for hco3 in representatives(NORMAL_HCO3)
+    )
+
+
+# Primary disorder indexed by 9 * pH state + 3 * pCO2 state + HCO3 state,
+# each 0 (low), 1 (normal, inclusive) or 2 (high)
+PRIMARY_DISORDER_TABLE = _build_primary_disorder_table()
+
+# Secondary disorders superimposed by apply_secondary_disorder:
+# (changes pCO2 rather than HCO3, change at full magnitude, floor or None)
+SECONDARY_DISORDER_EFFECTS = {
+    Disorder.RESPIRATORY_ACIDOSIS: (True, 20, None),
+    Disorder.RESPIRATORY_ALKALOSIS: (True, -15, 15),
+    Disorder.METABOLIC_ACIDOSIS: (False, -10, 6),
+    Disorder.METABOLIC_ALKALOSIS: (False, 10, None),
+}
+
+# Fraction of the full secondary effect applied per severity
+SECONDARY_EFFECT_MAGNITUDES = {
+    Severity.MILD: 0.3,
+    Severity.MODERATE: 0.6,
+    Severity.SEVERE: 1.0,
+}
+
+
+@dataclass(slots=True)
 class AcidBaseState:
     """Represents the acid-base state of the blood."""
     ph: float
@@ -30,6 +232,61 @@ class AcidBaseState:
     secondary_disorder: Optional[Disorder] = None
 
 
+@dataclass(slots=True)
+class AcidBaseArray:
+    """
+    Struct-of-arrays counterpart of AcidBaseState for bulk generation.
+    
+    Each field holds a NumPy array with one entry per state. The disorder
+    and compensation fields hold enum values as int8, with 0 for no
+    secondary disorder. Produced by AcidBaseEngine.generate_for_disorder_batch().
+    """
+    ph: Any
+    pco2: Any
+    hco3: Any
+    base_excess: Any
+    primary_disorder: Any
+    compensation_status: Any
+    secondary_disorder: Any
+    
+    def __len__(self) -> int:
+        return self.ph.size
+    
+    def state(self, index) -> AcidBaseState:
+        """Build an AcidBaseState for a single entry."""
+        secondary = int(self.secondary_disorder[index])
+        return AcidBaseState(
+            float(self.ph[index]),
+            float(self.pco2[index]),
+            float(self.hco3[index]),
+            float(self.base_excess[index]),
+            Disorder(int(self.primary_disorder[index])),
+            Compensation(int(self.compensation_status[index])),
+            Disorder(secondary) if secondary else None,
+        )
+    
+    def states(self) -> Iterator[AcidBaseState]:
+        """Lazily build an AcidBaseState for every entry, in flattened order."""
+        columns = zip(*(
+            array.ravel().tolist()
+            for array in (self.ph, self.pco2, self.hco3, self.base_excess)
+        ))
+        labels = zip(
+            self.primary_disorder.ravel().tolist(),
+            self.compensation_status.ravel().tolist(),
+            self.secondary_disorder.ravel().tolist(),
+        )
+        for (ph, pco2, hco3, base_excess), (primary, compensation, secondary) in zip(
+            columns, labels
+        ):
+            yield AcidBaseState(
+                ph, pco2, hco3, base_excess,
+                Disorder(primary),
+                Compensation(compensation),
+                Disorder(secondary) if secondary else None,
+            )
+
+
 class AcidBaseEngine:
     """
     Engine for acid-base calculations and generation.
@@ -41,8 +298,8 @@ class AcidBaseEngine:
     """
     
     # Henderson-Hasselbalch constants
-    PK = 6.1  # pKa of carbonic acid
-    CO2_SOLUBILITY = 0.03  # mmol/L per mmHg
+    PK = PK  # pKa of carbonic acid
+    CO2_SOLUBILITY = CO2_SOLUBILITY  # mmol/L per mmHg
     
     @classmethod
     def calculate_ph(cls, hco3: float, pco2: float) -> float:
@@ -51,11 +308,7 @@ class AcidBaseEngine:
         
         pH = 6.1 + log10([HCO3] / (0.03 × pCO2))
         """
-        if pco2 <= 0 or hco3 <= 0:
-            raise ValueError("pCO2 and HCO3 must be positive")
-        
-        ratio = hco3 / (cls.CO2_SOLUBILITY * pco2)
-        return cls.PK + math.log10(ratio)
+        return _ph(hco3, pco2)
     
     @classmethod
     def calculate_hco3(cls, ph: float, pco2: float) -> float:
@@ -64,7 +317,7 @@ class AcidBaseEngine:
         
         [HCO3] = 0.03 × pCO2 × 10^(pH - 6.1)
         """
-        return cls.CO2_SOLUBILITY * pco2 * (10 ** (ph - cls.PK))
+        return _hco3(ph, pco2)
     
     @classmethod
     def calculate_pco2(cls, ph: float, hco3: float) -> float:
@@ -73,7 +326,7 @@ class AcidBaseEngine:
         
         pCO2 = [HCO3] / (0.03 × 10^(pH - 6.1))
         """
-        return hco3 / (cls.CO2_SOLUBILITY * (10 ** (ph - cls.PK)))
+        return _pco2(ph, hco3)
     
     @classmethod
     def calculate_base_excess(cls, ph: float, hco3: float, hemoglobin: float = 15.0) -> float:
@@ -87,8 +340,93 @@ class AcidBaseEngine:
         BE = HCO3 - 24.4 + (2.3 × Hb + 7.7) × (pH - 7.4)
         """
         # Simplified formula that works well for clinical purposes
-        be = (hco3 - 24.4) + (2.3 * hemoglobin + 7.7) * (ph - 7.4)
-        return be
+        return _base_excess(ph, hco3, hemoglobin)
+    
+    @classmethod
+    def calculate_ph_array(cls, hco3, pco2):
+        """
+        Vectorized calculate_ph for NumPy arrays of HCO3 and pCO2.
+        
+        Returns:
+            Array of pH values
+        """
+        np = require_numpy()
+        hco3 = np.asarray(hco3, dtype=float)
+        pco2 = np.asarray(pco2, dtype=float)
+        if (pco2 <= 0).any() or (hco3 <= 0).any():
+            raise ValueError("pCO2 and HCO3 must be positive")
+        
+        return cls.PK + np.log10(hco3 / (cls.CO2_SOLUBILITY * pco2))
+    
+    @classmethod
+    def calculate_hco3_array(cls, ph, pco2):
+        """
+        Vectorized calculate_hco3 for NumPy arrays of pH and pCO2.
+        
+        Returns:
+            Array of HCO3 values
+        """
+        np = require_numpy()
+        ph = np.asarray(ph, dtype=float)
+        pco2 = np.asarray(pco2, dtype=float)
+        return cls.CO2_SOLUBILITY * pco2 * np.exp((ph - cls.PK) * LN10)
+    
+    @classmethod
+    def calculate_pco2_array(cls, ph, hco3):
+        """
+        Vectorized calculate_pco2 for NumPy arrays of pH and HCO3.
+        
+        Returns:
+            Array of pCO2 values
+        """
+        np = require_numpy()
+        ph = np.asarray(ph, dtype=float)
+        hco3 = np.asarray(hco3, dtype=float)
+        return hco3 / (cls.CO2_SOLUBILITY * np.exp((ph - cls.PK) * LN10))
+    
+    @classmethod
+    def calculate_base_excess_array(cls, ph, hco3, hemoglobin=15.0):
+        """
+        Vectorized calculate_base_excess for NumPy arrays.
+        
+        Returns:
+            Array of base excess values
+        """
+        np = require_numpy()
+        return _base_excess(
+            np.asarray(ph, dtype=float),
+            np.asarray(hco3, dtype=float),
+            np.asarray(hemoglobin, dtype=float),
+        )
+    
+    @classmethod
+    def expected_range_array(
+        cls,
+        primary_disorder: Disorder,
+        values,
+        duration: Duration = Duration.ACUTE
+    ):
+        """
+        Vectorized expected compensation range for a primary disorder.
+        
+        Applies the same formula as the matching expected_* method to an
+        array of HCO3 (metabolic disorders) or pCO2 (respiratory disorders)
+        values.
+        
+        Returns:
+            2 x N array of (min_expected, max_expected) rows
+        """
+        np = require_numpy()
+        rule = _expected_range_rule(primary_disorder, duration)
+        if rule is None:
+            raise ValueError(f"No compensation rule for {primary_disorder}")
+        
+        slope, pivot, per, intercept, floor = rule
+        expected = intercept + slope * ((np.asarray(values, dtype=float) - pivot) / per)
+        low = expected - 2
+        if floor is not None:
+            low = np.maximum(low, floor)
+        return np.stack([low, expected + 2])
     
     @classmethod
     def expected_pco2_metabolic_acidosis(cls, hco3: float) -> Tuple[float, float]:
@@ -99,8 +437,8 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        expected = 1.5 * hco3 + 8
-        return (expected - 2, expected + 2)
+        rule = EXPECTED_RANGE_RULES[_METABOLIC_ACIDOSIS, None]
+        return _expected_range(hco3, rule)
     
     @classmethod
     def expected_pco2_metabolic_alkalosis(cls, hco3: float) -> Tuple[float, float]:
@@ -112,8 +450,8 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        expected = 0.7 * hco3 + 21
-        return (expected - 2, expected + 2)
+        rule = EXPECTED_RANGE_RULES[_METABOLIC_ALKALOSIS, None]
+        return _expected_range(hco3, rule)
     
     @classmethod
     def expected_hco3_respiratory_acidosis_acute(cls, pco2: float) -> Tuple[float, float]:
@@ -124,10 +462,8 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        delta_pco2 = pco2 - 40
-        expected_delta_hco3 = delta_pco2 / 10  # 1 mEq/L per 10 mmHg
-        expected = 24 + expected_delta_hco3
-        return (expected - 2, expected + 2)
+        rule = EXPECTED_RANGE_RULES[_RESPIRATORY_ACIDOSIS, _ACUTE]
+        return _expected_range(pco2, rule)
     
     @classmethod
     def expected_hco3_respiratory_acidosis_chronic(cls, pco2: float) -> Tuple[float, float]:
@@ -138,10 +474,8 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        delta_pco2 = pco2 - 40
-        expected_delta_hco3 = 3.5 * (delta_pco2 / 10)
-        expected = 24 + expected_delta_hco3
-        return (expected - 2, expected + 2)
+        rule = EXPECTED_RANGE_RULES[_RESPIRATORY_ACIDOSIS, _CHRONIC]
+        return _expected_range(pco2, rule)
     
     @classmethod
     def expected_hco3_respiratory_alkalosis_acute(cls, pco2: float) -> Tuple[float, float]:
@@ -152,10 +486,8 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        delta_pco2 = 40 - pco2
-        expected_delta_hco3 = 2 * (delta_pco2 / 10)
-        expected = 24 - expected_delta_hco3
-        return (max(expected - 2, 8), expected + 2)  # Floor at 8
+        rule = EXPECTED_RANGE_RULES[_RESPIRATORY_ALKALOSIS, _ACUTE]
+        return _expected_range(pco2, rule)
     
     @classmethod
     def expected_hco3_respiratory_alkalosis_chronic(cls, pco2: float) -> Tuple[float, float]:
@@ -166,43 +498,40 @@ class AcidBaseEngine:
         
         Returns: (min_expected, max_expected)
         """
-        delta_pco2 = 40 - pco2
-        expected_delta_hco3 = 5 * (delta_pco2 / 10)
-        expected = 24 - expected_delta_hco3
-        return (max(expected - 2, 12), expected + 2)  # Floor at 12
+        rule = EXPECTED_RANGE_RULES[_RESPIRATORY_ALKALOSIS, _CHRONIC]
+        return _expected_range(pco2, rule)
     
     @classmethod
     def identify_primary_disorder(cls, ph: float, pco2: float, hco3: float) -> Disorder:
         """
         Identify the primary acid-base disorder from values.
         """
-        if NORMAL_PH[0] <= ph <= NORMAL_PH[1]:
-            # Normal pH - could be normal or compensated
-            if pco2 < NORMAL_PCO2[0] and hco3 < NORMAL_HCO3[0]:
-                # Both low - likely compensated metabolic acidosis
-                return Disorder.METABOLIC_ACIDOSIS
-            elif pco2 > NORMAL_PCO2[1] and hco3 > NORMAL_HCO3[1]:
-                # Both high - likely compensated metabolic alkalosis or resp acidosis
-                return Disorder.METABOLIC_ALKALOSIS
-            else:
-                return Disorder.NORMAL
+        # Scale each comparison before summing: for NumPy scalars the results
+        # are np.bool_, and np.bool_ + np.bool_ is a logical or, not 2
+        return PRIMARY_DISORDER_TABLE[
+            9 * (ph >= NORMAL_PH[0]) + 9 * (ph > NORMAL_PH[1])
+            + 3 * (pco2 >= NORMAL_PCO2[0]) + 3 * (pco2 > NORMAL_PCO2[1])
+            + 1 * (hco3 >= NORMAL_HCO3[0]) + (hco3 > NORMAL_HCO3[1])
+        ]
+    
+    @classmethod
+    def identify_primary_disorder_array(cls, ph, pco2, hco3):
+        """
+        Vectorized identify_primary_disorder for NumPy arrays.
         
-        if ph < NORMAL_PH[0]:  # Acidemia
-            if pco2 > NORMAL_PCO2[1]:
-                return Disorder.RESPIRATORY_ACIDOSIS
-            elif hco3 < NORMAL_HCO3[0]:
-                return Disorder.METABOLIC_ACIDOSIS
-            else:
-                # Mixed or transitional
-                return Disorder.METABOLIC_ACIDOSIS
-        
-        else:  # Alkalemia (pH > 7.45)
-            if pco2 < NORMAL_PCO2[0]:
-                return Disorder.RESPIRATORY_ALKALOSIS
-            elif hco3 > NORMAL_HCO3[1]:
-                return Disorder.METABOLIC_ALKALOSIS
-            else:
-                return Disorder.METABOLIC_ALKALOSIS
+        Returns:
+            Array of Disorder values
+        """
+        np = require_numpy()
+        
+        def state(values, limits):
+            values = np.asarray(values, dtype=float)
+            return (values >= limits[0]).astype(np.intp) + (values > limits[1])
+        
+        return np.take(
+            np.array(PRIMARY_DISORDER_TABLE),
+            9 * state(ph, NORMAL_PH) + 3 * state(pco2, NORMAL_PCO2) + state(hco3, NORMAL_HCO3),
+        )
     
     @classmethod
     def assess_compensation(
@@ -211,75 +540,88 @@ class AcidBaseEngine:
         ph: float,
         pco2: float,
         hco3: float,
-        duration: Duration = Duration.ACUTE
+        duration: Duration = Duration.ACUTE,
+        expected_range: Optional[Tuple[float, float]] = None
     ) -> Tuple[Compensation, Optional[Disorder]]:
         """
         Assess compensation status and identify any secondary disorder.
         
+        Args:
+            expected_range: Expected compensation range for this disorder and
+                duration if the caller already has it; computed otherwise
+        
         Returns: (compensation_status, secondary_disorder or None)
         """
         secondary_disorder = None
         
-        if primary_disorder == Disorder.NORMAL:
-            return (Compensation.NONE, None)
+        if primary_disorder == _NORMAL:
+            return (_NO_COMPENSATION, None)
         
-        if primary_disorder == Disorder.METABOLIC_ACIDOSIS:
-            expected_pco2_range = cls.expected_pco2_metabolic_acidosis(hco3)
+        if primary_disorder == _METABOLIC_ACIDOSIS:
+            if expected_range is None:
+                expected_range = cls.expected_pco2_metabolic_acidosis(hco3)
+            expected_pco2_range = expected_range
             
             if pco2 < expected_pco2_range[0]:
                 # More hyperventilation than expected - respiratory alkalosis too
-                secondary_disorder = Disorder.RESPIRATORY_ALKALOSIS
-                return (Compensation.EXCESSIVE, secondary_disorder)
+                secondary_disorder = _RESPIRATORY_ALKALOSIS
+                return (_EXCESSIVE, secondary_disorder)
             elif pco2 > expected_pco2_range[1]:
                 # Less hyperventilation than expected - respiratory acidosis too
-                secondary_disorder = Disorder.RESPIRATORY_ACIDOSIS
-                return (Compensation.PARTIAL, secondary_disorder)
+                secondary_disorder = _RESPIRATORY_ACIDOSIS
+                return (_PARTIAL, secondary_disorder)
             else:
-                return (Compensation.APPROPRIATE, None)
+                return (_APPROPRIATE, None)
         
-        elif primary_disorder == Disorder.METABOLIC_ALKALOSIS:
-            expected_pco2_range = cls.expected_pco2_metabolic_alkalosis(hco3)
+        elif primary_disorder == _METABOLIC_ALKALOSIS:
+            if expected_range is None:
+                expected_range = cls.expected_pco2_metabolic_alkalosis(hco3)
+            expected_pco2_range = expected_range
             
             if pco2 > expected_pco2_range[1]:
-                secondary_disorder = Disorder.RESPIRATORY_ACIDOSIS
-                return (Compensation.EXCESSIVE, secondary_disorder)
+                secondary_disorder = _RESPIRATORY_ACIDOSIS
+                return (_EXCESSIVE, secondary_disorder)
             elif pco2 < expected_pco2_range[0]:
-                secondary_disorder = Disorder.RESPIRATORY_ALKALOSIS
-                return (Compensation.PARTIAL, secondary_disorder)
-            else:
-                return (Compensation.APPROPRIATE, None)
-        
-        elif primary_disorder == Disorder.RESPIRATORY_ACIDOSIS:
-            if duration == Duration.ACUTE:
-                expected_hco3_range = cls.expected_hco3_respiratory_acidosis_acute(pco2)
+                secondary_disorder = _RESPIRATORY_ALKALOSIS
+                return (_PARTIAL, secondary_disorder)
             else:
-                expected_hco3_range = cls.expected_hco3_respiratory_acidosis_chronic(pco2)
+                return (_APPROPRIATE, None)
+        
+        elif primary_disorder == _RESPIRATORY_ACIDOSIS:
+            if expected_range is None:
+                if duration == _ACUTE:
+                    expected_range = cls.expected_hco3_respiratory_acidosis_acute(pco2)
+                else:
+                    expected_range = cls.expected_hco3_respiratory_acidosis_chronic(pco2)
+            expected_hco3_range = expected_range
             
             if hco3 > expected_hco3_range[1]:
-                secondary_disorder = Disorder.METABOLIC_ALKALOSIS
-                return (Compensation.EXCESSIVE, secondary_disorder)
+                secondary_disorder = _METABOLIC_ALKALOSIS
+                return (_EXCESSIVE, secondary_disorder)
             elif hco3 < expected_hco3_range[0]:
-                secondary_disorder = Disorder.METABOLIC_ACIDOSIS
-                return (Compensation.PARTIAL, secondary_disorder)
-            else:
-                return (Compensation.APPROPRIATE, None)
-        
-        elif primary_disorder == Disorder.RESPIRATORY_ALKALOSIS:
-            if duration == Duration.ACUTE:
-                expected_hco3_range = cls.expected_hco3_respiratory_alkalosis_acute(pco2)
+                secondary_disorder = _METABOLIC_ACIDOSIS
+                return (_PARTIAL, secondary_disorder)
             else:
-                expected_hco3_range = cls.expected_hco3_respiratory_alkalosis_chronic(pco2)
+                return (_APPROPRIATE, None)
+        
+        elif primary_disorder == _RESPIRATORY_ALKALOSIS:
+            if expected_range is None:
+                if duration == _ACUTE:
+                    expected_range = cls.expected_hco3_respiratory_alkalosis_acute(pco2)
+                else:
+                    expected_range = cls.expected_hco3_respiratory_alkalosis_chronic(pco2)
+            expected_hco3_range = expected_range
             
             if hco3 < expected_hco3_range[0]:
-                secondary_disorder = Disorder.METABOLIC_ACIDOSIS
-                return (Compensation.EXCESSIVE, secondary_disorder)
+                secondary_disorder = _METABOLIC_ACIDOSIS
+                return (_EXCESSIVE, secondary_disorder)
             elif hco3 > expected_hco3_range[1]:
-                secondary_disorder = Disorder.METABOLIC_ALKALOSIS
-                return (Compensation.PARTIAL, secondary_disorder)
+                secondary_disorder = _METABOLIC_ALKALOSIS
+                return (_PARTIAL, secondary_disorder)
             else:
-                return (Compensation.APPROPRIATE, None)
+                return (_APPROPRIATE, None)
         
-        return (Compensation.NONE, None)
+        return (_NO_COMPENSATION, None)
     
     @classmethod
     def generate_for_disorder(
@@ -295,154 +637,106 @@ class AcidBaseEngine:
         Generate acid-base values for a specified disorder.
         
         This is the primary generation method for disorder-based mode.
+        Values are memoized on the arguments; every call returns a new
+        AcidBaseState, so callers are free to modify it.
         """
-        if disorder == Disorder.NORMAL:
-            return AcidBaseState(
-                ph=7.40,
-                pco2=baseline_pco2,
-                hco3=baseline_hco3,
-                base_excess=0.0,
-                primary_disorder=Disorder.NORMAL,
-                compensation_status=Compensation.NONE
-            )
+        return AcidBaseState(*_generate_for_disorder(
+            disorder, severity, compensation, duration, baseline_pco2, baseline_hco3
+        ))
+    
+    @classmethod
+    def generate_for_disorder_batch(
+        cls,
+        disorders,
+        severities,
+        compensations=Compensation.APPROPRIATE,
+        durations=Duration.ACUTE,
+        baseline_pco2=40.0,
+        baseline_hco3=24.0,
+        dtype=float,
+    ) -> AcidBaseArray:
+        """
+        Vectorized generate_for_disorder for sweeps over many specifications.
         
-        # Determine target pH based on severity
-        if disorder in [Disorder.METABOLIC_ACIDOSIS, Disorder.RESPIRATORY_ACIDOSIS]:
-            if severity == Severity.MILD:
-                target_ph = 7.32
-            elif severity == Severity.MODERATE:
-                target_ph = 7.25
-            else:  # SEVERE
-                target_ph = 7.15
-        else:  # Alkalosis
-            if severity == Severity.MILD:
-                target_ph = 7.48
-            elif severity == Severity.MODERATE:
-                target_ph = 7.52
-            else:  # SEVERE
-                target_ph = 7.58
-        
-        # Generate values based on disorder type
-        if disorder == Disorder.METABOLIC_ACIDOSIS:
-            # Start with low HCO3
-            if severity == Severity.MILD:
-                hco3 = 18.0
-            elif severity == Severity.MODERATE:
-                hco3 = 14.0
-            else:
-                hco3 = 8.0
-            
-            # Calculate expected pCO2 with compensation
-            expected_pco2 = cls.expected_pco2_metabolic_acidosis(hco3)
-            
-            if compensation == Compensation.NONE:
-                pco2 = baseline_pco2  # No respiratory compensation
-            elif compensation == Compensation.PARTIAL:
-                pco2 = (baseline_pco2 + expected_pco2[1]) / 2
-            elif compensation == Compensation.APPROPRIATE:
-                pco2 = (expected_pco2[0] + expected_pco2[1]) / 2
-            else:  # EXCESSIVE
-                pco2 = expected_pco2[0] - 4  # More compensation than expected
-            
-            ph = cls.calculate_ph(hco3, pco2)
-        
-        elif disorder == Disorder.METABOLIC_ALKALOSIS:
-            # Start with high HCO3
-            if severity == Severity.MILD:
-                hco3 = 30.0
-            elif severity == Severity.MODERATE:
-                hco3 = 36.0
-            else:
-                hco3 = 42.0
-            
-            # Calculate expected pCO2 with compensation
-            expected_pco2 = cls.expected_pco2_metabolic_alkalosis(hco3)
-            
-            if compensation == Compensation.NONE:
-                pco2 = baseline_pco2
-            elif compensation == Compensation.PARTIAL:
-                pco2 = (baseline_pco2 + expected_pco2[0]) / 2
-            elif compensation == Compensation.APPROPRIATE:
-                pco2 = (expected_pco2[0] + expected_pco2[1]) / 2
-            else:  # EXCESSIVE
-                pco2 = expected_pco2[1] + 4
-            
-            ph = cls.calculate_ph(hco3, pco2)
-        
-        elif disorder == Disorder.RESPIRATORY_ACIDOSIS:
-            # Start with high pCO2
-            if severity == Severity.MILD:
-                pco2 = 52.0
-            elif severity == Severity.MODERATE:
-                pco2 = 65.0
-            else:
-                pco2 = 85.0
-            
-            # Calculate expected HCO3 with compensation
-            if duration == Duration.CHRONIC:
-                expected_hco3 = cls.expected_hco3_respiratory_acidosis_chronic(pco2)
-            else:
-                expected_hco3 = cls.expected_hco3_respiratory_acidosis_acute(pco2)
-            
-            if compensation == Compensation.NONE:
-                hco3 = baseline_hco3
-            elif compensation == Compensation.PARTIAL:
-                hco3 = (baseline_hco3 + expected_hco3[0]) / 2
-            elif compensation == Compensation.APPROPRIATE:
-                hco3 = (expected_hco3[0] + expected_hco3[1]) / 2
-            else:  # EXCESSIVE
-                hco3 = expected_hco3[1] + 4
-            
-            ph = cls.calculate_ph(hco3, pco2)
-        
-        elif disorder == Disorder.RESPIRATORY_ALKALOSIS:
-            # Start with low pCO2
-            if severity == Severity.MILD:
-                pco2 = 30.0
-            elif severity == Severity.MODERATE:
-                pco2 = 24.0
-            else:
-                pco2 = 18.0
-            
-            # Calculate expected HCO3 with compensation
-            if duration == Duration.CHRONIC:
-                expected_hco3 = cls.expected_hco3_respiratory_alkalosis_chronic(pco2)
-            else:
-                expected_hco3 = cls.expected_hco3_respiratory_alkalosis_acute(pco2)
-            
-            if compensation == Compensation.NONE:
-                hco3 = baseline_hco3
-            elif compensation == Compensation.PARTIAL:
-                hco3 = (baseline_hco3 + expected_hco3[1]) / 2
-            elif compensation == Compensation.APPROPRIATE:
-                hco3 = (expected_hco3[0] + expected_hco3[1]) / 2
-            else:  # EXCESSIVE
-                hco3 = expected_hco3[0] - 2
-            
-            ph = cls.calculate_ph(hco3, pco2)
+        Arguments are enum members or arrays of them (and floats or arrays
+        for the baselines) and broadcast against each other, e.g. one
+        np.meshgrid array per axis.
         
-        else:
-            # Fallback to normal
-            ph = 7.40
-            pco2 = baseline_pco2
-            hco3 = baseline_hco3
+        Args:
+            dtype: Dtype of the value arrays. Values are computed in float64;
+                np.float32 halves the memory of large sweeps and still
+                resolves pH well below the reported 0.01
+        
+        Returns:
+            AcidBaseArray with the broadcast shape of the arguments
+        """
+        np = require_numpy()
+        tables = _generation_arrays()
+        disorder, severity, compensation, duration, base_pco2, base_hco3 = np.broadcast_arrays(
+            np.asarray(disorders, dtype=np.intp),
+            np.asarray(severities, dtype=np.intp),
+            np.asarray(compensations, dtype=np.intp),
+            np.asarray(durations, dtype=np.intp),
+            np.asarray(baseline_pco2, dtype=float),
+            np.asarray(baseline_hco3, dtype=float),
+        )
         
-        # Calculate base excess
-        base_excess = cls.calculate_base_excess(ph, hco3)
+        normal = disorder == Disorder.NORMAL
+        metabolic = tables["metabolic"][disorder]
+        seed = tables["seed"][disorder, severity]
+        baseline = np.where(metabolic, base_pco2, base_hco3)
         
-        # Assess actual compensation and any secondary disorder
-        actual_compensation, secondary = cls.assess_compensation(
-            disorder, ph, pco2, hco3, duration
+        # Compensating variable from the expected range, as in _COMPENSATED_VALUE
+        low, high = _expected_range_arrays(
+            tables["rules"][disorder, (duration == Duration.CHRONIC).astype(np.intp)], seed
+        )
+        partial_bound = np.where(tables["partial_bound"][disorder] == 0, low, high)
+        excessive_bound = tables["excessive_bound"][disorder]
+        excessive = np.where(excessive_bound == 0, low, high) + tables["excessive_offset"][disorder]
+        compensating = np.select(
+            [
+                compensation == Compensation.NONE,
+                compensation == Compensation.PARTIAL,
+                compensation == Compensation.APPROPRIATE,
+            ],
+            [baseline, (baseline + partial_bound) / 2, (low + high) / 2],
+            default=excessive,
         )
         
-        return AcidBaseState(
-            ph=ph,
-            pco2=pco2,
-            hco3=hco3,
-            base_excess=base_excess,
-            primary_disorder=disorder,
-            compensation_status=actual_compensation,
-            secondary_disorder=secondary
+        pco2 = np.where(normal, base_pco2, np.where(metabolic, compensating, seed))
+        hco3 = np.where(normal, base_hco3, np.where(metabolic, seed, compensating))
+        ph = np.where(normal, 7.40, cls.calculate_ph_array(hco3, pco2))
+        base_excess = np.where(normal, 0.0, _base_excess(ph, hco3))
+        
+        # Assessment, as in assess_compensation: SUBACUTE is assessed as chronic
+        low, high = _expected_range_arrays(
+            tables["rules"][disorder, (duration != Duration.ACUTE).astype(np.intp)], seed
+        )
+        below = ~normal & (compensating < low)
+        above = ~normal & (compensating > high)
+        compensation_status = np.select(
+            [normal, below, above],
+            [
+                Compensation.NONE,
+                np.where(excessive_bound == 0, Compensation.EXCESSIVE, Compensation.PARTIAL),
+                np.where(excessive_bound == 1, Compensation.EXCESSIVE, Compensation.PARTIAL),
+            ],
+            default=Compensation.APPROPRIATE,
+        )
+        secondary_disorder = np.select(
+            [below, above],
+            [tables["low_secondary"][disorder], tables["high_secondary"][disorder]],
+            default=0,
+        )
+        
+        return AcidBaseArray(
+            ph=ph.astype(dtype, copy=False),
+            pco2=pco2.astype(dtype, copy=False),
+            hco3=hco3.astype(dtype, copy=False),
+            base_excess=base_excess.astype(dtype, copy=False),
+            primary_disorder=disorder.astype(np.int8),
+            compensation_status=compensation_status.astype(np.int8),
+            secondary_disorder=secondary_disorder.astype(np.int8),
         )
     
     @classmethod
@@ -450,46 +744,197 @@ class AcidBaseEngine:
         cls,
         state: AcidBaseState,
         secondary_disorder: Disorder,
-        secondary_severity: Severity
+        secondary_severity: Severity,
+        in_place: bool = False
     ) -> AcidBaseState:
         """
         Apply a secondary disorder to an existing acid-base state.
         Creates a mixed disorder.
-        """
-        # Get the effect magnitude based on severity
-        if secondary_severity == Severity.MILD:
-            effect_magnitude = 0.3
-        elif secondary_severity == Severity.MODERATE:
-            effect_magnitude = 0.6
-        else:
-            effect_magnitude = 1.0
         
+        Args:
+            state: Acid-base state to modify
+            secondary_disorder: Disorder to superimpose
+            secondary_severity: Severity of the secondary disorder
+            in_place: Update and return `state` itself instead of a copy
+                (for callers that own the state, e.g. the generator)
+        
+        Returns:
+            The mixed-disorder acid-base state
+        """
         new_pco2 = state.pco2
         new_hco3 = state.hco3
         
-        if secondary_disorder == Disorder.RESPIRATORY_ACIDOSIS:
-            # Add respiratory acidosis - increase pCO2
-            new_pco2 = state.pco2 + (20 * effect_magnitude)
-        elif secondary_disorder == Disorder.RESPIRATORY_ALKALOSIS:
-            # Add respiratory alkalosis - decrease pCO2
-            new_pco2 = max(state.pco2 - (15 * effect_magnitude), 15)
-        elif secondary_disorder == Disorder.METABOLIC_ACIDOSIS:
-            # Add metabolic acidosis - decrease HCO3
-            new_hco3 = max(state.hco3 - (10 * effect_magnitude), 6)
-        elif secondary_disorder == Disorder.METABOLIC_ALKALOSIS:
-            # Add metabolic alkalosis - increase HCO3
-            new_hco3 = state.hco3 + (10 * effect_magnitude)
-        
-        new_ph = cls.calculate_ph(new_hco3, new_pco2)
-        new_be = cls.calculate_base_excess(new_ph, new_hco3)
-        
+        effect = SECONDARY_DISORDER_EFFECTS.get(secondary_disorder)
+        if effect is not None:
+            respiratory, change, floor = effect
+            magnitude = SECONDARY_EFFECT_MAGNITUDES.get(secondary_severity, 1.0)
+            value = (new_pco2 if respiratory else new_hco3) + change * magnitude
+            if floor is not None and floor > value:
+                value = floor
+            if respiratory:
+                new_pco2 = value
+            else:
+                new_hco3 = value
+        
+        new_ph = _ph(new_hco3, new_pco2)
+        new_be = _base_excess(new_ph, new_hco3)
+        
+        if in_place:
+            state.ph = new_ph
+            state.pco2 = new_pco2
+            state.hco3 = new_hco3
+            state.base_excess = new_be
+            state.compensation_status = _NO_COMPENSATION  # Mixed disorder
+            state.secondary_disorder = secondary_disorder
+            return state
+        
+        # Positional: the generated __init__ is several times slower with
+        # keyword arguments
         return AcidBaseState(
-            ph=new_ph,
-            pco2=new_pco2,
-            hco3=new_hco3,
-            base_excess=new_be,
-            primary_disorder=state.primary_disorder,
-            compensation_status=Compensation.NONE,  # Mixed disorder
-            secondary_disorder=secondary_disorder
+            new_ph,
+            new_pco2,
+            new_hco3,
+            new_be,
+            state.primary_disorder,
+            _NO_COMPENSATION,  # Mixed disorder
+            secondary_disorder,
         )
 
+
+# Expected-range function used by generate_for_disorder, keyed on
+# (disorder, duration is CHRONIC); subacute generation uses the acute rules
+_GENERATION_EXPECTED_RANGES = {
+    (Disorder.METABOLIC_ACIDOSIS, False): AcidBaseEngine.expected_pco2_metabolic_acidosis,
+    (Disorder.METABOLIC_ACIDOSIS, True): AcidBaseEngine.expected_pco2_metabolic_acidosis,
+    (Disorder.METABOLIC_ALKALOSIS, False): AcidBaseEngine.expected_pco2_metabolic_alkalosis,
+    (Disorder.METABOLIC_ALKALOSIS, True): AcidBaseEngine.expected_pco2_metabolic_alkalosis,
+    (Disorder.RESPIRATORY_ACIDOSIS, False):
+        AcidBaseEngine.expected_hco3_respiratory_acidosis_acute,
+    (Disorder.RESPIRATORY_ACIDOSIS, True):
+        AcidBaseEngine.expected_hco3_respiratory_acidosis_chronic,
+    (Disorder.RESPIRATORY_ALKALOSIS, False):
+        AcidBaseEngine.expected_hco3_respiratory_alkalosis_acute,
+    (Disorder.RESPIRATORY_ALKALOSIS, True):
+        AcidBaseEngine.expected_hco3_respiratory_alkalosis_chronic,
+}
+
+
+# typed=True keeps int and float baselines (and plain ints vs enum members)
+# in separate entries, so a cached result has the caller's value types
+@lru_cache(maxsize=1024, typed=True)
+def _generate_for_disorder(
+    disorder: Disorder,
+    severity: Severity,
+    compensation: Compensation,
+    duration: Duration,
+    baseline_pco2: float,
+    baseline_hco3: float,
+) -> tuple:
+    """AcidBaseState field values for AcidBaseEngine.generate_for_disorder."""
+    if disorder == _NORMAL:
+        return (7.40, baseline_pco2, baseline_hco3, 0.0, _NORMAL, _NO_COMPENSATION, None)
+    
+    rule = COMPENSATION_GENERATION_RULES.get(disorder)
+    if rule is None:
+        # Fallback to normal
+        ph = 7.40
+        pco2 = baseline_pco2
+        hco3 = baseline_hco3
+        assessed_range = None
+    else:
+        # Primary variable from severity, compensating variable from the
+        # expected range for the requested compensation
+        seed = DISORDER_SEED_VALUES[disorder, severity]
+        expected = _GENERATION_EXPECTED_RANGES[disorder, duration == _CHRONIC](seed)
+    
+        if disorder in METABOLIC_DISORDERS:
+            hco3 = seed
+            pco2 = _COMPENSATED_VALUE[compensation](baseline_pco2, expected, rule)
+        else:
+            pco2 = seed
+            hco3 = _COMPENSATED_VALUE[compensation](baseline_hco3, expected, rule)
+    
+        ph = _ph(hco3, pco2)
+    
+        # The primary variable is the seed, so the assessment below would
+        # recompute the same range - except for SUBACUTE respiratory
+        # disorders, which generate from the acute formula but are
+        # assessed against the chronic one
+        if disorder in METABOLIC_DISORDERS or duration != _SUBACUTE:
+            assessed_range = expected
+        else:
+            assessed_range = None
+    
+    # Calculate base excess
+    base_excess = _base_excess(ph, hco3)
+    
+    # Assess actual compensation and any secondary disorder
+    actual_compensation, secondary = AcidBaseEngine.assess_compensation(
+        disorder, ph, pco2, hco3, duration, assessed_range
+    )
+    
+    return (ph, pco2, hco3, base_excess, disorder, actual_compensation, secondary)
+
+
+@lru_cache(maxsize=None)
+def _generation_arrays() -> Mapping[str, Any]:
+    """
+    Generation tables as read-only NumPy arrays indexed by enum value.
+    
+    "rules" is indexed [disorder, chronic] and holds EXPECTED_RANGE_RULES
+    rows with a floor of -inf where there is none. Entries without a rule
+    (e.g. NORMAL) are NaN.
+    """
+    np = require_numpy()
+    n_disorders = max(Disorder) + 1
+    
+    seed = np.full((n_disorders, max(Severity) + 1), np.nan)
+    for (disorder, severity), value in DISORDER_SEED_VALUES.items():
+        seed[disorder, severity] = value
+    
+    rules = np.full((n_disorders, 2, 5), np.nan)
+    partial_bound = np.zeros(n_disorders, dtype=np.intp)
+    excessive_bound = np.zeros(n_disorders, dtype=np.intp)
+    excessive_offset = np.zeros(n_disorders)
+    for disorder, (partial, (excessive, offset)) in COMPENSATION_GENERATION_RULES.items():
+        for chronic, duration in enumerate((Duration.ACUTE, Duration.CHRONIC)):
+            slope, pivot, per, intercept, floor = _expected_range_rule(disorder, duration)
+            rules[disorder, chronic] = (
+                slope, pivot, per, intercept, -np.inf if floor is None else floor
+            )
+        partial_bound[disorder] = partial
+        excessive_bound[disorder] = excessive
+        excessive_offset[disorder] = offset
+    
+    # Secondary disorder when the compensating variable is below / above
+    # its expected range (pCO2 for metabolic, HCO3 for respiratory)
+    metabolic = np.zeros(n_disorders, dtype=bool)
+    metabolic[list(METABOLIC_DISORDERS)] = True
+    low_secondary = np.where(
+        metabolic, Disorder.RESPIRATORY_ALKALOSIS, Disorder.METABOLIC_ACIDOSIS
+    )
+    high_secondary = np.where(
+        metabolic, Disorder.RESPIRATORY_ACIDOSIS, Disorder.METABOLIC_ALKALOSIS
+    )
+    
+    arrays = {
+        "seed": seed,
+        "rules": rules,
+        "partial_bound": partial_bound,
+        "excessive_bound": excessive_bound,
+        "excessive_offset": excessive_offset,
+        "metabolic": metabolic,
+        "low_secondary": low_secondary,
+        "high_secondary": high_secondary,
+    }
+    for array in arrays.values():
+        array.flags.writeable = False
+    return MappingProxyType(arrays)
+
+
+def _expected_range_arrays(rules, x):
+    """_expected_range over arrays of rules (shape (..., 5)) and values."""
+    np = require_numpy()
+    slope, pivot, per, intercept, floor = np.moveaxis(rules, -1, 0)
+    expected = intercept + slope * ((x - pivot) / per)
+    return np.maximum(expected - 2, floor), expected + 2
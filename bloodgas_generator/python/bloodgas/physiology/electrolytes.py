@@ -5,10 +5,13 @@ Implements anion gap calculations, delta-delta analysis,
 osmolar gap, and electrolyte interactions.
 """
 
+import math
 from dataclasses import dataclass
-from typing import Optional, Tuple, List
+from typing import Any, Iterator, Optional, Tuple, List
 from enum import Enum
 
+from bloodgas._numpy import require_numpy
+
 
 # Normal ranges
 NORMAL_SODIUM = (136.0, 145.0)
@@ -20,6 +23,15 @@ NORMAL_ALBUMIN = (3.5, 5.0)
 NORMAL_ANION_GAP = (8.0, 12.0)  # Without K+
 NORMAL_OSMOLALITY = (280.0, 295.0)
 
+# Range bounds used by the scalar hot paths, bound as plain module globals
+# so comparisons skip the tuple subscript
+_SODIUM_LOW, _SODIUM_HIGH = NORMAL_SODIUM
+_POTASSIUM_LOW, _POTASSIUM_HIGH = NORMAL_POTASSIUM
+
+# mg/dL to mmol/L conversion factors for osmolality, as multipliers
+GLUCOSE_MG_DL_TO_MMOL = 1 / 18
+BUN_MG_DL_TO_MMOL = 1 / 2.8
+
 
 class AnionGapCategory(Enum):
     """Categorization of anion gap disorders."""
@@ -28,7 +40,60 @@ class AnionGapCategory(Enum):
     LOW = "low"
 
 
-@dataclass
+# Categories in code order, for decoding the int codes of the batch paths
+ANION_GAP_CATEGORIES = tuple(AnionGapCategory)
+
+# Generated anion gap for an elevated-gap acidosis, by cause
+ELEVATED_ANION_GAP_BY_CAUSE = {
+    "dka": 24.0,     # Typical DKA
+    "lactic": 20.0,  # Lactic acidosis
+    "renal": 18.0,   # Renal failure
+    "toxic": 28.0,   # Toxic ingestion
+}
+DEFAULT_ELEVATED_ANION_GAP = 22.0  # Generic elevation
+
+# Teaching lists returned by ElectrolyteEngine.get_anion_gap_causes()
+ELEVATED_ANION_GAP_CAUSES: Tuple[str, ...] = (
+    "MUDPILES mnemonic:",
+    "- Methanol",
+    "- Uremia (renal failure)",
+    "- DKA/Diabetic ketoacidosis",
+    "- Propylene glycol",
+    "- INH/Iron/Isoniazid",
+    "- Lactic acidosis",
+    "- Ethylene glycol",
+    "- Salicylates",
+    "",
+    "Also: Alcoholic ketoacidosis, starvation ketosis",
+)
+LOW_ANION_GAP_CAUSES: Tuple[str, ...] = (
+    "Low anion gap causes:",
+    "- Hypoalbuminemia (most common)",
+    "- Multiple myeloma (cationic paraproteins)",
+    "- Lithium toxicity",
+    "- Severe hypercalcemia",
+    "- Severe hypermagnesemia",
+    "- Laboratory error",
+)
+
+
+def _gap_bundle(anion_gap: float, hco3: float, albumin: float) -> Tuple[float, float, float]:
+    """
+    Albumin-corrected AG, delta gap and delta ratio in one pass.
+    
+    Same arithmetic as correct_anion_gap_for_albumin, calculate_delta_gap
+    and calculate_delta_ratio with their default normals, sharing delta AG.
+    """
+    corrected_ag = anion_gap + 2.5 * (4.0 - albumin)
+    delta_gap = corrected_ag - 12.0
+    delta_hco3 = 24.0 - hco3
+    
+    if delta_hco3 > 0:
+        return corrected_ag, delta_gap, delta_gap / delta_hco3
+    return corrected_ag, delta_gap, math.inf if delta_gap > 4 else 1.0
+
+
+@dataclass(slots=True)
 class ElectrolyteState:
     """Represents the electrolyte state."""
     sodium: float
@@ -54,6 +119,74 @@ class ElectrolyteState:
     osmolar_gap: Optional[float] = None  # If measured osmolality provided
 
 
+@dataclass(slots=True)
+class ElectrolyteBatch:
+    """
+    Struct-of-arrays counterpart of ElectrolyteState for bulk generation.
+    
+    Each field holds a NumPy array with one entry per case.
+    anion_gap_category holds int8 indices into ANION_GAP_CATEGORIES.
+    Produced by ElectrolyteEngine.generate_electrolytes_batch().
+    """
+    sodium: Any
+    potassium: Any
+    chloride: Any
+    glucose: Any
+    lactate: Any
+    albumin: Any
+    anion_gap: Any
+    corrected_anion_gap: Any
+    delta_gap: Any
+    delta_ratio: Any
+    anion_gap_category: Any
+    has_hidden_non_gap_acidosis: Any
+    has_hidden_metabolic_alkalosis: Any
+    calculated_osmolality: Any
+    
+    def __len__(self) -> int:
+        return self.sodium.size
+    
+    def state(self, index) -> ElectrolyteState:
+        """Build an ElectrolyteState for a single entry."""
+        return ElectrolyteState(
+            float(self.sodium[index]),
+            float(self.potassium[index]),
+            float(self.chloride[index]),
+            float(self.glucose[index]),
+            float(self.lactate[index]),
+            float(self.albumin[index]),
+            float(self.anion_gap[index]),
+            float(self.corrected_anion_gap[index]),
+            float(self.delta_gap[index]),
+            float(self.delta_ratio[index]),
+            ANION_GAP_CATEGORIES[self.anion_gap_category[index]],
+            bool(self.has_hidden_non_gap_acidosis[index]),
+            bool(self.has_hidden_metabolic_alkalosis[index]),
+            float(self.calculated_osmolality[index]),
+        )
+    
+    def states(self) -> Iterator[ElectrolyteState]:
+        """Lazily build an ElectrolyteState for every entry, in flattened order."""
+        columns = zip(*(
+            array.ravel().tolist()
+            for array in (
+                self.sodium, self.potassium, self.chloride, self.glucose,
+                self.lactate, self.albumin, self.anion_gap,
+                self.corrected_anion_gap, self.delta_gap, self.delta_ratio,
+            )
+        ))
+        flags = zip(
+            self.anion_gap_category.ravel().tolist(),
+            self.has_hidden_non_gap_acidosis.ravel().tolist(),
+            self.has_hidden_metabolic_alkalosis.ravel().tolist(),
+            self.calculated_osmolality.ravel().tolist(),
+        )
+        for values, (category, non_gap, met_alk, osmolality) in zip(columns, flags):
+            yield ElectrolyteState(
+                *values, ANION_GAP_CATEGORIES[category], non_gap, met_alk, osmolality
+            )
+
+
 class ElectrolyteEngine:
     """
     Engine for electrolyte calculations and anion gap analysis.
@@ -136,13 +269,76 @@ class ElectrolyteEngine:
         delta_ag = anion_gap - normal_ag
         delta_hco3 = normal_hco3 - hco3
         
-        if delta_hco3 <= 0:
-            # HCO3 is normal or high - can't calculate meaningful ratio
-            if delta_ag > 4:  # Significant AG elevation
-                return float('inf')  # Indicates metabolic alkalosis
-            return 1.0
+        if delta_hco3 > 0:
+            return delta_ag / delta_hco3
+        
+        # HCO3 is normal or high - can't calculate meaningful ratio;
+        # a significant AG elevation (> 4) indicates metabolic alkalosis
+        return math.inf if delta_ag > 4 else 1.0
+    
+    @classmethod
+    def calculate_anion_gap_array(
+        cls,
+        sodium,
+        chloride,
+        hco3,
+        include_potassium: bool = False,
+        potassium=4.0
+    ):
+        """
+        Vectorized calculate_anion_gap for NumPy arrays.
+        
+        Returns:
+            Array of anion gaps
+        """
+        np = require_numpy()
+        return cls.calculate_anion_gap(
+            np.asarray(sodium, dtype=float),
+            np.asarray(chloride, dtype=float),
+            np.asarray(hco3, dtype=float),
+            include_potassium,
+            np.asarray(potassium, dtype=float),
+        )
+    
+    @classmethod
+    def correct_anion_gap_for_albumin_array(cls, anion_gap, albumin, normal_albumin=4.0):
+        """
+        Vectorized correct_anion_gap_for_albumin for NumPy arrays.
         
-        return delta_ag / delta_hco3
+        Returns:
+            Array of albumin-corrected anion gaps
+        """
+        np = require_numpy()
+        return cls.correct_anion_gap_for_albumin(
+            np.asarray(anion_gap, dtype=float),
+            np.asarray(albumin, dtype=float),
+            normal_albumin,
+        )
+    
+    @classmethod
+    def calculate_delta_ratio_array(
+        cls,
+        anion_gap,
+        hco3,
+        normal_ag: float = 12.0,
+        normal_hco3: float = 24.0
+    ):
+        """
+        Vectorized calculate_delta_ratio for NumPy arrays.
+        
+        Where HCO3 is not below normal the ratio is inf for a significant
+        AG elevation (> 4) and 1.0 otherwise, as in the scalar method.
+        
+        Returns:
+            Array of delta ratios
+        """
+        np = require_numpy()
+        delta_ag = np.asarray(anion_gap, dtype=float) - normal_ag
+        delta_hco3 = normal_hco3 - np.asarray(hco3, dtype=float)
+        
+        delta_ag, delta_hco3 = np.broadcast_arrays(delta_ag, delta_hco3)
+        undefined = np.where(delta_ag > 4, np.inf, 1.0)
+        return np.divide(delta_ag, delta_hco3, out=undefined, where=delta_hco3 > 0)
     
     @classmethod
     def analyze_delta_ratio(cls, delta_ratio: float) -> Tuple[bool, bool]:
@@ -169,7 +365,7 @@ class ElectrolyteEngine:
         
         Normal: 280-295 mOsm/kg
         """
-        return (2 * sodium) + (glucose / 18) + (bun / 2.8)
+        return (2 * sodium) + (glucose * GLUCOSE_MG_DL_TO_MMOL) + (bun * BUN_MG_DL_TO_MMOL)
     
     @classmethod
     def calculate_osmolar_gap(
@@ -275,42 +471,32 @@ class ElectrolyteEngine:
         lactate = lactate_target if lactate_target else 1.0
         
         # Calculate anion gap and chloride
-        if target_anion_gap is not None:
-            anion_gap = target_anion_gap
-        elif elevated_anion_gap:
-            # Generate elevated AG based on cause
-            if anion_gap_cause == "dka":
-                anion_gap = 24.0  # Typical DKA
-            elif anion_gap_cause == "lactic":
-                anion_gap = 20.0  # Lactic acidosis
-            elif anion_gap_cause == "renal":
-                anion_gap = 18.0  # Renal failure
-            elif anion_gap_cause == "toxic":
-                anion_gap = 28.0  # Toxic ingestion
-            else:
-                anion_gap = 22.0  # Generic elevation
-        else:
-            anion_gap = 10.0  # Normal
-        
-        # Calculate chloride from anion gap equation: Cl = Na - AG - HCO3
         if chloride_target is not None:
+            # Given chloride determines the actual AG
             chloride = chloride_target
-            # Recalculate actual AG
             anion_gap = sodium - (chloride + hco3)
         else:
+            if target_anion_gap is not None:
+                anion_gap = target_anion_gap
+            elif elevated_anion_gap:
+                # Generate elevated AG based on cause
+                anion_gap = ELEVATED_ANION_GAP_BY_CAUSE.get(
+                    anion_gap_cause, DEFAULT_ELEVATED_ANION_GAP
+                )
+            else:
+                anion_gap = 10.0  # Normal
+            
+            # Calculate chloride from anion gap equation: Cl = Na - AG - HCO3
             chloride = sodium - anion_gap - hco3
             # Ensure chloride is in reasonable range
-            chloride = max(min(chloride, 120), 85)
+            chloride = 85 if chloride < 85 else (120 if chloride > 120 else chloride)
         
-        # Correct anion gap for albumin
-        corrected_ag = cls.correct_anion_gap_for_albumin(anion_gap, albumin)
-        
-        # Calculate delta values
-        delta_gap = cls.calculate_delta_gap(corrected_ag)
-        delta_ratio = cls.calculate_delta_ratio(corrected_ag, hco3)
+        # Correct anion gap for albumin and calculate delta values
+        corrected_ag, delta_gap, delta_ratio = _gap_bundle(anion_gap, hco3, albumin)
         
         # Analyze for hidden disorders
-        has_non_gap, has_met_alk = cls.analyze_delta_ratio(delta_ratio)
+        has_non_gap = delta_ratio < 1.0
+        has_met_alk = delta_ratio > 2.0
         
         # Categorize anion gap
         if corrected_ag > 14:
@@ -341,40 +527,118 @@ class ElectrolyteEngine:
         )
     
     @classmethod
-    def get_anion_gap_causes(cls, elevated: bool = True) -> List[str]:
+    def generate_electrolytes_batch(
+        cls,
+        hco3,
+        ph=7.40,
+        elevated_anion_gap=False,
+        target_anion_gap=None,
+        anion_gap_cause: Optional[str] = None,
+        sodium_target=None,
+        potassium_target=None,
+        chloride_target=None,
+        glucose_target=None,
+        lactate_target=None,
+        albumin=4.0,
+    ) -> ElectrolyteBatch:
+        """
+        Vectorized generate_electrolytes over arrays of cases.
+        
+        Arguments are as for generate_electrolytes but may be NumPy arrays,
+        which broadcast against hco3. anion_gap_cause applies to every
+        case. A target of 0 falls back to its default, as in the scalar
+        method; NaN entries of target_anion_gap and chloride_target mean
+        "not given" for that case.
+        
+        Returns:
+            ElectrolyteBatch with one entry per case
+        """
+        np = require_numpy()
+        hco3 = np.asarray(hco3, dtype=float)
+        
+        def target(value, default):
+            if value is None:
+                return np.full_like(hco3, default)
+            value = np.asarray(value, dtype=float)
+            return np.broadcast_to(np.where(value != 0, value, default), hco3.shape)
+        
+        def optional(value):
+            if value is None:
+                return np.full_like(hco3, np.nan)
+            return np.broadcast_to(np.asarray(value, dtype=float), hco3.shape)
+        
+        sodium = target(sodium_target, 140.0)
+        potassium = target(potassium_target, 4.0)
+        glucose = target(glucose_target, 95.0)
+        lactate = target(lactate_target, 1.0)
+        albumin = np.broadcast_to(np.asarray(albumin, dtype=float), hco3.shape)
+        
+        # Anion gap: explicit target, else elevated by cause, else normal
+        target_ag = optional(target_anion_gap)
+        elevated_ag = ELEVATED_ANION_GAP_BY_CAUSE.get(anion_gap_cause, DEFAULT_ELEVATED_ANION_GAP)
+        anion_gap = np.where(
+            np.isnan(target_ag),
+            np.where(elevated_anion_gap, elevated_ag, 10.0),
+            target_ag,
+        )
+        
+        # Chloride from Cl = Na - AG - HCO3, unless given (then AG follows from it)
+        chloride_given = optional(chloride_target)
+        has_chloride = ~np.isnan(chloride_given)
+        chloride = np.where(
+            has_chloride, chloride_given, np.clip(sodium - anion_gap - hco3, 85, 120)
+        )
+        anion_gap = np.where(has_chloride, sodium - (chloride + hco3), anion_gap)
+        
+        # Corrected AG, delta gap and delta ratio sharing one delta AG array
+        corrected_ag = anion_gap + 2.5 * (4.0 - albumin)
+        delta_gap = corrected_ag - 12.0
+        delta_hco3 = 24.0 - hco3
+        delta_ratio = np.divide(
+            delta_gap, delta_hco3,
+            out=np.where(delta_gap > 4, np.inf, 1.0), where=delta_hco3 > 0
+        )
+        
+        category = np.select(
+            [corrected_ag > 14, corrected_ag < 6],
+            [
+                ANION_GAP_CATEGORIES.index(AnionGapCategory.ELEVATED),
+                ANION_GAP_CATEGORIES.index(AnionGapCategory.LOW),
+            ],
+            default=ANION_GAP_CATEGORIES.index(AnionGapCategory.NORMAL),
+        ).astype(np.int8)
+        
+        return ElectrolyteBatch(
+            sodium, potassium, chloride, glucose, lactate, albumin,
+            anion_gap, corrected_ag, delta_gap, delta_ratio,
+            category, delta_ratio < 1.0, delta_ratio > 2.0,
+            cls.calculate_osmolality(sodium, glucose),
+        )
+    
+    @classmethod
+    def get_anion_gap_causes(cls, elevated: bool = True) -> Tuple[str, ...]:
         """
         Get common causes of elevated or low anion gap.
         """
-        if elevated:
-            return [
-                "MUDPILES mnemonic:",
-                "- Methanol",
-                "- Uremia (renal failure)",
-                "- DKA/Diabetic ketoacidosis",
-                "- Propylene glycol",
-                "- INH/Iron/Isoniazid",
-                "- Lactic acidosis",
-                "- Ethylene glycol",
-                "- Salicylates",
-                "",
-                "Also: Alcoholic ketoacidosis, starvation ketosis"
-            ]
-        else:
-            return [
-                "Low anion gap causes:",
-                "- Hypoalbuminemia (most common)",
-                "- Multiple myeloma (cationic paraproteins)",
-                "- Lithium toxicity",
-                "- Severe hypercalcemia",
-                "- Severe hypermagnesemia",
-                "- Laboratory error"
-            ]
+        return ELEVATED_ANION_GAP_CAUSES if elevated else LOW_ANION_GAP_CAUSES
     
     @classmethod
     def interpret_electrolytes(cls, state: ElectrolyteState, hco3: float) -> List[str]:
         """
         Generate interpretation points for electrolyte analysis.
         """
+        # Most generated panels have nothing to report; test that up front
+        # instead of walking every section
+        if (
+            state.anion_gap_category != AnionGapCategory.ELEVATED
+            and not state.has_hidden_non_gap_acidosis
+            and not state.has_hidden_metabolic_alkalosis
+            and _SODIUM_LOW <= state.sodium <= _SODIUM_HIGH
+            and _POTASSIUM_LOW <= state.potassium <= _POTASSIUM_HIGH
+            and state.glucose <= 250
+        ):
+            return []
+        
         points = []
         
         # Anion gap analysis
@@ -396,19 +660,19 @@ class ElectrolyteEngine:
                          "or pre-existing elevated HCO3")
         
         # Sodium analysis
-        if state.sodium < NORMAL_SODIUM[0]:
+        if state.sodium < _SODIUM_LOW:
             if state.glucose > 200:
                 corrected_na = cls.correct_sodium_for_glucose(state.sodium, state.glucose)
                 points.append(f"Hyponatremia - corrected for hyperglycemia: {corrected_na:.0f} mEq/L")
             else:
                 points.append(f"Hyponatremia ({state.sodium:.0f} mEq/L)")
-        elif state.sodium > NORMAL_SODIUM[1]:
+        elif state.sodium > _SODIUM_HIGH:
             points.append(f"Hypernatremia ({state.sodium:.0f} mEq/L)")
         
         # Potassium analysis
-        if state.potassium < NORMAL_POTASSIUM[0]:
+        if state.potassium < _POTASSIUM_LOW:
             points.append(f"Hypokalemia ({state.potassium:.1f} mEq/L)")
-        elif state.potassium > NORMAL_POTASSIUM[1]:
+        elif state.potassium > _POTASSIUM_HIGH:
             points.append(f"Hyperkalemia ({state.potassium:.1f} mEq/L)")
         
         # Glucose analysis
@@ -416,4 +680,34 @@ class ElectrolyteEngine:
             points.append(f"Significant hyperglycemia ({state.glucose:.0f} mg/dL)")
         
         return points
+    
+    @classmethod
+    def interpret_electrolytes_batch(cls, batch: ElectrolyteBatch, hco3) -> List[List[str]]:
+        """
+        interpret_electrolytes for every entry of an ElectrolyteBatch.
+        
+        Cases with nothing to report are found with array masks and get an
+        empty list; only the rest are materialized as ElectrolyteState.
+        
+        Returns:
+            One list of interpretation points per entry, in flattened order
+        """
+        np = require_numpy()
+        hco3 = np.broadcast_to(np.asarray(hco3, dtype=float), batch.sodium.shape).ravel()
+        elevated = ANION_GAP_CATEGORIES.index(AnionGapCategory.ELEVATED)
+        
+        reportable = (
+            (batch.anion_gap_category == elevated)
+            | batch.has_hidden_non_gap_acidosis
+            | batch.has_hidden_metabolic_alkalosis
+            | (batch.sodium < NORMAL_SODIUM[0]) | (batch.sodium > NORMAL_SODIUM[1])
+            | (batch.potassium < NORMAL_POTASSIUM[0]) | (batch.potassium > NORMAL_POTASSIUM[1])
+            | (batch.glucose > 250)
+        ).ravel()
+        
+        points: List[List[str]] = [[] for _ in range(reportable.size)]
+        for index in np.flatnonzero(reportable).tolist():
+            state = batch.state(np.unravel_index(index, batch.sodium.shape))
+            points[index] = cls.interpret_electrolytes(state, float(hco3[index]))
+        return points
 
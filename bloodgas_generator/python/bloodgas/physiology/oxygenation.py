@@ -7,7 +7,10 @@ oxygen-hemoglobin dissociation curve, and P/F ratio.
 
 import math
 from dataclasses import dataclass
-from typing import Tuple, Optional
+from functools import lru_cache
+from typing import Any, Iterator, Tuple, Optional
+
+from bloodgas._numpy import require_numpy
 
 
 # Constants
@@ -21,8 +24,92 @@ NORMAL_SAO2 = (95.0, 100.0)
 NORMAL_AA_GRADIENT_YOUNG = (5.0, 15.0)  # Young adult
 NORMAL_PF_RATIO = 400  # Normal >400
 
+# Lower PaO2 bound for the scalar generator, bound as a plain module global
+_PAO2_LOW = NORMAL_PAO2[0]
+
+# Berlin ARDS classes from lowest to highest P/F ratio, and the lower P/F
+# bound of each class after the first
+ARDS_CLASSES = ("Severe ARDS", "Moderate ARDS", "Mild ARDS", "None/Normal")
+ARDS_PF_THRESHOLDS = (100, 200, 300)
+
+# Age-adjusted expected A-a gradient (Age / 4 + 4), precomputed for whole-year ages
+EXPECTED_AA_GRADIENT_BY_AGE = {age: (age / 4) + 4 for age in range(121)}
+
+# Hill coefficient of hemoglobin
+HILL_N = 2.7
+INV_HILL_N = 1 / HILL_N
+
+
+# Dissociation-curve kernels. Plain functions over module constants, so
+# generate_oxygenation calls them without classmethod dispatch; the
+# OxygenationEngine methods wrap them.
+
+def _alveolar_po2(
+    fio2: float,
+    paco2: float,
+    atmospheric_pressure: float = ATMOSPHERIC_PRESSURE_SEA_LEVEL,
+    rq: float = RESPIRATORY_QUOTIENT
+) -> float:
+    """PAO2 = FiO2 × (Patm - PH2O) - (PaCO2 / RQ)"""
+    return fio2 * (atmospheric_pressure - WATER_VAPOR_PRESSURE) - (paco2 / rq)
+
+
+def _expected_aa_gradient(age: int) -> float:
+    """Age / 4 + 4, looked up for whole-year ages."""
+    expected = EXPECTED_AA_GRADIENT_BY_AGE.get(age)
+    if expected is None:
+        expected = (age / 4) + 4
+    return expected
+
+
+def _aa_gradient_elevated(aa_gradient, expected_aa_gradient):
+    """A-a gradient above the expected value; also works on NumPy arrays."""
+    # Generally allow ~5 mmHg above expected as normal variation
+    return aa_gradient > expected_aa_gradient + 5
+
+
+def _shifted_p50(ph, temperature, pco2, dpg_2_3):
+    """Unclamped P50; plain arithmetic so it also works on NumPy arrays."""
+    base_p50 = 27.0  # Normal P50
+    
+    # pH effect (Bohr effect) - approximately 0.5 mmHg per 0.01 pH unit
+    ph_effect = (7.40 - ph) * 5.0  # Positive = right shift
+    
+    # Temperature effect - approximately 1.5 mmHg per degree C
+    temp_effect = (temperature - 37.0) * 1.5
+    
+    # CO2 effect (part of Bohr effect) - small direct effect
+    co2_effect = (pco2 - 40.0) * 0.05
+    
+    # 2,3-DPG effect
+    dpg_effect = (dpg_2_3 - 1.0) * 5.0
+    
+    return base_p50 + ph_effect + temp_effect + co2_effect + dpg_effect
+
+
+def _p50(ph: float, temperature: float, pco2: float, dpg_2_3: float) -> float:
+    """P50 clamped to 15-40 mmHg."""
+    p50 = _shifted_p50(ph, temperature, pco2, dpg_2_3)
+    return 15 if p50 < 15 else (40 if p50 > 40 else p50)
 
-@dataclass
+
+# Generated cases reuse the cached acid-base state for a disorder, so the same
+# (PaO2, pH, temperature, PaCO2) tuple recurs often; cache on exact inputs
+@lru_cache(maxsize=1024)
+def _sao2(pao2: float, ph: float, temperature: float, pco2: float, dpg_2_3: float) -> float:
+    """Hill equation: SO2 = PO2^n / (P50^n + PO2^n), as a percentage."""
+    if pao2 <= 0:
+        return 0.0
+    
+    p50 = _p50(ph, temperature, pco2, dpg_2_3)
+    pao2_n = pao2 ** HILL_N
+    sao2 = 100 * pao2_n / ((p50 ** HILL_N) + pao2_n)
+    
+    # Clamp to physiological range
+    return 0 if sao2 < 0 else (100 if sao2 > 100 else sao2)
+
+
+@dataclass(slots=True)
 class OxygenationState:
     """Represents the oxygenation state."""
     pao2: float  # Arterial PO2 in mmHg
@@ -35,6 +122,53 @@ class OxygenationState:
     aa_gradient_elevated: bool
 
 
+@dataclass(slots=True)
+class OxygenationBatch:
+    """
+    Struct-of-arrays counterpart of OxygenationState for bulk generation.
+    
+    Each field holds a NumPy array with one entry per case. Produced by
+    OxygenationEngine.generate_oxygenation_batch().
+    """
+    pao2: Any
+    sao2: Any
+    fio2: Any
+    pao2_fio2_ratio: Any
+    aa_gradient: Any
+    expected_aa_gradient: Any
+    pao2_normal: Any
+    aa_gradient_elevated: Any
+    
+    def __len__(self) -> int:
+        return self.pao2.size
+    
+    def state(self, index) -> OxygenationState:
+        """Build an OxygenationState for a single entry."""
+        return OxygenationState(
+            float(self.pao2[index]),
+            float(self.sao2[index]),
+            float(self.fio2[index]),
+            float(self.pao2_fio2_ratio[index]),
+            float(self.aa_gradient[index]),
+            float(self.expected_aa_gradient[index]),
+            bool(self.pao2_normal[index]),
+            bool(self.aa_gradient_elevated[index]),
+        )
+    
+    def states(self) -> Iterator[OxygenationState]:
+        """Lazily build an OxygenationState for every entry, in flattened order."""
+        columns = zip(*(
+            array.ravel().tolist()
+            for array in (
+                self.pao2, self.sao2, self.fio2, self.pao2_fio2_ratio,
+                self.aa_gradient, self.expected_aa_gradient,
+                self.pao2_normal, self.aa_gradient_elevated,
+            )
+        ))
+        for values in columns:
+            yield OxygenationState(*values)
+
+
 class OxygenationEngine:
     """
     Engine for oxygenation calculations.
@@ -61,13 +195,7 @@ class OxygenationEngine:
         
         Simplified: PAO2 = FiO2 × (Patm - 47) - (PaCO2 × 1.25)
         """
-        # Inspired PO2
-        pio2 = fio2 * (atmospheric_pressure - WATER_VAPOR_PRESSURE)
-        
-        # Alveolar PO2
-        pao2 = pio2 - (paco2 / rq)
-        
-        return pao2
+        return _alveolar_po2(fio2, paco2, atmospheric_pressure, rq)
     
     @classmethod
     def calculate_aa_gradient(
@@ -87,8 +215,7 @@ class OxygenationEngine:
         - Shunt
         - Diffusion impairment
         """
-        pao2_alveolar = cls.calculate_alveolar_po2(fio2, paco2, atmospheric_pressure)
-        return pao2_alveolar - pao2_arterial
+        return _alveolar_po2(fio2, paco2, atmospheric_pressure) - pao2_arterial
     
     @classmethod
     def expected_aa_gradient(cls, age: int) -> float:
@@ -101,14 +228,12 @@ class OxygenationEngine:
         
         Normal upper limit approximately: Age/4 + 4 (some use Age/3 + 3)
         """
-        return (age / 4) + 4
+        return _expected_aa_gradient(age)
     
     @classmethod
     def is_aa_gradient_elevated(cls, aa_gradient: float, age: int) -> bool:
         """Check if A-a gradient is elevated for patient's age."""
-        expected = cls.expected_aa_gradient(age)
-        # Generally allow ~5 mmHg above expected as normal variation
-        return aa_gradient > (expected + 5)
+        return _aa_gradient_elevated(aa_gradient, _expected_aa_gradient(age))
     
     @classmethod
     def calculate_pf_ratio(cls, pao2: float, fio2: float) -> float:
@@ -125,6 +250,22 @@ class OxygenationEngine:
             raise ValueError("FiO2 must be positive")
         return pao2 / fio2
     
+    @classmethod
+    def calculate_pf_ratio_array(cls, pao2, fio2):
+        """
+        Vectorized calculate_pf_ratio for NumPy arrays.
+        
+        FiO2 is validated once for the whole array rather than per entry.
+        
+        Returns:
+            Array of P/F ratios
+        """
+        np = require_numpy()
+        fio2 = np.asarray(fio2, dtype=float)
+        if (fio2 <= 0).any():
+            raise ValueError("FiO2 must be positive")
+        return np.divide(pao2, fio2)
+    
     @classmethod
     def classify_ards(cls, pf_ratio: float) -> str:
         """
@@ -140,6 +281,23 @@ class OxygenationEngine:
         else:
             return "Severe ARDS"
     
+    @classmethod
+    def classify_ards_array(cls, pf_ratio):
+        """
+        Vectorized classify_ards for NumPy arrays.
+        
+        Returns:
+            Array of indices into ARDS_CLASSES
+        """
+        np = require_numpy()
+        pf_ratio = np.asarray(pf_ratio, dtype=float)
+        
+        # Count the thresholds reached; NaN reaches none (Severe), as in classify_ards
+        index = np.zeros(pf_ratio.shape, dtype=np.int8)
+        for threshold in ARDS_PF_THRESHOLDS:
+            index += pf_ratio >= threshold
+        return index
+    
     @classmethod
     def calculate_sao2(
         cls,
@@ -158,20 +316,32 @@ class OxygenationEngine:
         
         The curve is sigmoidal with P50 (PO2 at 50% saturation) normally ~27 mmHg.
         """
-        # Calculate effective P50 considering curve shifts
-        p50 = cls.calculate_p50(ph, temperature, pco2, dpg_2_3)
-        
-        # Hill equation: SO2 = PO2^n / (P50^n + PO2^n)
-        # n (Hill coefficient) is approximately 2.7 for hemoglobin
-        n = 2.7
+        return _sao2(pao2, ph, temperature, pco2, dpg_2_3)
+    
+    @classmethod
+    def calculate_sao2_array(
+        cls,
+        pao2,
+        ph,
+        temperature: float = 37.0,
+        pco2: float = 40.0,
+        dpg_2_3: float = 1.0
+    ):
+        """
+        Vectorized calculate_sao2 for NumPy arrays of PaO2 and pH.
         
-        if pao2 <= 0:
-            return 0.0
+        Returns:
+            Array of oxygen saturations as percentages
+        """
+        np = require_numpy()
+        pao2 = np.maximum(np.asarray(pao2, dtype=float), 0.0)
+        ph = np.asarray(ph, dtype=float)
+        p50 = np.clip(_shifted_p50(ph, temperature, pco2, dpg_2_3), 15, 40)
         
-        sao2 = 100 * (pao2 ** n) / ((p50 ** n) + (pao2 ** n))
+        pao2_n = pao2 ** HILL_N
+        sao2 = 100 * pao2_n / ((p50 ** HILL_N) + pao2_n)
         
-        # Clamp to physiological range
-        return min(max(sao2, 0), 100)
+        return np.clip(sao2, 0, 100)
     
     @classmethod
     def calculate_p50(
@@ -199,24 +369,7 @@ class OxygenationEngine:
         - Decreased 2,3-DPG
         - CO poisoning, fetal Hb
         """
-        base_p50 = 27.0  # Normal P50
-        
-        # pH effect (Bohr effect) - approximately 0.5 mmHg per 0.01 pH unit
-        ph_effect = (7.40 - ph) * 5.0  # Positive = right shift
-        
-        # Temperature effect - approximately 1.5 mmHg per degree C
-        temp_effect = (temperature - 37.0) * 1.5
-        
-        # CO2 effect (part of Bohr effect) - small direct effect
-        co2_effect = (pco2 - 40.0) * 0.05
-        
-        # 2,3-DPG effect
-        dpg_effect = (dpg_2_3 - 1.0) * 5.0
-        
-        p50 = base_p50 + ph_effect + temp_effect + co2_effect + dpg_effect
-        
-        # Clamp to reasonable range
-        return max(min(p50, 40), 15)
+        return _p50(ph, temperature, pco2, dpg_2_3)
     
     @classmethod
     def calculate_pao2_from_sao2(
@@ -235,12 +388,11 @@ class OxygenationEngine:
         if sao2 <= 0:
             return 0.0
         
-        p50 = cls.calculate_p50(ph, temperature)
-        n = 2.7
+        p50 = _p50(ph, temperature, 40.0, 1.0)
         
         # Inverse Hill equation: PO2 = P50 × (SO2 / (100 - SO2))^(1/n)
         fraction = sao2 / (100 - sao2)
-        pao2 = p50 * (fraction ** (1/n))
+        pao2 = p50 * (fraction ** INV_HILL_N)
         
         return pao2
     
@@ -263,7 +415,7 @@ class OxygenationEngine:
         This is the primary generation method for oxygenation.
         """
         # Calculate expected A-a gradient for this age
-        expected_aa = cls.expected_aa_gradient(age)
+        expected_aa = _expected_aa_gradient(age)
         
         # Determine actual A-a gradient
         if target_aa_gradient is not None:
@@ -276,7 +428,7 @@ class OxygenationEngine:
             aa_gradient = expected_aa
         
         # Calculate alveolar PO2
-        pao2_alveolar = cls.calculate_alveolar_po2(fio2, paco2, atmospheric_pressure)
+        pao2_alveolar = _alveolar_po2(fio2, paco2, atmospheric_pressure)
         
         # Calculate arterial PO2 from A-a gradient
         pao2 = pao2_alveolar - aa_gradient
@@ -292,13 +444,13 @@ class OxygenationEngine:
         pao2 = max(pao2, 30)  # Floor at 30 mmHg (near-death severe hypoxemia)
         
         # Calculate SaO2
-        sao2 = cls.calculate_sao2(pao2, ph, temperature, paco2)
+        sao2 = _sao2(pao2, ph, temperature, paco2, 1.0)
         
         # Calculate P/F ratio
         pf_ratio = cls.calculate_pf_ratio(pao2, fio2)
         
         # Determine if values are normal
-        pao2_normal = pao2 >= NORMAL_PAO2[0] * (fio2 / 0.21)  # Adjust for FiO2
+        pao2_normal = pao2 >= _PAO2_LOW * (fio2 / 0.21)  # Adjust for FiO2
         
         return OxygenationState(
             pao2=pao2,
@@ -308,7 +460,70 @@ class OxygenationEngine:
             aa_gradient=aa_gradient,
             expected_aa_gradient=expected_aa,
             pao2_normal=pao2_normal,
-            aa_gradient_elevated=aa_gradient > expected_aa + 5
+            aa_gradient_elevated=_aa_gradient_elevated(aa_gradient, expected_aa)
+        )
+    
+    @classmethod
+    def generate_oxygenation_batch(
+        cls,
+        fio2=0.21,
+        paco2=40.0,
+        age=40,
+        aa_gradient_elevated=False,
+        target_aa_gradient=None,
+        shunt_fraction=0.0,
+        ph=7.40,
+        temperature=37.0,
+        atmospheric_pressure: float = ATMOSPHERIC_PRESSURE_SEA_LEVEL
+    ) -> OxygenationBatch:
+        """
+        Vectorized generate_oxygenation over arrays of cases.
+        
+        Arguments are as for generate_oxygenation but may be NumPy arrays,
+        which broadcast against each other. NaN entries of
+        target_aa_gradient mean "not given" for that case.
+        
+        Returns:
+            OxygenationBatch with one entry per case
+        """
+        np = require_numpy()
+        fio2, paco2, age, elevated, shunt_fraction, ph, temperature = np.broadcast_arrays(
+            *(
+                np.asarray(value, dtype=float)
+                for value in (
+                    fio2, paco2, age, aa_gradient_elevated, shunt_fraction, ph, temperature
+                )
+            )
+        )
+        expected_aa = (age / 4) + 4
+        aa_gradient = np.where(elevated != 0, expected_aa + 20, expected_aa)
+        if target_aa_gradient is not None:
+            target_aa = np.asarray(target_aa_gradient, dtype=float)
+            aa_gradient = np.where(np.isnan(target_aa), aa_gradient, target_aa)
+        
+        pao2 = _alveolar_po2(fio2, paco2, atmospheric_pressure) - aa_gradient
+        
+        # Shunt blends in mixed venous blood (PO2 ~40 mmHg), built in one
+        # buffer as pao2 * (1 - shunt) + 40 * shunt
+        shunted = shunt_fraction > 0
+        if shunted.any():
+            blended = np.subtract(1, shunt_fraction, out=np.empty(pao2.shape))
+            blended *= pao2
+            blended += 40.0 * shunt_fraction
+            np.copyto(blended, pao2, where=~shunted)
+            pao2 = blended
+        
+        pao2 = np.maximum(pao2, 30)
+        
+        return OxygenationBatch(
+            pao2,
+            cls.calculate_sao2_array(pao2, ph, temperature, paco2),
+            fio2,
+            cls.calculate_pf_ratio_array(pao2, fio2),
+            aa_gradient,
+            expected_aa,
+            pao2 >= NORMAL_PAO2[0] * (fio2 / 0.21),
+            _aa_gradient_elevated(aa_gradient, expected_aa),
         )
     
     @classmethod
@@ -7,11 +7,37 @@ to create realistic blood gas values.
 
 import random
 import math
-from dataclasses import dataclass
-from typing import Optional, Tuple
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
+from bloodgas._numpy import require_numpy
 
-@dataclass
+
+# Physiological bounds and noise distribution for each varied parameter:
+# name -> (min_value, max_value, distribution)
+VARIABILITY_LIMITS: Dict[str, Tuple[float, float, str]] = {
+    "ph": (6.80, 7.80, "normal"),
+    "pco2": (10.0, 150.0, "normal"),
+    "po2": (20.0, 600.0, "lognormal"),  # Can be high on 100% O2
+    "hco3": (4.0, 50.0, "normal"),
+    "sodium": (110.0, 180.0, "normal"),
+    "potassium": (2.0, 9.0, "normal"),
+    "chloride": (80.0, 130.0, "normal"),
+    "glucose": (20.0, 1200.0, "lognormal"),
+    "lactate": (0.3, 25.0, "lognormal"),
+    "hemoglobin": (3.0, 22.0, "normal"),
+    "sao2": (0.0, 100.0, "normal"),
+}
+
+# Measured parameters varied together as one panel, in draw order
+PANEL_FIELDS: Tuple[str, ...] = (
+    "ph", "pco2", "po2", "hco3",
+    "sodium", "potassium", "chloride", "glucose", "lactate", "hemoglobin",
+)
+
+
+@dataclass(slots=True)
 class VariabilityConfig:
     """Configuration for variability generation."""
     
@@ -34,6 +60,10 @@ class VariabilityConfig:
     glucose_cv: float = 0.08  # Quite variable
     lactate_cv: float = 0.10  # Most variable
     
+    # Relatively stable / derived values
+    hemoglobin_cv: float = 0.02
+    sao2_cv: float = 0.01  # SaO2 calculated from pO2, small measurement variation
+    
     # Measurement error (added to physiological variation)
     measurement_error: bool = True
     measurement_error_magnitude: float = 0.5  # Relative magnitude
@@ -55,8 +85,48 @@ class VariabilityEngine:
         """Initialize with configuration."""
         self.config = config or VariabilityConfig()
         
-        if self.config.seed is not None:
-            random.seed(self.config.seed)
+        # A seeded engine draws from its own generator and leaves the global
+        # random state untouched; without a seed it shares the random module's
+        # generator, so callers can still reproduce runs with random.seed()
+        self.rng = random.Random(self.config.seed) if self.config.seed is not None else random
+        
+        # Per-parameter (cv, min_value, max_value, is_lognormal), resolved from
+        # the config once so vary() skips the getattr and string compare
+        self._parameters = {
+            name: (
+                getattr(self.config, f"{name}_cv"),
+                min_value,
+                max_value,
+                distribution == "lognormal",
+            )
+            for name, (min_value, max_value, distribution) in VARIABILITY_LIMITS.items()
+        }
+        
+        # Measurement error SD as a fraction of the physiological SD
+        self._measurement_sd_factor = (
+            self.config.measurement_error_magnitude * 0.5
+            if self.config.measurement_error else None
+        )
+    
+    def spawn(self, n: int) -> List["VariabilityEngine"]:
+        """
+        Create n child engines with independent streams, e.g. one per worker thread.
+        
+        Each child gets a copy of this engine's config with a seed drawn from
+        this engine's stream, so a seeded parent spawns the same children
+        every time. An unseeded parent draws the child seeds from the global
+        random state, so it spawns the same children after random.seed().
+        
+        Args:
+            n: Number of child engines
+        
+        Returns:
+            List of n VariabilityEngines
+        """
+        return [
+            VariabilityEngine(replace(self.config, seed=self.rng.getrandbits(64)))
+            for _ in range(n)
+        ]
     
     def add_variability(
         self,
@@ -91,133 +161,241 @@ class VariabilityEngine:
         if distribution == "lognormal":
             # Lognormal for values that can't be negative
             # Convert to log-space parameters
-            mu = math.log(value) - (cv ** 2) / 2
+            mu = _lognormal_mu(value, cv)
             sigma = cv
-            varied = random.lognormvariate(mu, sigma)
+            varied = math.exp(self.rng.normalvariate(mu, sigma))
         else:
             # Normal distribution
-            varied = random.gauss(value, sd)
+            varied = self.rng.gauss(value, sd)
         
         # Add measurement error if enabled
         if self.config.measurement_error:
             measurement_sd = sd * self.config.measurement_error_magnitude * 0.5
-            varied += random.gauss(0, measurement_sd)
+            varied += self.rng.gauss(0, measurement_sd)
         
         # Apply bounds
-        if min_value is not None:
-            varied = max(varied, min_value)
-        if max_value is not None:
-            varied = min(varied, max_value)
+        if min_value is not None and varied < min_value:
+            varied = min_value
+        if max_value is not None and varied > max_value:
+            varied = max_value
         
         return varied
     
+    def vary(self, name: str, value: float) -> float:
+        """
+        Add variability to a named parameter using its configured CV and bounds.
+        
+        Args:
+            name: Parameter name (a key of VARIABILITY_LIMITS)
+            value: The base value
+        
+        Returns:
+            Value with added variability
+        """
+        if not self.config.enabled:
+            return value
+        
+        # Same draws and arithmetic as add_variability(), with the
+        # per-parameter settings taken from the table built in __init__
+        cv, min_value, max_value, lognormal = self._parameters[name]
+        if cv <= 0:
+            return value
+        
+        sd = abs(value) * cv
+        if lognormal:
+            # exp(normal) is what lognormvariate() does, minus a call frame
+            varied = math.exp(self.rng.normalvariate(_lognormal_mu(value, cv), cv))
+        else:
+            varied = self.rng.gauss(value, sd)
+        
+        if self._measurement_sd_factor is not None:
+            varied += self.rng.gauss(0, sd * self._measurement_sd_factor)
+        
+        return min_value if varied < min_value else (max_value if varied > max_value else varied)
+    
+    def add_variability_array(
+        self,
+        values,
+        cv,
+        rng,
+        min_value=None,
+        max_value=None,
+        lognormal=False
+    ):
+        """
+        Vectorized counterpart of add_variability() for NumPy arrays.
+        
+        All noise is drawn in one standard normal block (a second row for
+        measurement error when enabled) and scaled in place, so a single RNG
+        call serves every value.
+        
+        Args:
+            values: Array of base values
+            cv: Coefficient of variation; scalar or array broadcasting against values
+            rng: numpy.random.Generator used to draw the noise
+            min_value: Minimum allowed value(s)
+            max_value: Maximum allowed value(s)
+            lognormal: Whether the lognormal distribution applies; a bool, or
+                one bool per row of values
+        
+        Returns:
+            Array of values with added variability
+        """
+        np = require_numpy()
+        values = np.asarray(values, dtype=float)
+        
+        if not self.config.enabled:
+            return values
+        
+        measurement_error = self.config.measurement_error
+        noise = rng.standard_normal((1 + measurement_error,) + values.shape)
+        sd = np.abs(values)
+        sd *= cv
+        
+        if np.ndim(lognormal) == 0:
+            if lognormal:
+                varied = np.exp(np.log(values) - (cv ** 2) / 2 + cv * noise[0])
+            else:
+                varied = values + sd * noise[0]
+        else:
+            # Per-row distributions: only the lognormal rows pay for log/exp
+            varied = values + sd * noise[0]
+            rows = np.flatnonzero(lognormal)
+            if rows.size:
+                row_cv = np.asarray(cv)[rows] if np.ndim(cv) else cv
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    varied[rows] = np.exp(
+                        np.log(values[rows]) - (row_cv ** 2) / 2 + row_cv * noise[0][rows]
+                    )
+        
+        if measurement_error:
+            varied += sd * (self.config.measurement_error_magnitude * 0.5) * noise[1]
+        
+        if min_value is None and max_value is None:
+            return varied
+        return np.clip(varied, min_value, max_value)
+    
+    def vary_array(self, name: str, values, rng):
+        """
+        Vectorized counterpart of vary() for NumPy arrays.
+        
+        Args:
+            name: Parameter name (a key of VARIABILITY_LIMITS)
+            values: Array of base values
+            rng: numpy.random.Generator used to draw the noise
+        
+        Returns:
+            Array of values with added variability
+        """
+        np = require_numpy()
+        values = np.asarray(values, dtype=float)
+        cv = getattr(self.config, f"{name}_cv")
+        
+        if not self.config.enabled or cv <= 0:
+            return values
+        
+        min_value, max_value, distribution = VARIABILITY_LIMITS[name]
+        return self.add_variability_array(
+            values, cv, rng, min_value, max_value, lognormal=distribution == "lognormal"
+        )
+    
+    def vary_panel(
+        self,
+        values: Sequence[float],
+        names: Sequence[str] = PANEL_FIELDS
+    ) -> List[float]:
+        """
+        Add variability to a whole panel of values in one call.
+        
+        Args:
+            values: Base values, one per name
+            names: Parameter names (defaults to PANEL_FIELDS order)
+        
+        Returns:
+            List of varied values in the same order
+        """
+        if not self.config.enabled:
+            return list(values)
+        vary = self.vary
+        return [vary(name, value) for name, value in zip(names, values)]
+    
+    def vary_panel_array(self, values, rng, names: Sequence[str] = PANEL_FIELDS):
+        """
+        Vectorized vary_panel() for a (len(names), n) NumPy array.
+        
+        The per-parameter CVs, bounds and distributions are stacked into
+        columns and applied by row in one add_variability_array() call.
+        
+        Args:
+            values: Array of base values with one row per name
+            rng: numpy.random.Generator used to draw the noise
+            names: Parameter names (defaults to PANEL_FIELDS order)
+        
+        Returns:
+            Array of varied values with the same shape
+        """
+        np = require_numpy()
+        values = np.asarray(values, dtype=float)
+        
+        if not self.config.enabled:
+            return values
+        
+        names = tuple(names)
+        min_values, max_values, lognormal = _panel_limit_arrays(names)
+        cv = np.array([max(self._parameters[name][0], 0.0) for name in names])[:, None]
+        
+        return self.add_variability_array(
+            values, cv, rng, min_values, max_values, lognormal=lognormal
+        )
+    
     def vary_ph(self, ph: float) -> float:
         """Add variability to pH value."""
         # pH is tightly controlled - use very small variation
         # Also has physiological limits
-        return self.add_variability(
-            ph,
-            self.config.ph_cv,
-            min_value=6.80,
-            max_value=7.80
-        )
+        return self.vary("ph", ph)
     
     def vary_pco2(self, pco2: float) -> float:
         """Add variability to pCO2."""
-        return self.add_variability(
-            pco2,
-            self.config.pco2_cv,
-            min_value=10.0,
-            max_value=150.0
-        )
+        return self.vary("pco2", pco2)
     
     def vary_po2(self, po2: float) -> float:
         """Add variability to pO2."""
-        return self.add_variability(
-            po2,
-            self.config.po2_cv,
-            min_value=20.0,
-            max_value=600.0,  # Can be high on 100% O2
-            distribution="lognormal"
-        )
+        return self.vary("po2", po2)
     
     def vary_hco3(self, hco3: float) -> float:
         """Add variability to HCO3."""
-        return self.add_variability(
-            hco3,
-            self.config.hco3_cv,
-            min_value=4.0,
-            max_value=50.0
-        )
+        return self.vary("hco3", hco3)
     
     def vary_sodium(self, sodium: float) -> float:
         """Add variability to sodium."""
-        return self.add_variability(
-            sodium,
-            self.config.sodium_cv,
-            min_value=110.0,
-            max_value=180.0
-        )
+        return self.vary("sodium", sodium)
     
     def vary_potassium(self, potassium: float) -> float:
         """Add variability to potassium."""
         # Potassium is more variable, especially with hemolysis
-        return self.add_variability(
-            potassium,
-            self.config.potassium_cv,
-            min_value=2.0,
-            max_value=9.0
-        )
+        return self.vary("potassium", potassium)
     
     def vary_chloride(self, chloride: float) -> float:
         """Add variability to chloride."""
-        return self.add_variability(
-            chloride,
-            self.config.chloride_cv,
-            min_value=80.0,
-            max_value=130.0
-        )
+        return self.vary("chloride", chloride)
     
     def vary_glucose(self, glucose: float) -> float:
         """Add variability to glucose."""
         # Glucose is quite variable
-        return self.add_variability(
-            glucose,
-            self.config.glucose_cv,
-            min_value=20.0,
-            max_value=1200.0,
-            distribution="lognormal"
-        )
+        return self.vary("glucose", glucose)
     
     def vary_lactate(self, lactate: float) -> float:
         """Add variability to lactate."""
         # Lactate is most variable
-        return self.add_variability(
-            lactate,
-            self.config.lactate_cv,
-            min_value=0.3,
-            max_value=25.0,
-            distribution="lognormal"
-        )
+        return self.vary("lactate", lactate)
     
     def vary_hemoglobin(self, hemoglobin: float) -> float:
         """Add variability to hemoglobin."""
-        return self.add_variability(
-            hemoglobin,
-            0.02,  # Relatively stable
-            min_value=3.0,
-            max_value=22.0
-        )
+        return self.vary("hemoglobin", hemoglobin)
     
     def vary_sao2(self, sao2: float) -> float:
         """Add variability to SaO2."""
-        # SaO2 calculated from pO2, small measurement variation
-        return self.add_variability(
-            sao2,
-            0.01,
-            min_value=0.0,
-            max_value=100.0
-        )
+        return self.vary("sao2", sao2)
     
     @classmethod
     def generate_in_range(
@@ -225,7 +403,8 @@ class VariabilityEngine:
         low: float,
         high: float,
         center_bias: float = 0.5,
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None
     ) -> float:
         """
         Generate a value within a range with optional center bias.
@@ -234,22 +413,25 @@ class VariabilityEngine:
             low: Lower bound
             high: Upper bound
             center_bias: 0-1, higher = more likely to be near center
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (used when rng is None)
+            rng: Generator to draw from; defaults to a fresh one for seed,
+                or the random module's shared generator
         
         Returns:
             Random value in range
         """
-        if seed is not None:
-            random.seed(seed)
+        if rng is None:
+            # A private generator per seed leaves the global random state untouched
+            rng = random.Random(seed) if seed is not None else random
         
         # Use beta distribution for center bias
         if center_bias > 0:
             # Shape parameters for beta distribution
             # Higher values = more peaked at center
             alpha = beta = 1 + (center_bias * 10)
-            fraction = random.betavariate(alpha, beta)
+            fraction = rng.betavariate(alpha, beta)
         else:
-            fraction = random.random()
+            fraction = rng.random()
         
         return low + (high - low) * fraction
     
@@ -260,7 +442,8 @@ class VariabilityEngine:
         moderate_range: Tuple[float, float],
         severe_range: Tuple[float, float],
         severity: str = "moderate",
-        seed: Optional[int] = None
+        seed: Optional[int] = None,
+        rng: Optional[random.Random] = None
     ) -> float:
         """
         Generate a value appropriate for a severity level.
@@ -270,17 +453,61 @@ class VariabilityEngine:
             moderate_range: (min, max) for moderate severity
             severe_range: (min, max) for severe severity
             severity: "mild", "moderate", or "severe"
-            seed: Random seed for reproducibility
+            seed: Random seed for reproducibility (used when rng is None)
+            rng: Generator to draw from, as for generate_in_range()
         
         Returns:
             Value in the appropriate range
         """
         if severity == "mild":
-            return cls.generate_in_range(*mild_range, center_bias=0.3, seed=seed)
+            return cls.generate_in_range(*mild_range, center_bias=0.3, seed=seed, rng=rng)
         elif severity == "severe":
-            return cls.generate_in_range(*severe_range, center_bias=0.3, seed=seed)
+            return cls.generate_in_range(*severe_range, center_bias=0.3, seed=seed, rng=rng)
         else:  # moderate
-            return cls.generate_in_range(*moderate_range, center_bias=0.5, seed=seed)
+            return cls.generate_in_range(*moderate_range, center_bias=0.5, seed=seed, rng=rng)
+
+
+# Low-noise CVs: the default CVs halved (hemoglobin and SaO2 are left as is),
+# passed straight to the VariabilityConfig constructor
+_LOW_NOISE_CVS: Dict[str, float] = {
+    field.name: field.default * 0.5
+    for field in fields(VariabilityConfig)
+    if field.name in (
+        "ph_cv", "pco2_cv", "po2_cv", "hco3_cv",
+        "sodium_cv", "potassium_cv", "chloride_cv", "glucose_cv", "lactate_cv",
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def _panel_limit_arrays(names: Tuple[str, ...]) -> Tuple[Any, Any, Any]:
+    """
+    Bounds and distributions of a panel as read-only NumPy arrays.
+    
+    Returns (min_values, max_values, lognormal): the bounds as (len(names), 1)
+    columns and one lognormal flag per name. Built once per panel layout.
+    """
+    np = require_numpy()
+    limits = [VARIABILITY_LIMITS[name] for name in names]
+    arrays = (
+        np.array([limit[0] for limit in limits])[:, None],
+        np.array([limit[1] for limit in limits])[:, None],
+        np.array([limit[2] == "lognormal" for limit in limits]),
+    )
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+
+@lru_cache(maxsize=256)
+def _lognormal_mu(value: float, cv: float) -> float:
+    """
+    Log-space mean that keeps a lognormal draw centred on value.
+    
+    Cached because the scalar generators vary the same target values case
+    after case.
+    """
+    return math.log(value) - (cv ** 2) / 2
 
 
 def create_variability_engine(
@@ -299,22 +526,10 @@ def create_variability_engine(
     Returns:
         Configured VariabilityEngine
     """
-    config = VariabilityConfig(
-        enabled=enabled,
-        seed=seed
-    )
-    
     if low_noise:
-        # Reduce all CVs by half
-        config.ph_cv *= 0.5
-        config.pco2_cv *= 0.5
-        config.po2_cv *= 0.5
-        config.hco3_cv *= 0.5
-        config.sodium_cv *= 0.5
-        config.potassium_cv *= 0.5
-        config.chloride_cv *= 0.5
-        config.glucose_cv *= 0.5
-        config.lactate_cv *= 0.5
+        config = VariabilityConfig(enabled=enabled, seed=seed, **_LOW_NOISE_CVS)
+    else:
+        config = VariabilityConfig(enabled=enabled, seed=seed)
     
     return VariabilityEngine(config)
 
@@ -5,7 +5,11 @@ Defines the physiological effects of each clinical condition
 on blood gas values.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from bloodgas._numpy import require_numpy
 from bloodgas.models.disorders import (
     ClinicalCondition,
     Disorder,
@@ -36,12 +40,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         lactate_effect=(0.8, 2.5),
         expected_compensation=Compensation.APPROPRIATE,  # Chronic
         description="COPD exacerbation with acute-on-chronic respiratory acidosis",
-        teaching_points=[
+        teaching_points=(
             "COPD patients often have chronic CO2 retention with compensatory elevated HCO3",
             "Acute exacerbation causes further pCO2 rise without immediate HCO3 compensation",
             "Look for baseline ABGs to distinguish acute vs chronic changes",
             "Hypoxemia due to V/Q mismatch - A-a gradient elevated but responds well to O2",
-        ]
+        )
     ),
     
     ClinicalCondition.ASTHMA_ATTACK: ConditionEffect(
@@ -58,12 +62,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         affects_respiratory_drive=True,
         respiratory_drive_multiplier=1.5,  # Hyperventilating
         description="Acute asthma attack",
-        teaching_points=[
+        teaching_points=(
             "Early/moderate asthma: hyperventilation causes respiratory alkalosis",
             "Normal or rising pCO2 in acute asthma is ominous - indicates fatigue/impending failure",
             "Severe attack can progress to respiratory acidosis if patient tires",
             "Lactate may rise due to increased work of breathing",
-        ]
+        )
     ),
     
     ClinicalCondition.PULMONARY_EMBOLISM: ConditionEffect(
@@ -78,12 +82,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         lactate_effect=(1.0, 4.0),  # If causing shock
         description="Pulmonary embolism with hypoxemia",
-        teaching_points=[
+        teaching_points=(
             "Classic triad: hypoxemia, respiratory alkalosis, elevated A-a gradient",
             "Hypoxemia that doesn't fully correct with oxygen suggests shunt (large PE)",
             "Normal ABG does not exclude PE",
             "Lactate elevation suggests hemodynamic compromise",
-        ]
+        )
     ),
     
     ClinicalCondition.ARDS: ConditionEffect(
@@ -98,12 +102,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         lactate_effect=(2.0, 8.0),  # Often associated with sepsis/shock
         description="Acute respiratory distress syndrome",
-        teaching_points=[
+        teaching_points=(
             "Defined by P/F ratio: Mild 200-300, Moderate 100-200, Severe <100",
             "Bilateral infiltrates on imaging required for diagnosis",
             "Hypoxemia refractory to oxygen due to shunt physiology (28-45% shunt)",
             "May require permissive hypercapnia in lung-protective ventilation",
-        ]
+        )
     ),
     
     ClinicalCondition.PNEUMONIA: ConditionEffect(
@@ -118,12 +122,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         lactate_effect=(1.0, 4.0),
         description="Community or hospital-acquired pneumonia",
-        teaching_points=[
+        teaching_points=(
             "Typically causes respiratory alkalosis from hyperventilation",
             "A-a gradient elevated due to V/Q mismatch in affected lung",
             "Rising pCO2 may indicate respiratory failure/fatigue",
             "Can progress to ARDS or sepsis",
-        ]
+        )
     ),
     
     ClinicalCondition.OPIOID_OVERDOSE: ConditionEffect(
@@ -141,12 +145,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         affects_respiratory_drive=True,
         respiratory_drive_multiplier=0.3,  # Severely depressed
         description="Opioid-induced respiratory depression",
-        teaching_points=[
+        teaching_points=(
             "Classic pure respiratory acidosis with NORMAL A-a gradient",
             "Hypoxemia corrects EXCELLENTLY with oxygen (no V/Q mismatch, no shunt)",
             "Blocks respiratory compensation for any metabolic acidosis present",
             "Calculate expected pO2: PAO2 - A-a gradient (should be normal A-a)",
-        ]
+        )
     ),
     
     ClinicalCondition.HYPERVENTILATION_ANXIETY: ConditionEffect(
@@ -161,12 +165,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         lactate_effect=(0.8, 2.0),
         description="Hyperventilation syndrome / panic attack",
-        teaching_points=[
+        teaching_points=(
             "Acute respiratory alkalosis with normal A-a gradient",
             "pO2 often normal or elevated (no lung pathology)",
             "Symptoms (tingling, spasm) from hypocalcemia due to alkalosis",
             "Diagnosis of exclusion - rule out PE, MI, etc. first",
-        ]
+        )
     ),
     
     ClinicalCondition.HYPERVENTILATION_PAIN: ConditionEffect(
@@ -181,11 +185,11 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         lactate_effect=(1.0, 2.5),
         description="Pain-induced hyperventilation",
-        teaching_points=[
+        teaching_points=(
             "Pain causes tachypnea and respiratory alkalosis",
             "Important to consider underlying cause of pain",
             "May coexist with other acid-base disorders",
-        ]
+        )
     ),
     
     ClinicalCondition.NEUROMUSCULAR_WEAKNESS: ConditionEffect(
@@ -199,12 +203,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         shunt_fraction_range=(0.0, 0.0),  # No shunt - lungs work fine
         anion_gap_elevated=False,
         description="Neuromuscular respiratory failure (GBS, MG, ALS)",
-        teaching_points=[
+        teaching_points=(
             "Respiratory acidosis with normal A-a gradient (pump failure, not lung failure)",
             "Hypoxemia responds well to supplemental oxygen",
             "Rising pCO2 in GBS/MG crisis is indication for intubation",
             "May be chronic in ALS with compensatory elevated HCO3",
-        ]
+        )
     ),
     
     # ═══════════════════════════════════════════════════════════════
@@ -229,13 +233,13 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         affects_respiratory_drive=True,
         respiratory_drive_multiplier=1.8,  # Kussmaul breathing
         description="Diabetic ketoacidosis",
-        teaching_points=[
+        teaching_points=(
             "High anion gap metabolic acidosis from ketone bodies",
             "Kussmaul breathing (deep, rapid) is respiratory compensation",
             "Potassium is often HIGH despite total body depletion - will drop with insulin",
             "Calculate corrected sodium: add 1.6 mEq/L per 100 mg/dL glucose above 100",
             "Delta-delta ratio helps identify concurrent disorders",
-        ]
+        )
     ),
     
     ClinicalCondition.HHS: ConditionEffect(
@@ -253,12 +257,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         glucose_effect=(600, 1200),  # Very high
         lactate_effect=(1.5, 4.0),
         description="Hyperosmolar hyperglycemic state",
-        teaching_points=[
+        teaching_points=(
             "Less acidosis than DKA - insufficient insulin but enough to prevent ketosis",
             "Extreme hyperglycemia and dehydration",
             "Serum sodium needs correction for glucose",
             "High mortality especially in elderly",
-        ]
+        )
     ),
     
     ClinicalCondition.LACTIC_ACIDOSIS_SEPSIS: ConditionEffect(
@@ -275,12 +279,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         lactate_effect=(4.0, 15.0),  # Key marker
         potassium_effect=(0, 1.0),
         description="Lactic acidosis from sepsis",
-        teaching_points=[
+        teaching_points=(
             "Lactate is key marker for tissue hypoperfusion in sepsis",
             "Type A lactic acidosis (hypoxic) from poor oxygen delivery",
             "Lactate clearance is prognostic marker",
             "May have concurrent respiratory alkalosis from sepsis-induced hyperventilation",
-        ]
+        )
     ),
     
     ClinicalCondition.LACTIC_ACIDOSIS_SHOCK: ConditionEffect(
@@ -297,12 +301,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         lactate_effect=(6.0, 20.0),  # Very high
         potassium_effect=(0.5, 2.0),  # Released from cells
         description="Lactic acidosis from cardiogenic/hypovolemic shock",
-        teaching_points=[
+        teaching_points=(
             "Severe tissue hypoxia leads to anaerobic metabolism",
             "Very high lactate (>10) associated with poor prognosis",
             "Treatment is restoring perfusion, not buffering",
             "Potassium often elevated from cellular release",
-        ]
+        )
     ),
     
     ClinicalCondition.LACTIC_ACIDOSIS_SEIZURE: ConditionEffect(
@@ -319,12 +323,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         lactate_effect=(3.0, 10.0),  # Muscle activity
         potassium_effect=(0.3, 1.5),
         description="Post-seizure lactic acidosis",
-        teaching_points=[
+        teaching_points=(
             "Massive muscle activity generates lactate",
             "Usually resolves within 60-90 minutes",
             "May have concurrent respiratory acidosis if post-ictal",
             "Lactate normalizes quickly without specific treatment",
-        ]
+        )
     ),
     
     ClinicalCondition.RENAL_FAILURE_ACUTE: ConditionEffect(
@@ -341,12 +345,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         potassium_effect=(0.5, 2.5),  # Often elevated
         lactate_effect=(1.0, 3.0),
         description="Acute kidney injury with metabolic acidosis",
-        teaching_points=[
+        teaching_points=(
             "Failure to excrete daily acid load",
             "High anion gap from retained sulfates, phosphates, urate",
             "Hyperkalemia is common and dangerous",
             "May need emergent dialysis for severe acidosis/hyperkalemia",
-        ]
+        )
     ),
     
     ClinicalCondition.RENAL_FAILURE_CHRONIC: ConditionEffect(
@@ -362,12 +366,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(12, 18),
         potassium_effect=(0, 1.5),
         description="Chronic kidney disease with chronic metabolic acidosis",
-        teaching_points=[
+        teaching_points=(
             "Compensated chronic metabolic acidosis",
             "Lower HCO3 becomes 'new normal' for patient",
             "Contributes to bone disease and muscle wasting",
             "Oral bicarbonate supplementation often used",
-        ]
+        )
     ),
     
     ClinicalCondition.TOXIC_INGESTION_METHANOL: ConditionEffect(
@@ -383,12 +387,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(25, 40),  # Very high
         lactate_effect=(1.0, 3.0),  # Not primarily lactic
         description="Methanol poisoning",
-        teaching_points=[
+        teaching_points=(
             "Formic acid causes severe high AG acidosis + blindness",
             "ELEVATED OSMOLAR GAP early, then AG rises as metabolized",
             "Treatment: fomepizole, dialysis, folate",
             "Visual symptoms are pathognomonic",
-        ]
+        )
     ),
     
     ClinicalCondition.TOXIC_INGESTION_ETHYLENE_GLYCOL: ConditionEffect(
@@ -404,12 +408,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(25, 40),
         lactate_effect=(1.0, 3.0),
         description="Ethylene glycol poisoning",
-        teaching_points=[
+        teaching_points=(
             "Glycolic and oxalic acid cause AG acidosis + renal failure",
             "ELEVATED OSMOLAR GAP early, then AG rises",
             "Calcium oxalate crystals in urine",
             "Treatment: fomepizole, dialysis",
-        ]
+        )
     ),
     
     ClinicalCondition.TOXIC_INGESTION_SALICYLATE: ConditionEffect(
@@ -428,13 +432,13 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         affects_respiratory_drive=True,
         respiratory_drive_multiplier=1.6,
         description="Salicylate toxicity",
-        teaching_points=[
+        teaching_points=(
             "CLASSIC MIXED DISORDER: respiratory alkalosis + metabolic acidosis",
             "Direct CNS stimulation causes respiratory alkalosis",
             "Uncouples oxidative phosphorylation causing metabolic acidosis",
             "Adults often present alkalemic, children more acidemic",
             "Alkalinize urine to enhance excretion (ion trapping)",
-        ]
+        )
     ),
     
     ClinicalCondition.STARVATION_KETOSIS: ConditionEffect(
@@ -451,12 +455,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         glucose_effect=(50, 80),  # Low-normal
         lactate_effect=(0.5, 1.5),
         description="Starvation ketosis",
-        teaching_points=[
+        teaching_points=(
             "Mild ketoacidosis from prolonged fasting",
             "Much milder than DKA",
             "Glucose is low (opposite of DKA)",
             "Resolves with feeding",
-        ]
+        )
     ),
     
     ClinicalCondition.ALCOHOLIC_KETOACIDOSIS: ConditionEffect(
@@ -473,13 +477,13 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         glucose_effect=(40, 150),  # Variable, often low
         lactate_effect=(2.0, 5.0),
         description="Alcoholic ketoacidosis",
-        teaching_points=[
+        teaching_points=(
             "Occurs after binge drinking followed by starvation/vomiting",
             "Glucose often low or normal (not like DKA)",
             "May have concurrent metabolic alkalosis from vomiting",
             "Treats with glucose and volume - resolves quickly",
             "Nitroprusside test may be negative (beta-hydroxybutyrate predominates)",
-        ]
+        )
     ),
     
     # ═══════════════════════════════════════════════════════════════
@@ -500,12 +504,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         potassium_effect=(-1.5, -0.3),  # Low - GI losses
         chloride_effect=(4, 12),  # HIGH chloride
         description="Diarrhea with bicarbonate loss",
-        teaching_points=[
+        teaching_points=(
             "GI loss of bicarbonate causes normal AG (hyperchloremic) acidosis",
             "Chloride rises to maintain electroneutrality as HCO3 falls",
             "Hypokalemia common from GI losses",
             "Urine AG helps distinguish from RTA",
-        ]
+        )
     ),
     
     ClinicalCondition.RTA_TYPE1: ConditionEffect(
@@ -521,12 +525,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(8, 12),
         potassium_effect=(-1.5, -0.3),  # LOW
         description="Distal (Type 1) renal tubular acidosis",
-        teaching_points=[
+        teaching_points=(
             "Failure to secrete H+ in distal tubule",
             "Urine pH inappropriately HIGH (>5.5) despite systemic acidosis",
             "Hypokalemia common",
             "Associated with nephrolithiasis and nephrocalcinosis",
-        ]
+        )
     ),
     
     ClinicalCondition.RTA_TYPE2: ConditionEffect(
@@ -542,12 +546,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(8, 12),
         potassium_effect=(-1.0, 0),  # Low
         description="Proximal (Type 2) renal tubular acidosis",
-        teaching_points=[
+        teaching_points=(
             "Failure to reabsorb bicarbonate in proximal tubule",
             "Sets new lower threshold for HCO3 reabsorption",
             "Once at new steady state, urine pH can be low",
             "May be part of Fanconi syndrome",
-        ]
+        )
     ),
     
     ClinicalCondition.RTA_TYPE4: ConditionEffect(
@@ -563,12 +567,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(8, 12),
         potassium_effect=(0.5, 2.0),  # HIGH - key feature
         description="Type 4 RTA (hypoaldosteronism)",
-        teaching_points=[
+        teaching_points=(
             "Aldosterone deficiency or resistance",
             "HYPERKALEMIA is the hallmark (opposite of Type 1 and 2)",
             "Common in diabetics (hyporeninemic hypoaldosteronism)",
             "Mild acidosis compared to other RTAs",
-        ]
+        )
     ),
     
     ClinicalCondition.SALINE_INFUSION: ConditionEffect(
@@ -584,12 +588,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(8, 12),
         chloride_effect=(4, 10),  # HIGH from NS
         description="Dilutional acidosis from normal saline",
-        teaching_points=[
+        teaching_points=(
             "Large volume NS (Cl- 154 mEq/L) causes hyperchloremic acidosis",
             "Chloride excess relative to sodium",
             "Usually mild and clinically insignificant",
             "Balanced crystalloids (LR, Plasmalyte) avoid this",
-        ]
+        )
     ),
     
     # ═══════════════════════════════════════════════════════════════
@@ -609,13 +613,13 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         potassium_effect=(-1.5, -0.5),  # Low
         chloride_effect=(-15, -5),  # Low - key!
         description="Metabolic alkalosis from vomiting",
-        teaching_points=[
+        teaching_points=(
             "Loss of HCl from stomach causes alkalosis",
             "HYPOCHLOREMIA and HYPOKALEMIA are hallmarks",
             "Volume depletion maintains alkalosis (avid Na/HCO3 reabsorption)",
             "Saline-responsive - give NS to correct",
             "Chloride-responsive alkalosis (urine Cl < 20)",
-        ]
+        )
     ),
     
     ClinicalCondition.NG_SUCTION: ConditionEffect(
@@ -631,11 +635,11 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         potassium_effect=(-1.2, -0.3),
         chloride_effect=(-12, -4),
         description="Metabolic alkalosis from NG suction",
-        teaching_points=[
+        teaching_points=(
             "Same mechanism as vomiting - gastric HCl loss",
             "Common in post-surgical patients",
             "Replace losses with appropriate fluids",
-        ]
+        )
     ),
     
     ClinicalCondition.DIURETIC_USE: ConditionEffect(
@@ -651,12 +655,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         potassium_effect=(-1.0, -0.3),  # Low
         chloride_effect=(-8, -2),  # Low
         description="Diuretic-induced metabolic alkalosis",
-        teaching_points=[
+        teaching_points=(
             "Loop and thiazide diuretics cause Cl/K losses",
             "Volume contraction maintains the alkalosis",
             "Saline-responsive (urine Cl < 20)",
             "Hypokalemia perpetuates H+ secretion",
-        ]
+        )
     ),
     
     ClinicalCondition.HYPOKALEMIA: ConditionEffect(
@@ -671,11 +675,11 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         anion_gap_elevated=False,
         potassium_effect=(-1.5, -0.8),  # Very low
         description="Metabolic alkalosis from severe hypokalemia",
-        teaching_points=[
+        teaching_points=(
             "K+ depletion causes intracellular H+ shift",
             "Also increases renal H+ secretion",
             "Must correct K+ to correct the alkalosis",
-        ]
+        )
     ),
     
     ClinicalCondition.HYPERALDOSTERONISM: ConditionEffect(
@@ -691,12 +695,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         sodium_effect=(2, 8),  # Mildly high
         potassium_effect=(-1.2, -0.5),
         description="Primary hyperaldosteronism (Conn's syndrome)",
-        teaching_points=[
+        teaching_points=(
             "Saline-RESISTANT alkalosis (urine Cl > 20)",
             "Autonomous aldosterone secretion",
             "Hypertension + hypokalemia + alkalosis is classic triad",
             "Look for adrenal adenoma or hyperplasia",
-        ]
+        )
     ),
     
     ClinicalCondition.MILK_ALKALI_SYNDROME: ConditionEffect(
@@ -710,11 +714,11 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         shunt_fraction_range=(0.0, 0.0),  # No shunt
         anion_gap_elevated=False,
         description="Milk-alkali syndrome from calcium/antacid ingestion",
-        teaching_points=[
+        teaching_points=(
             "Triad: hypercalcemia, alkalosis, renal insufficiency",
             "From excessive calcium carbonate (antacid) intake",
             "More common than previously thought",
-        ]
+        )
     ),
     
     ClinicalCondition.POST_HYPERCAPNIA: ConditionEffect(
@@ -728,12 +732,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         shunt_fraction_range=(0.0, 0.0),  # No shunt
         anion_gap_elevated=False,
         description="Post-hypercapnic metabolic alkalosis",
-        teaching_points=[
+        teaching_points=(
             "After correcting chronic respiratory acidosis",
             "Elevated HCO3 (from compensation) persists while pCO2 normalizes",
             "Common when COPD patients are over-ventilated",
             "Takes days for kidneys to excrete excess bicarbonate",
-        ]
+        )
     ),
     
     # ═══════════════════════════════════════════════════════════════
@@ -753,10 +757,10 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         typical_anion_gap=(8, 12),
         lactate_effect=(0.5, 1.5),
         description="Healthy individual with normal blood gas",
-        teaching_points=[
+        teaching_points=(
             "Normal ABG values for reference",
             "Small day-to-day variation is normal",
-        ]
+        )
     ),
     
     ClinicalCondition.PREGNANCY: ConditionEffect(
@@ -770,12 +774,12 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         shunt_fraction_range=(0.0, 0.0),  # No shunt
         anion_gap_elevated=False,
         description="Normal pregnancy (chronic respiratory alkalosis)",
-        teaching_points=[
+        teaching_points=(
             "Progesterone stimulates respiratory center",
             "Chronic compensated respiratory alkalosis is normal",
             "Lower pCO2 baseline (28-32) and HCO3 (18-22)",
             "Important when interpreting ABGs in pregnant patients",
-        ]
+        )
     ),
     
     ClinicalCondition.HIGH_ALTITUDE: ConditionEffect(
@@ -789,16 +793,57 @@ CONDITION_EFFECTS: Dict[ClinicalCondition, ConditionEffect] = {
         shunt_fraction_range=(0.0, 0.0),  # No shunt
         anion_gap_elevated=False,
         description="High altitude acclimatization",
-        teaching_points=[
+        teaching_points=(
             "Hypoxic drive causes hyperventilation",
             "Respiratory alkalosis develops",
             "Over days, renal compensation occurs",
             "Expected pO2 decreases with altitude",
-        ]
+        )
     ),
 }
 
 
+# Conditions that block respiratory compensation
+COMPENSATION_BLOCKING_CONDITIONS = frozenset(
+    condition for condition, effect in CONDITION_EFFECTS.items()
+    if effect.compensation_blocked
+)
+
+# Conditions whose primary disorder is metabolic acidosis
+METABOLIC_ACIDOSIS_CONDITIONS = frozenset(
+    condition for condition, effect in CONDITION_EFFECTS.items()
+    if effect.primary_disorder is Disorder.METABOLIC_ACIDOSIS
+)
+
+# (min, max) range fields of ConditionEffect available as arrays
+EFFECT_RANGE_FIELDS = (
+    "pco2_effect",
+    "hco3_effect",
+    "po2_effect",
+    "aa_gradient_range",
+    "shunt_fraction_range",
+    "typical_anion_gap",
+    "sodium_effect",
+    "potassium_effect",
+    "chloride_effect",
+    "glucose_effect",
+    "lactate_effect",
+)
+
+# Boolean flags of ConditionEffect available as arrays
+EFFECT_FLAG_FIELDS = (
+    "aa_gradient_elevated",
+    "anion_gap_elevated",
+    "compensation_blocked",
+    "affects_respiratory_drive",
+)
+
+# Row of each condition in the effect arrays
+CONDITION_INDEX: Dict[ClinicalCondition, int] = {
+    condition: index for index, condition in enumerate(CONDITION_EFFECTS)
+}
+
+
 def get_condition_effect(condition: ClinicalCondition) -> ConditionEffect:
     """
     Get the physiological effect definition for a clinical condition.
@@ -812,7 +857,40 @@ def get_condition_effect(condition: ClinicalCondition) -> ConditionEffect:
     Raises:
         ValueError: If condition not found
     """
-    if condition not in CONDITION_EFFECTS:
+    effect = CONDITION_EFFECTS.get(condition)
+    if effect is None:
         raise ValueError(f"Unknown condition: {condition}")
-    return CONDITION_EFFECTS[condition]
+    return effect
+
+
+@lru_cache(maxsize=None)
+def get_effect_arrays() -> Mapping[str, Any]:
+    """
+    Get the condition effects as read-only NumPy arrays, one per field.
+    
+    Range fields (EFFECT_RANGE_FIELDS) are (n_conditions, 2) arrays of
+    (min, max) and "ph_range" is (n_conditions, 3) of (min, typical, max).
+    Flag fields (EFFECT_FLAG_FIELDS) are boolean arrays,
+    "respiratory_drive_multiplier" is a float array and "primary_disorder"
+    holds Disorder values as integers. Rows follow CONDITION_INDEX. Built on
+    first use. Requires NumPy.
+    
+    Returns:
+        Mapping of field name to array
+    """
+    np = require_numpy()
+    effects = list(CONDITION_EFFECTS.values())
+    
+    arrays = {
+        name: np.array([getattr(effect, name) for effect in effects], dtype=float)
+        for name in EFFECT_RANGE_FIELDS + ("ph_range", "respiratory_drive_multiplier")
+    }
+    for name in EFFECT_FLAG_FIELDS:
+        arrays[name] = np.array([getattr(effect, name) for effect in effects], dtype=bool)
+    arrays["primary_disorder"] = np.array(
+        [effect.primary_disorder for effect in effects], dtype=np.int8
+    )
+    for array in arrays.values():
+        array.flags.writeable = False
+    return MappingProxyType(arrays)
 
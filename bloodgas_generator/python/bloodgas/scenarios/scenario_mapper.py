@@ -5,8 +5,10 @@ Maps clinical conditions to physiological blood gas values,
 handling multiple simultaneous conditions and their interactions.
 """
 
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass, replace
+from bloodgas._numpy import require_numpy
 from bloodgas.models.disorders import (
     ClinicalCondition,
     ChronicCondition,
@@ -15,12 +17,44 @@ from bloodgas.models.disorders import (
     ConditionEffect,
 )
 from bloodgas.models.patient_state import PatientFactors
-from bloodgas.scenarios.clinical_conditions import get_condition_effect
+from bloodgas.scenarios.clinical_conditions import (
+    COMPENSATION_BLOCKING_CONDITIONS,
+    CONDITION_INDEX,
+    METABOLIC_ACIDOSIS_CONDITIONS,
+    get_condition_effect,
+    get_effect_arrays,
+)
 from bloodgas.physiology.acid_base import AcidBaseEngine
 from bloodgas.physiology.variability import VariabilityEngine
 
 
-@dataclass
+# Fraction of each condition's effect range applied at a severity
+SEVERITY_FACTORS: Dict[Severity, float] = {
+    Severity.MILD: 0.33,
+    Severity.MODERATE: 0.66,
+    Severity.SEVERE: 1.0,
+}
+
+# Column of each severity in the precomputed severity tables
+_SEVERITY_COLUMN: Dict[Severity, int] = {
+    severity: column for column, severity in enumerate(SEVERITY_FACTORS)
+}
+
+# PhysiologyDeltas field interpolated from each ConditionEffect range field
+_ARRAY_DELTA_FIELDS = (
+    ("pco2_delta", "pco2_effect"),
+    ("hco3_delta", "hco3_effect"),
+    ("target_aa_gradient", "aa_gradient_range"),
+    ("shunt_fraction", "shunt_fraction_range"),
+    ("sodium_delta", "sodium_effect"),
+    ("potassium_delta", "potassium_effect"),
+    ("chloride_delta", "chloride_effect"),
+    ("glucose_target", "glucose_effect"),
+    ("lactate_target", "lactate_effect"),
+)
+
+
+@dataclass(slots=True)
 class PhysiologyDeltas:
     """Accumulated physiological changes from all conditions."""
     
@@ -52,6 +86,18 @@ class PhysiologyDeltas:
     compensation_blocked: bool = False
 
 
+# Conditions checked by the COPD + metabolic alkalosis interaction rule
+_COPD_CONDITIONS = frozenset({ClinicalCondition.COPD_EXACERBATION})
+_METABOLIC_ALKALOSIS_CONDITIONS = frozenset({
+    ClinicalCondition.VOMITING,
+    ClinicalCondition.NG_SUCTION,
+    ClinicalCondition.DIURETIC_USE,
+})
+
+# Field defaults; with slots the class attributes are member descriptors
+_DEFAULT_DELTAS = PhysiologyDeltas()
+
+
 class ScenarioMapper:
     """
     Maps clinical scenarios to blood gas physiology.
@@ -80,20 +126,28 @@ class ScenarioMapper:
         
         Returns:
             PhysiologyDeltas with all changes
+        
+        The deltas do not depend on the patient (the generator applies the
+        patient baselines), so results are memoized per (condition, severity).
         """
+        # Copy so callers may modify the result without touching the cache
+        return replace(_map_single(cls, condition, severity))
+    
+    @classmethod
+    def _map_single_condition(
+        cls,
+        condition: ClinicalCondition,
+        severity: Severity
+    ) -> PhysiologyDeltas:
+        """Uncached mapping of one condition at a severity."""
         effect = get_condition_effect(condition)
         deltas = PhysiologyDeltas()
         
         # Calculate severity scaling factor (0-1)
-        if severity == Severity.MILD:
-            severity_factor = 0.33
-        elif severity == Severity.MODERATE:
-            severity_factor = 0.66
-        else:  # SEVERE
-            severity_factor = 1.0
+        severity_factor = SEVERITY_FACTORS[severity]
         
         # Map primary disorder to acid-base changes
-        deltas = cls._apply_acid_base_effect(deltas, effect, severity_factor, patient)
+        deltas = cls._apply_acid_base_effect(deltas, effect, severity_factor)
         
         # Apply oxygenation effects
         deltas = cls._apply_oxygenation_effect(deltas, effect, severity_factor)
@@ -109,20 +163,59 @@ class ScenarioMapper:
         
         return deltas
     
+    @classmethod
+    def map_single_condition_array(
+        cls,
+        conditions: Sequence[ClinicalCondition],
+        severities: Sequence[Severity]
+    ) -> Dict[str, Any]:
+        """
+        Vectorized map_single_condition() for many (condition, severity) pairs.
+        
+        Interpolates every condition's effect ranges with one array
+        operation per field instead of one Python call per pair. Patient
+        factors do not enter the single-condition mapping. Requires NumPy.
+        
+        Args:
+            conditions: One clinical condition per case
+            severities: Severity for each case
+        
+        Returns:
+            Dict of PhysiologyDeltas field name -> array with one entry per case
+            (every field except ph_delta, which a single condition leaves at 0)
+        """
+        np = require_numpy()
+        arrays = get_effect_arrays()
+        
+        rows = np.fromiter((CONDITION_INDEX[c] for c in conditions), dtype=np.intp)
+        columns = np.fromiter((_SEVERITY_COLUMN[s] for s in severities), dtype=np.intp)
+        
+        # Interpolated fields are precomputed per (condition, severity); a
+        # flat take() gathers them faster than a 2-D fancy index
+        flat = rows * len(_SEVERITY_COLUMN) + columns
+        mapped = {
+            field_name: table.take(flat)
+            for field_name, table in _severity_tables().items()
+        }
+        mapped["anion_gap_elevated"] = arrays["anion_gap_elevated"][rows]
+        mapped["aa_gradient_elevated"] = arrays["aa_gradient_elevated"][rows]
+        mapped["respiratory_drive_multiplier"] = np.where(
+            arrays["affects_respiratory_drive"][rows],
+            arrays["respiratory_drive_multiplier"][rows],
+            _DEFAULT_DELTAS.respiratory_drive_multiplier,
+        )
+        mapped["compensation_blocked"] = arrays["compensation_blocked"][rows]
+        return mapped
+    
     @classmethod
     def _apply_acid_base_effect(
         cls,
         deltas: PhysiologyDeltas,
         effect: ConditionEffect,
-        severity_factor: float,
-        patient: PatientFactors
+        severity_factor: float
     ) -> PhysiologyDeltas:
         """Apply acid-base changes from a condition effect."""
         
-        # Get baseline values from patient
-        baseline_pco2 = patient.get_baseline_pco2()
-        baseline_hco3 = patient.get_baseline_hco3()
-        
         # Calculate pCO2 change
         pco2_range = effect.pco2_effect[1] - effect.pco2_effect[0]
         pco2_change = effect.pco2_effect[0] + (pco2_range * severity_factor)
@@ -222,21 +315,39 @@ class ScenarioMapper:
         
         Returns:
             Combined PhysiologyDeltas with interaction effects resolved
+        
+        The mapping depends only on the ordered (condition, severity) pairs,
+        not on the patient, so results are memoized per signature; test banks
+        that reuse the same scenario skip the per-condition work after the
+        first case.
         """
-        if not conditions:
+        signature = tuple((c, severities.get(c, Severity.MODERATE)) for c in conditions)
+        # Copy so callers may modify the result without touching the cache
+        return replace(_map_signature(cls, signature))
+    
+    @classmethod
+    def _map_conditions(
+        cls,
+        signature: Tuple[Tuple[ClinicalCondition, Severity], ...]
+    ) -> PhysiologyDeltas:
+        """Uncached mapping of ordered (condition, severity) pairs."""
+        if not signature:
             return PhysiologyDeltas()
         
-        # Start with first condition
-        first_severity = severities.get(conditions[0], Severity.MODERATE)
-        combined = cls.map_single_condition(conditions[0], first_severity, patient)
+        conditions = [condition for condition, _ in signature]
+        severities = dict(signature)
+        
+        # Start with first condition; the memoized deltas are shared without a
+        # copy because _combine_deltas() builds a new object and the result
+        # is itself cached and copied by map_multiple_conditions()
+        combined = _map_single(cls, *signature[0])
         
-        if len(conditions) == 1:
+        if len(signature) == 1:
             return combined
         
         # Process remaining conditions
-        for condition in conditions[1:]:
-            severity = severities.get(condition, Severity.MODERATE)
-            additional = cls.map_single_condition(condition, severity, patient)
+        for condition, severity in signature[1:]:
+            additional = _map_single(cls, condition, severity)
             combined = cls._combine_deltas(combined, additional)
         
         # Apply interaction rules
@@ -307,9 +418,10 @@ class ScenarioMapper:
         This handles special cases where conditions interact in 
         non-additive ways.
         """
+        present = frozenset(conditions)
         
         # Rule: Opioids block respiratory compensation for metabolic acidosis
-        if cls._has_condition(conditions, ClinicalCondition.OPIOID_OVERDOSE):
+        if ClinicalCondition.OPIOID_OVERDOSE in present:
             if deltas.hco3_delta < -4:  # Metabolic acidosis present
                 # The expected compensatory drop in pCO2 is blocked
                 # Instead of hyperventilating, pCO2 may be normal or high
@@ -319,23 +431,15 @@ class ScenarioMapper:
                 deltas.compensation_blocked = True
         
         # Rule: Salicylate toxicity - unique dual effect
-        if cls._has_condition(conditions, ClinicalCondition.TOXIC_INGESTION_SALICYLATE):
+        if ClinicalCondition.TOXIC_INGESTION_SALICYLATE in present:
             # Primary respiratory stimulation + metabolic acidosis
             # The respiratory alkalosis component may partially offset the acidosis
             pass  # Already handled in condition definition
         
         # Rule: COPD + metabolic alkalosis (e.g., vomiting)
         # Can cause severe alkalemia because CO2 retention impairs compensation
-        copd_conditions = [
-            ClinicalCondition.COPD_EXACERBATION,
-        ]
-        alkalosis_conditions = [
-            ClinicalCondition.VOMITING,
-            ClinicalCondition.NG_SUCTION,
-            ClinicalCondition.DIURETIC_USE,
-        ]
-        has_copd = any(cls._has_condition(conditions, c) for c in copd_conditions)
-        has_alkalosis = any(cls._has_condition(conditions, c) for c in alkalosis_conditions)
+        has_copd = not _COPD_CONDITIONS.isdisjoint(present)
+        has_alkalosis = not _METABOLIC_ALKALOSIS_CONDITIONS.isdisjoint(present)
         
         if has_copd and has_alkalosis:
             # COPD patients can't hyperventilate effectively
@@ -346,7 +450,7 @@ class ScenarioMapper:
         
         # Rule: Sepsis + hyperventilation
         # Can have both respiratory alkalosis (sepsis effect) and metabolic acidosis (lactate)
-        if cls._has_condition(conditions, ClinicalCondition.LACTIC_ACIDOSIS_SEPSIS):
+        if ClinicalCondition.LACTIC_ACIDOSIS_SEPSIS in present:
             # Sepsis causes direct respiratory stimulation
             deltas.respiratory_drive_multiplier = max(
                 deltas.respiratory_drive_multiplier, 1.3
@@ -354,15 +458,6 @@ class ScenarioMapper:
         
         return deltas
     
-    @classmethod
-    def _has_condition(
-        cls,
-        conditions: List[ClinicalCondition],
-        target: ClinicalCondition
-    ) -> bool:
-        """Check if a specific condition is in the list."""
-        return target in conditions
-    
     @classmethod
     def get_primary_disorder(
         cls,
@@ -395,14 +490,8 @@ class ScenarioMapper:
             )
             
             # Check for specific interactions
-            has_met_acidosis = any(
-                get_condition_effect(c).primary_disorder == Disorder.METABOLIC_ACIDOSIS
-                for c in conditions
-            )
-            has_resp_depression = any(
-                get_condition_effect(c).compensation_blocked
-                for c in conditions
-            )
+            has_met_acidosis = not METABOLIC_ACIDOSIS_CONDITIONS.isdisjoint(conditions)
+            has_resp_depression = not COMPENSATION_BLOCKING_CONDITIONS.isdisjoint(conditions)
             
             if has_met_acidosis and has_resp_depression:
                 points.append(
@@ -412,3 +501,54 @@ class ScenarioMapper:
         
         return points
 
+
+@lru_cache(maxsize=None)
+def _severity_tables() -> Dict[str, Any]:
+    """
+    Interpolated PhysiologyDeltas fields for every (condition, severity) pair.
+    
+    Returns read-only (n_conditions, len(SEVERITY_FACTORS)) arrays, rows in
+    CONDITION_INDEX order and columns in SEVERITY_FACTORS order, computed
+    with the same arithmetic as map_single_condition().
+    """
+    np = require_numpy()
+    arrays = get_effect_arrays()
+    factor = np.array(list(SEVERITY_FACTORS.values()))
+    
+    def interpolate(name, weight):
+        low = arrays[name][:, :1]
+        return low + (arrays[name][:, 1:] - low) * weight
+    
+    tables = {
+        field_name: interpolate(effect_name, factor)
+        for field_name, effect_name in _ARRAY_DELTA_FIELDS
+    }
+    # Room-air pO2 reference falls as severity rises
+    tables["po2_target"] = interpolate("po2_effect", 1 - factor)
+    tables["target_anion_gap"] = np.where(
+        arrays["anion_gap_elevated"][:, None],
+        interpolate("typical_anion_gap", factor),
+        _DEFAULT_DELTAS.target_anion_gap,
+    )
+    for table in tables.values():
+        table.flags.writeable = False
+    return tables
+
+
+@lru_cache(maxsize=1024)
+def _map_single(
+    mapper: type,
+    condition: ClinicalCondition,
+    severity: Severity
+) -> PhysiologyDeltas:
+    """Memoized ScenarioMapper._map_single_condition."""
+    return mapper._map_single_condition(condition, severity)
+
+
+@lru_cache(maxsize=256)
+def _map_signature(
+    mapper: type,
+    signature: Tuple[Tuple[ClinicalCondition, Severity], ...]
+) -> PhysiologyDeltas:
+    """Memoized ScenarioMapper._map_conditions."""
+    return mapper._map_conditions(signature)
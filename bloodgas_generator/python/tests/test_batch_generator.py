@@ -0,0 +1,143 @@
+"""generate_blood_gas_batch and interpret_batch against their scalar counterparts."""
+
+import random
+
+import pytest
+
+from bloodgas import (
+    ClinicalCondition,
+    Disorder,
+    Severity,
+    generate_blood_gas,
+    generate_blood_gas_batch,
+)
+from bloodgas.interpretation import InterpretationEngine
+from bloodgas.models.blood_gas_result import BATCH_VALUE_FIELDS, BloodGasResult
+
+np = pytest.importorskip("numpy")
+
+
+SPECS = [
+    *({"primary_disorder": d, "severity": s} for d in Disorder for s in Severity),
+    *({"conditions": [c]} for c in ClinicalCondition),
+    {"conditions": [ClinicalCondition.DKA, ClinicalCondition.OPIOID_OVERDOSE]},
+    {
+        "primary_disorder": Disorder.METABOLIC_ACIDOSIS,
+        "secondary_disorder": Disorder.RESPIRATORY_ACIDOSIS,
+    },
+]
+
+
+def _spec_id(spec):
+    return "-".join(
+        getattr(value, "name", None) or "+".join(c.name for c in value) for value in spec.values()
+    )
+
+
+@pytest.mark.parametrize("spec", SPECS, ids=_spec_id)
+def test_batch_without_variability_matches_scalar(spec):
+    result = generate_blood_gas(add_variability=False, **spec)
+    batch = generate_blood_gas_batch(4, add_variability=False, **spec)
+    
+    assert len(batch) == 4
+    for name in BATCH_VALUE_FIELDS:
+        expected = getattr(result, name)
+        values = getattr(batch, name)
+        if name == "sao2":
+            # Vectorized Hill curve; may differ from the scalar in the last ulp
+            assert values == pytest.approx(expected, rel=1e-12, abs=0), name
+        else:
+            assert (values == expected).all(), name
+    assert batch.generation_params == result.generation_params
+
+
+def test_batch_seed_is_reproducible():
+    spec = {"conditions": [ClinicalCondition.DKA], "seed": 42}
+    first = generate_blood_gas_batch(500, **spec)
+    second = generate_blood_gas_batch(500, **spec)
+    other = generate_blood_gas_batch(500, conditions=[ClinicalCondition.DKA], seed=43)
+    
+    for name in BATCH_VALUE_FIELDS:
+        np.testing.assert_array_equal(getattr(first, name), getattr(second, name))
+    assert not np.array_equal(first.ph, other.ph)
+
+
+def test_batch_leaves_global_random_state_alone():
+    random.seed(7)
+    expected = random.random()
+    random.seed(7)
+    generate_blood_gas_batch(100, primary_disorder=Disorder.METABOLIC_ACIDOSIS, seed=1)
+    assert random.random() == expected
+
+
+def test_scalar_without_seed_follows_global_random_seed():
+    def draw():
+        random.seed(1234)
+        return generate_blood_gas(primary_disorder=Disorder.METABOLIC_ACIDOSIS)
+    
+    assert draw().to_dict() == draw().to_dict()
+
+
+def test_batch_results_match_result():
+    batch = generate_blood_gas_batch(20, primary_disorder=Disorder.RESPIRATORY_ALKALOSIS, seed=3)
+    results = batch.results()
+    
+    assert len(results) == 20
+    for i, result in enumerate(results):
+        assert result == batch.result(i)
+        assert result.ph == batch.ph[i]
+
+
+def _random_results(n, seed):
+    """Results spread across the classifier boundaries, with values exactly on them."""
+    rnd = random.Random(seed)
+    
+    def pick(edges, low, high):
+        return rnd.choice(edges) if rnd.random() < 0.3 else rnd.uniform(low, high)
+    
+    return [
+        BloodGasResult(
+            ph=pick([7.10, 7.20, 7.30, 7.35, 7.45, 7.50, 7.55, 7.60], 6.9, 7.7),
+            pco2=pick([35, 45, 30, 50], 15, 90),
+            po2=pick([40, 50, 60, 80], 30, 400),
+            hco3=pick([22, 24, 26, 18, 30], 5, 45),
+            base_excess=0.0,
+            sao2=rnd.uniform(50, 100),
+            fio2=rnd.choice([0.21, 0.4, 1.0]),
+            pao2_fio2_ratio=pick([100, 200, 300], 50, 500),
+            aa_gradient=rnd.uniform(0, 400),
+            expected_aa_gradient=rnd.uniform(5, 25),
+            sodium=140,
+            potassium=4.0,
+            chloride=100,
+            glucose=100,
+            anion_gap=rnd.uniform(2, 35),
+            corrected_anion_gap=pick([6, 12, 14, 16, 20], 2, 35),
+            delta_gap=pick([0, 4, 6], -8, 25),
+            lactate=1.0,
+            hemoglobin=14,
+        )
+        for _ in range(n)
+    ]
+
+
+def test_interpret_batch_matches_interpret():
+    results = _random_results(3000, seed=0)
+    classified = InterpretationEngine.interpret_batch(results)
+    
+    for i, result in enumerate(results):
+        interpretation = InterpretationEngine.interpret(result)
+        assert classified["primary_disorder"][i] == interpretation.primary_disorder
+        assert classified["severity"][i] == interpretation.severity
+        assert classified["anion_gap_status"][i] == interpretation.anion_gap_status
+
+
+def test_interpret_batch_accepts_blood_gas_batch():
+    batch = generate_blood_gas_batch(
+        300, conditions=[ClinicalCondition.LACTIC_ACIDOSIS_SEPSIS], seed=5
+    )
+    from_batch = InterpretationEngine.interpret_batch(batch)
+    from_results = InterpretationEngine.interpret_batch(batch.results())
+    
+    for key, values in from_batch.items():
+        np.testing.assert_array_equal(values, from_results[key])
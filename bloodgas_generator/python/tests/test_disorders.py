@@ -0,0 +1,41 @@
+"""Text and int behaviour of the disorder enums."""
+
+import pytest
+
+from bloodgas.models.disorders import (
+    ChronicCondition,
+    ClinicalCondition,
+    Compensation,
+    Disorder,
+    Duration,
+    Severity,
+)
+from bloodgas.physiology.acid_base import AcidBaseEngine
+
+
+ENUMS = (Disorder, Severity, Compensation, Duration, ClinicalCondition, ChronicCondition)
+MEMBERS = [member for enum in ENUMS for member in enum]
+
+
+@pytest.mark.parametrize("member", MEMBERS, ids=str)
+def test_members_format_as_class_and_name(member):
+    text = f"{type(member).__name__}.{member.name}"
+    
+    assert str(member) == text
+    assert f"{member}" == text
+    assert format(member) == text
+    assert f"{member:>60}" == f"{text:>60}"
+
+
+@pytest.mark.parametrize("member", MEMBERS, ids=str)
+def test_members_index_as_ints(member):
+    assert member == member.value
+    assert hash(member) == hash(member.value)
+    assert list(range(member.value + 1))[member] == member.value
+
+
+def test_error_messages_name_the_member():
+    pytest.importorskip("numpy")
+    
+    with pytest.raises(ValueError, match="Disorder.NORMAL"):
+        AcidBaseEngine.expected_range_array(Disorder.NORMAL, [24.0])
@@ -0,0 +1,133 @@
+"""InterpretationEngine.interpret and its cached / shared variants."""
+
+import pickle
+from dataclasses import FrozenInstanceError
+
+import pytest
+
+from bloodgas import ClinicalCondition, Disorder, Severity, generate_blood_gas
+from bloodgas.interpretation import InterpretationEngine
+from bloodgas.models.blood_gas_result import INTERPRETATION_FIELDS, ClinicalInterpretation
+
+
+SPECS = [
+    *({"primary_disorder": d, "severity": s} for d in Disorder for s in Severity),
+    *({"conditions": [c]} for c in ClinicalCondition),
+    {"conditions": [ClinicalCondition.DKA, ClinicalCondition.OPIOID_OVERDOSE]},
+]
+
+
+def _cases():
+    """(result, conditions) pairs covering every disorder and condition."""
+    return [
+        (generate_blood_gas(seed=seed, **spec), spec.get("conditions"))
+        for seed, spec in enumerate(SPECS)
+    ]
+
+
+def _snapshot(interpretation):
+    """Field values with lists as tuples, to compare plain and shared instances."""
+    return {
+        name: tuple(value) if isinstance(value, (list, tuple)) else value
+        for name, value in ((name, getattr(interpretation, name)) for name in INTERPRETATION_FIELDS)
+    }
+
+
+@pytest.fixture
+def shared(monkeypatch):
+    monkeypatch.setattr(InterpretationEngine, "share_interpretations", True)
+
+
+def test_shared_interpretations_match_interpret(monkeypatch):
+    cases = _cases()
+    expected = [InterpretationEngine.interpret(result, conditions) for result, conditions in cases]
+    
+    monkeypatch.setattr(InterpretationEngine, "share_interpretations", True)
+    for (result, conditions), plain in zip(cases, expected):
+        interpretation = InterpretationEngine.interpret(result, conditions)
+        assert _snapshot(interpretation) == _snapshot(plain)
+        assert interpretation.to_dict() == plain.to_dict()
+        assert interpretation.to_text() == plain.to_text()
+        assert InterpretationEngine.interpret(result, conditions) is interpretation
+
+
+def test_shared_interpretation_rejects_edits(shared):
+    result, conditions = _cases()[0]
+    interpretation = InterpretationEngine.interpret(result, conditions)
+    
+    with pytest.raises(FrozenInstanceError):
+        interpretation.primary_disorder = "edited"
+    with pytest.raises(FrozenInstanceError):
+        interpretation.teaching_points = ["edited"]
+    with pytest.raises(AttributeError):
+        interpretation.teaching_points.append("edited")
+    assert InterpretationEngine.interpret(result, conditions) is interpretation
+
+
+def test_shared_interpretation_copies_are_plain(shared):
+    result, conditions = _cases()[0]
+    interpretation = InterpretationEngine.interpret(result, conditions)
+    points = tuple(interpretation.teaching_points)
+    
+    copy = interpretation.add_teaching_points("extra")
+    
+    assert type(copy) is ClinicalInterpretation
+    assert list(copy.teaching_points) == [*points, "extra"]
+    copy.primary_disorder = "edited"
+    copy.teaching_points.append("more")
+    copy.clinical_implications.append("more")
+    
+    again = InterpretationEngine.interpret(result, conditions)
+    assert again is interpretation
+    assert tuple(again.teaching_points) == points
+    assert again.primary_disorder != "edited"
+    assert "more" not in again.clinical_implications
+
+
+def test_shared_interpretation_pickles_through_pool(shared):
+    result, conditions = _cases()[0]
+    interpretation = InterpretationEngine.interpret(result, conditions)
+    
+    assert pickle.loads(pickle.dumps(interpretation)) is interpretation
+
+
+def test_add_teaching_points_leaves_original_unchanged():
+    result, conditions = _cases()[0]
+    interpretation = InterpretationEngine.interpret(result, conditions)
+    points = list(interpretation.teaching_points)
+    
+    copy = interpretation.add_teaching_points("a", "b")
+    
+    assert list(copy.teaching_points) == [*points, "a", "b"]
+    assert list(interpretation.teaching_points) == points
+
+
+def test_cached_interpretations_match_interpret(monkeypatch):
+    # Deterministic cases repeat exactly, so the second pass hits the cache
+    cases = _cases() + [
+        (generate_blood_gas(add_variability=False, **spec), spec.get("conditions"))
+        for spec in SPECS
+    ]
+    expected = [InterpretationEngine.interpret(result, conditions) for result, conditions in cases]
+    
+    monkeypatch.setattr(InterpretationEngine, "cache_interpretations", True)
+    for _ in range(2):
+        for (result, conditions), plain in zip(cases, expected):
+            assert InterpretationEngine.interpret(result, conditions) == plain
+
+
+def test_cached_interpretation_edits_do_not_reach_the_cache(monkeypatch):
+    monkeypatch.setattr(InterpretationEngine, "cache_interpretations", True)
+    result = generate_blood_gas(conditions=[ClinicalCondition.DKA], add_variability=False)
+    conditions = [ClinicalCondition.DKA]
+    first = InterpretationEngine.interpret(result, conditions)
+    expected = _snapshot(first)
+    
+    first.teaching_points.append("edited")
+    first.clinical_implications.clear()
+    first.generating_conditions.append("edited")
+    first.primary_disorder = "edited"
+    
+    second = InterpretationEngine.interpret(result, conditions)
+    assert second is not first
+    assert _snapshot(second) == expected
@@ -0,0 +1,295 @@
+"""Vectorized physiology kernels against their scalar counterparts."""
+
+import dataclasses
+import math
+
+import pytest
+
+from bloodgas.models.disorders import Compensation, Disorder, Duration, Severity
+from bloodgas.physiology.acid_base import AcidBaseEngine
+from bloodgas.physiology.electrolytes import ElectrolyteEngine
+from bloodgas.physiology.oxygenation import ARDS_CLASSES, OxygenationEngine
+from bloodgas.physiology.variability import (
+    PANEL_FIELDS,
+    VARIABILITY_LIMITS,
+    VariabilityConfig,
+    VariabilityEngine,
+)
+
+np = pytest.importorskip("numpy")
+
+
+N = 600
+
+# Relative tolerance for kernels built on NumPy's transcendental functions
+ULP = 1e-12
+
+
+def _scalar_kwargs(kwargs, i, optional=()):
+    """Case i of batch keyword arguments; NaN in an optional array means None."""
+    case = {}
+    for key, value in kwargs.items():
+        if isinstance(value, np.ndarray):
+            value = value[i].item()
+            if key in optional and math.isnan(value):
+                value = None
+        case[key] = value
+    return case
+
+
+def _column(rng, low, high, specials=(), special_fraction=0.3):
+    """Uniform values with some entries replaced by the given special values."""
+    values = rng.uniform(low, high, N)
+    if specials:
+        mask = rng.random(N) < special_fraction
+        values[mask] = rng.choice(np.asarray(specials, dtype=float), mask.sum())
+    return values
+
+
+# ---------------------------------------------------------------------------
+# Acid-base
+# ---------------------------------------------------------------------------
+
+def test_acid_base_kernels_match_scalar():
+    rng = np.random.default_rng(0)
+    hco3 = _column(rng, 4, 50, specials=(24.0,))
+    pco2 = _column(rng, 15, 100, specials=(40.0,))
+    ph = _column(rng, 6.8, 7.8, specials=(7.35, 7.40, 7.45))
+    hemoglobin = _column(rng, 5, 20)
+    
+    ph_out = AcidBaseEngine.calculate_ph_array(hco3, pco2)
+    hco3_out = AcidBaseEngine.calculate_hco3_array(ph, pco2)
+    pco2_out = AcidBaseEngine.calculate_pco2_array(ph, hco3)
+    be_out = AcidBaseEngine.calculate_base_excess_array(ph, hco3, hemoglobin)
+    for i in range(N):
+        # NumPy's log10 / exp may differ from the math module in the last ulp
+        assert ph_out[i] == pytest.approx(AcidBaseEngine.calculate_ph(hco3[i], pco2[i]), rel=ULP)
+        assert hco3_out[i] == pytest.approx(AcidBaseEngine.calculate_hco3(ph[i], pco2[i]), rel=ULP)
+        assert pco2_out[i] == pytest.approx(AcidBaseEngine.calculate_pco2(ph[i], hco3[i]), rel=ULP)
+        assert be_out[i] == AcidBaseEngine.calculate_base_excess(ph[i], hco3[i], hemoglobin[i])
+
+
+def test_calculate_ph_array_rejects_non_positive():
+    with pytest.raises(ValueError):
+        AcidBaseEngine.calculate_ph_array([24.0, 0.0], [40.0, 40.0])
+
+
+def test_identify_primary_disorder_array_matches_scalar():
+    rng = np.random.default_rng(1)
+    # Boundary values exercise the >= / > edges of every limit
+    ph = _column(rng, 7.2, 7.6, specials=(7.35, 7.45), special_fraction=0.5)
+    pco2 = _column(rng, 25, 55, specials=(35.0, 45.0), special_fraction=0.5)
+    hco3 = _column(rng, 15, 33, specials=(22.0, 26.0), special_fraction=0.5)
+    
+    out = AcidBaseEngine.identify_primary_disorder_array(ph, pco2, hco3)
+    for i in range(N):
+        assert out[i] == AcidBaseEngine.identify_primary_disorder(ph[i], pco2[i], hco3[i])
+
+
+@pytest.mark.parametrize(
+    "disorder, duration, method",
+    [
+        (Disorder.METABOLIC_ACIDOSIS, Duration.ACUTE, "pco2_metabolic_acidosis"),
+        (Disorder.METABOLIC_ALKALOSIS, Duration.ACUTE, "pco2_metabolic_alkalosis"),
+        (Disorder.RESPIRATORY_ACIDOSIS, Duration.ACUTE, "hco3_respiratory_acidosis_acute"),
+        (Disorder.RESPIRATORY_ACIDOSIS, Duration.CHRONIC, "hco3_respiratory_acidosis_chronic"),
+        (Disorder.RESPIRATORY_ALKALOSIS, Duration.ACUTE, "hco3_respiratory_alkalosis_acute"),
+        (Disorder.RESPIRATORY_ALKALOSIS, Duration.CHRONIC, "hco3_respiratory_alkalosis_chronic"),
+    ],
+)
+def test_expected_range_array_matches_scalar(disorder, duration, method):
+    values = np.linspace(4, 100, 97)
+    low, high = AcidBaseEngine.expected_range_array(disorder, values, duration)
+    expected_range = getattr(AcidBaseEngine, f"expected_{method}")
+    for i, value in enumerate(values):
+        assert (low[i], high[i]) == expected_range(value)
+
+
+def test_generate_for_disorder_batch_matches_scalar():
+    grid = np.meshgrid(
+        [d.value for d in Disorder],
+        [s.value for s in Severity],
+        [c.value for c in Compensation],
+        [d.value for d in Duration],
+        indexing="ij",
+    )
+    out = AcidBaseEngine.generate_for_disorder_batch(*grid)
+    
+    assert len(out) == grid[0].size
+    for (d, s, c, t), state in zip(zip(*(axis.ravel() for axis in grid)), out.states()):
+        expected = AcidBaseEngine.generate_for_disorder(
+            Disorder(d), Severity(s), Compensation(c), Duration(t)
+        )
+        assert state.primary_disorder == expected.primary_disorder
+        assert state.compensation_status == expected.compensation_status
+        assert state.secondary_disorder == expected.secondary_disorder
+        for name in ("ph", "pco2", "hco3", "base_excess"):
+            assert getattr(state, name) == pytest.approx(getattr(expected, name), rel=ULP, abs=ULP)
+
+
+# ---------------------------------------------------------------------------
+# Electrolytes
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("cause", [None, "dka", "lactic", "renal", "toxic", "unknown"])
+@pytest.mark.parametrize("case", range(6))
+def test_generate_electrolytes_batch_matches_scalar(case, cause):
+    rng = np.random.default_rng(case)
+    hco3 = _column(rng, 4, 50, specials=(24.0,))
+    kwargs = {
+        "ph": _column(rng, 6.8, 7.8),
+        "elevated_anion_gap": [False, True, rng.random(N) < 0.5][case % 3],
+        "anion_gap_cause": cause,
+        # NaN entries mean "not given" for that case
+        "target_anion_gap": _column(rng, 5, 40, specials=(np.nan,)) if case % 2 else None,
+        "chloride_target": [None, 100.0, _column(rng, 80, 125, specials=(np.nan,))][case % 3],
+        # A target of 0 falls back to its default
+        "sodium_target": _column(rng, 120, 160, specials=(0.0,)),
+        "potassium_target": [None, 4.5, _column(rng, 2, 7, specials=(0.0,))][case % 3],
+        "glucose_target": _column(rng, 40, 900, specials=(0.0,)) if case % 2 else 250.0,
+        "lactate_target": [None, _column(rng, 0.5, 15, specials=(0.0,))][case % 2],
+        "albumin": [4.0, _column(rng, 1.5, 5)][case % 2],
+    }
+    
+    batch = ElectrolyteEngine.generate_electrolytes_batch(hco3, **kwargs)
+    interpretations = ElectrolyteEngine.interpret_electrolytes_batch(batch, hco3)
+    
+    assert len(batch) == N
+    assert list(batch.states()) == [batch.state(i) for i in range(N)]
+    for i in range(N):
+        case_kwargs = _scalar_kwargs(kwargs, i, optional=("target_anion_gap", "chloride_target"))
+        state = ElectrolyteEngine.generate_electrolytes(float(hco3[i]), **case_kwargs)
+        assert batch.state(i) == state, case_kwargs
+        assert interpretations[i] == ElectrolyteEngine.interpret_electrolytes(state, float(hco3[i]))
+
+
+def test_electrolyte_batch_hits_inf_delta_ratio():
+    # HCO3 at or above normal with an elevated gap gives an infinite ratio
+    hco3 = np.array([24.0, 30.0, 24.0, 18.0])
+    batch = ElectrolyteEngine.generate_electrolytes_batch(
+        hco3, elevated_anion_gap=np.array([True, True, False, True])
+    )
+    for i in range(len(hco3)):
+        assert batch.state(i) == ElectrolyteEngine.generate_electrolytes(
+            float(hco3[i]), elevated_anion_gap=bool(i != 2)
+        )
+    assert math.isinf(batch.delta_ratio[0]) and math.isinf(batch.delta_ratio[1])
+    assert batch.delta_ratio[2] == 1.0
+
+
+def test_electrolyte_gap_kernels_match_scalar():
+    rng = np.random.default_rng(2)
+    sodium = _column(rng, 120, 160)
+    chloride = _column(rng, 80, 120)
+    hco3 = _column(rng, 4, 50, specials=(23.0, 24.0, 25.0))
+    potassium = _column(rng, 2, 7)
+    albumin = _column(rng, 1.5, 5, specials=(4.0,))
+    anion_gap = _column(rng, 0, 40, specials=(12.0, 16.0, 16.5))
+    
+    gap = ElectrolyteEngine.calculate_anion_gap_array(sodium, chloride, hco3)
+    gap_k = ElectrolyteEngine.calculate_anion_gap_array(sodium, chloride, hco3, True, potassium)
+    corrected = ElectrolyteEngine.correct_anion_gap_for_albumin_array(anion_gap, albumin)
+    ratio = ElectrolyteEngine.calculate_delta_ratio_array(anion_gap, hco3)
+    
+    assert np.isinf(ratio).any() and (ratio == 1.0).any()
+    for i in range(N):
+        assert gap[i] == ElectrolyteEngine.calculate_anion_gap(sodium[i], chloride[i], hco3[i])
+        assert gap_k[i] == ElectrolyteEngine.calculate_anion_gap(
+            sodium[i], chloride[i], hco3[i], True, potassium[i]
+        )
+        assert corrected[i] == ElectrolyteEngine.correct_anion_gap_for_albumin(
+            anion_gap[i], albumin[i]
+        )
+        assert ratio[i] == ElectrolyteEngine.calculate_delta_ratio(anion_gap[i], hco3[i])
+
+
+# ---------------------------------------------------------------------------
+# Oxygenation
+# ---------------------------------------------------------------------------
+
+def _assert_oxygenation_equal(actual, expected, context):
+    for field in dataclasses.fields(expected):
+        a, b = getattr(actual, field.name), getattr(expected, field.name)
+        if isinstance(b, float):
+            # The vectorized Hill curve may differ from the scalar in the last ulp
+            assert a == pytest.approx(b, rel=ULP, abs=0), (field.name, context)
+        else:
+            assert a == b, (field.name, context)
+
+
+@pytest.mark.parametrize("case", range(8))
+def test_generate_oxygenation_batch_matches_scalar(case):
+    rng = np.random.default_rng(100 + case)
+    kwargs = {
+        "fio2": [0.21, _column(rng, 0.21, 1.0, specials=(0.21, 1.0))][case % 2],
+        "paco2": _column(rng, 15, 100),
+        "age": [40, rng.integers(0, 111, N)][case % 2],
+        "aa_gradient_elevated": [False, True, rng.random(N) < 0.5, True][case % 4],
+        # NaN entries mean "not given" for that case
+        "target_aa_gradient": [None, _column(rng, 0, 80, specials=(np.nan,))][(case // 2) % 2],
+        "shunt_fraction": [0.0, _column(rng, 0, 0.6, specials=(0.0,))][(case // 4) % 2],
+        "ph": _column(rng, 6.8, 7.8),
+        "temperature": [37.0, _column(rng, 30, 42)][(case // 2) % 2],
+    }
+    
+    batch = OxygenationEngine.generate_oxygenation_batch(**kwargs)
+    
+    assert len(batch) == N
+    states = list(batch.states())
+    for i in range(N):
+        case_kwargs = _scalar_kwargs(kwargs, i, optional=("target_aa_gradient",))
+        assert states[i] == batch.state(i)
+        _assert_oxygenation_equal(
+            batch.state(i), OxygenationEngine.generate_oxygenation(**case_kwargs), case_kwargs
+        )
+
+
+def test_oxygenation_kernels_match_scalar():
+    rng = np.random.default_rng(3)
+    pao2 = _column(rng, -10, 700, specials=(0.0, 30.0, 100.0))
+    ph = _column(rng, 6.8, 7.8)
+    fio2 = _column(rng, 0.21, 1.0)
+    pf_ratio = _column(rng, 0, 600, specials=(100.0, 200.0, 300.0, np.nan))
+    
+    sao2 = OxygenationEngine.calculate_sao2_array(pao2, ph)
+    pf = OxygenationEngine.calculate_pf_ratio_array(pao2, fio2)
+    ards = OxygenationEngine.classify_ards_array(pf_ratio)
+    for i in range(N):
+        assert sao2[i] == pytest.approx(OxygenationEngine.calculate_sao2(pao2[i], ph[i]), rel=ULP)
+        assert pf[i] == OxygenationEngine.calculate_pf_ratio(pao2[i], fio2[i])
+        assert ARDS_CLASSES[ards[i]] == OxygenationEngine.classify_ards(pf_ratio[i])
+
+
+def test_calculate_pf_ratio_array_rejects_non_positive_fio2():
+    with pytest.raises(ValueError):
+        OxygenationEngine.calculate_pf_ratio_array([80.0, 80.0], [0.21, 0.0])
+
+
+# ---------------------------------------------------------------------------
+# Variability
+# ---------------------------------------------------------------------------
+
+def test_vary_panel_array_is_reproducible_and_bounded():
+    engine = VariabilityEngine(VariabilityConfig())
+    base = np.array([7.40, 40.0, 95.0, 24.0, 140.0, 4.0, 104.0, 100.0, 1.0, 14.0])
+    panel = np.repeat(base[:, None], 2000, axis=1)
+    
+    first = engine.vary_panel_array(panel, np.random.default_rng(9))
+    second = engine.vary_panel_array(panel, np.random.default_rng(9))
+    
+    np.testing.assert_array_equal(first, second)
+    assert first.shape == panel.shape
+    assert not np.array_equal(first, panel)
+    for row, name in zip(first, PANEL_FIELDS):
+        low, high, _ = VARIABILITY_LIMITS[name]
+        assert row.min() >= low and row.max() <= high, name
+
+
+def test_vary_arrays_disabled_return_input():
+    engine = VariabilityEngine(VariabilityConfig(enabled=False))
+    values = np.linspace(1, 10, 10)
+    panel = np.tile(values, (10, 1))
+    rng = np.random.default_rng(0)
+    
+    np.testing.assert_array_equal(engine.vary_array("po2", values, rng), values)
+    np.testing.assert_array_equal(engine.vary_panel_array(panel, rng), panel)
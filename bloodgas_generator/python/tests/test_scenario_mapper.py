@@ -0,0 +1,48 @@
+"""ScenarioMapper.map_single_condition_array against map_single_condition."""
+
+import dataclasses
+import itertools
+
+import pytest
+
+from bloodgas.models.disorders import ClinicalCondition, Severity
+from bloodgas.models.patient_state import PatientFactors
+from bloodgas.scenarios.scenario_mapper import ScenarioMapper
+
+np = pytest.importorskip("numpy")
+
+
+PAIRS = list(itertools.product(ClinicalCondition, Severity))
+
+
+def test_map_single_condition_array_matches_scalar():
+    mapped = ScenarioMapper.map_single_condition_array(
+        [condition for condition, _ in PAIRS], [severity for _, severity in PAIRS]
+    )
+    
+    for i, (condition, severity) in enumerate(PAIRS):
+        deltas = ScenarioMapper.map_single_condition(condition, severity, PatientFactors())
+        for field in dataclasses.fields(deltas):
+            expected = getattr(deltas, field.name)
+            if field.name == "ph_delta":
+                assert field.name not in mapped
+                assert expected == 0
+                continue
+            assert mapped[field.name][i] == expected, (condition, severity, field.name)
+            if isinstance(expected, bool):
+                assert mapped[field.name].dtype == np.bool_, field.name
+
+
+def test_map_single_condition_array_keeps_case_order():
+    rng = np.random.default_rng(0)
+    picks = rng.integers(0, len(PAIRS), 500)
+    conditions = [PAIRS[k][0] for k in picks]
+    severities = [PAIRS[k][1] for k in picks]
+    
+    mapped = ScenarioMapper.map_single_condition_array(conditions, severities)
+    full = ScenarioMapper.map_single_condition_array(
+        [condition for condition, _ in PAIRS], [severity for _, severity in PAIRS]
+    )
+    for name, values in mapped.items():
+        assert len(values) == len(picks)
+        np.testing.assert_array_equal(values, full[name][picks])
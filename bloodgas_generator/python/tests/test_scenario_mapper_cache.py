@@ -0,0 +1,56 @@
+"""Memoized ScenarioMapper.map_single_condition / map_multiple_conditions."""
+
+import dataclasses
+
+import pytest
+
+from bloodgas.models.disorders import ChronicCondition, ClinicalCondition, Severity
+from bloodgas.models.patient_state import PatientFactors
+from bloodgas.scenarios import scenario_mapper
+from bloodgas.scenarios.scenario_mapper import ScenarioMapper
+
+
+DKA = ClinicalCondition.DKA
+OPIOID = ClinicalCondition.OPIOID_OVERDOSE
+
+
+def _vandalize(deltas):
+    """Overwrite every field of a PhysiologyDeltas with an impossible value."""
+    for field in dataclasses.fields(deltas):
+        value = getattr(deltas, field.name)
+        setattr(deltas, field.name, not value if isinstance(value, bool) else -999.0)
+
+
+@pytest.mark.parametrize("conditions", [[DKA], [DKA, OPIOID]], ids=["single", "combined"])
+def test_mapped_deltas_edits_do_not_reach_the_cache(conditions):
+    severities = {DKA: Severity.SEVERE}
+    signature = tuple((c, severities.get(c, Severity.MODERATE)) for c in conditions)
+    expected = ScenarioMapper._map_conditions(signature)
+    
+    multiple = ScenarioMapper.map_multiple_conditions(conditions, severities, PatientFactors())
+    single = ScenarioMapper.map_single_condition(DKA, Severity.SEVERE, PatientFactors())
+    assert multiple == expected
+    _vandalize(multiple)
+    _vandalize(single)
+    
+    again = ScenarioMapper.map_multiple_conditions(conditions, severities, PatientFactors())
+    assert again is not multiple
+    assert again == expected
+    assert ScenarioMapper.map_single_condition(DKA, Severity.SEVERE, PatientFactors()) == (
+        ScenarioMapper._map_single_condition(DKA, Severity.SEVERE)
+    )
+
+
+def test_mapping_cache_is_shared_across_patients():
+    patients = [
+        PatientFactors(),
+        PatientFactors(age=80, chronic_conditions=(ChronicCondition.COPD,)),
+        PatientFactors(age=25, altitude_meters=3000),
+    ]
+    scenario_mapper._map_single.cache_clear()
+    
+    results = [ScenarioMapper.map_single_condition(DKA, Severity.MILD, p) for p in patients]
+    
+    assert all(deltas == results[0] for deltas in results)
+    info = scenario_mapper._map_single.cache_info()
+    assert (info.misses, info.hits) == (1, len(patients) - 1)
@@ -0,0 +1,85 @@
+"""Seeded results against recorded to_dict() output.
+
+The expected values live in data/seeded_results.json. Regenerate them only
+for an intended change to the generated values:
+
+    python tests/test_seeded_results.py
+"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bloodgas import (
+    ChronicCondition,
+    ClinicalCondition,
+    Compensation,
+    Disorder,
+    Duration,
+    PatientFactors,
+    Severity,
+    generate_blood_gas,
+)
+from bloodgas.interpretation import InterpretationEngine
+
+
+EXPECTED_PATH = Path(__file__).parent / "data" / "seeded_results.json"
+
+CASES = {
+    "metabolic_acidosis": dict(
+        primary_disorder=Disorder.METABOLIC_ACIDOSIS, severity=Severity.MODERATE, seed=1
+    ),
+    "chronic_respiratory_acidosis": dict(
+        primary_disorder=Disorder.RESPIRATORY_ACIDOSIS,
+        severity=Severity.SEVERE,
+        duration=Duration.CHRONIC,
+        seed=2,
+    ),
+    "mixed_alkalosis": dict(
+        primary_disorder=Disorder.METABOLIC_ALKALOSIS,
+        severity=Severity.MILD,
+        compensation=Compensation.PARTIAL,
+        secondary_disorder=Disorder.RESPIRATORY_ALKALOSIS,
+        seed=3,
+    ),
+    "dka": dict(conditions=[ClinicalCondition.DKA], seed=4),
+    "copd_exacerbation_on_oxygen": dict(
+        conditions=[ClinicalCondition.COPD_EXACERBATION],
+        condition_severities={ClinicalCondition.COPD_EXACERBATION: Severity.SEVERE},
+        patient_factors=PatientFactors(age=72, chronic_conditions=(ChronicCondition.COPD,)),
+        fio2=0.35,
+        seed=5,
+    ),
+    "dka_with_opioid_overdose": dict(
+        conditions=[ClinicalCondition.DKA, ClinicalCondition.OPIOID_OVERDOSE], seed=6
+    ),
+    "vomiting_without_variability": dict(
+        conditions=[ClinicalCondition.VOMITING], add_variability=False
+    ),
+}
+
+
+def _generate():
+    return {name: generate_blood_gas(**kwargs).to_dict() for name, kwargs in CASES.items()}
+
+
+@pytest.fixture(scope="module")
+def expected():
+    return json.loads(EXPECTED_PATH.read_text())
+
+
+@pytest.mark.parametrize("mode", ["plain", "cache_interpretations", "share_interpretations"])
+def test_seeded_results_match_recorded(mode, expected, monkeypatch):
+    if mode != "plain":
+        monkeypatch.setattr(InterpretationEngine, mode, True)
+    
+    # The second pass runs on warm mapping and interpretation caches
+    for _ in range(2):
+        # JSON round trip so tuples compare as the lists recorded in the file
+        assert json.loads(json.dumps(_generate())) == expected
+
+
+if __name__ == "__main__":
+    EXPECTED_PATH.parent.mkdir(exist_ok=True)
+    EXPECTED_PATH.write_text(json.dumps(_generate(), indent=2, ensure_ascii=False) + "\n")
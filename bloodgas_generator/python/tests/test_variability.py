@@ -0,0 +1,33 @@
+"""VariabilityEngine.spawn and the random streams it draws from."""
+
+import random
+
+from bloodgas.physiology.variability import VariabilityConfig, VariabilityEngine
+
+
+def _draws(engines):
+    return [engine.vary("ph", 7.4) for engine in engines]
+
+
+def test_seeded_parent_spawns_same_children_without_touching_global_state():
+    random.seed(0)
+    state = random.getstate()
+    
+    first = VariabilityEngine(VariabilityConfig(seed=42)).spawn(3)
+    second = VariabilityEngine(VariabilityConfig(seed=42)).spawn(3)
+    
+    assert [e.config.seed for e in first] == [e.config.seed for e in second]
+    assert len({e.config.seed for e in first}) == 3
+    assert _draws(first) == _draws(second)
+    assert random.getstate() == state
+
+
+def test_unseeded_parent_draws_child_seeds_from_global_state():
+    random.seed(7)
+    state = random.getstate()
+    first = [e.config.seed for e in VariabilityEngine().spawn(3)]
+    assert random.getstate() != state
+    
+    random.seed(7)
+    second = [e.config.seed for e in VariabilityEngine().spawn(3)]
+    assert first == second
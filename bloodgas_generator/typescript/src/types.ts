@@ -178,9 +178,9 @@ export interface BloodGasResult {
   hemoglobin: number;
   albumin: number;
   
-  // Metadata
-  interpretation: ClinicalInterpretation;
-  generationParams: GenerationParams;
+  // Metadata (null when not interpreted / not recorded)
+  interpretation: ClinicalInterpretation | null;
+  generationParams: GenerationParams | null;
 }
 
 // ═══════════════════════════════════════════════════════════════
@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
 import numpy as np
 
@@ -11,7 +13,11 @@ except ImportError:
 
 # Read the CSV file
 print("Reading labs.csv...")
-df = pd.read_csv('labs.csv')
+# Few distinct lab names across many rows: parsing them straight to category
+# codes never builds the column of Python strings, and the de-duplication and
+# pivot compare integers. caseid is already integer and stays so to match the
+# VitalDB data.
+df = pd.read_csv('labs.csv', dtype={'name': 'category'})
 
 # Get unique caseids and their lab timestamps
 print("Extracting case IDs and timestamps...")
@@ -32,41 +38,52 @@ if VITALDB_AVAILABLE:
     all_fio2_data = []
     successful_track = None
     
-    # Try each track name until we find one that works
-    for track_name in fio2_track_names:
-        print(f"Trying track name: {track_name}...")
-        track_found = False
-        
-        for case_id in case_ids[:5]:  # Test on first 5 cases
-            try:
-                case_data = vitaldb.read_numeric_data(case_id, [track_name])
-                if case_data is not None and not case_data.empty:
-                    track_found = True
-                    break
-            except Exception as e:
-                continue
-        
-        if track_found:
-            successful_track = track_name
-            print(f"Found FiO2 track: {track_name}")
-            break
+    def has_track(case_id, track_name):
+        try:
+            case_data = vitaldb.read_numeric_data(case_id, [track_name])
+        except Exception as e:
+            return False
+        return case_data is not None and not case_data.empty
+    
+    # Probe every track name on the first 5 cases at once instead of one
+    # request after another, then take the first track name that works
+    probe_cases = case_ids[:5]
+    with ThreadPoolExecutor(max_workers=len(fio2_track_names) * 5) as executor:
+        probes = {
+            track_name: [executor.submit(has_track, case_id, track_name) for case_id in probe_cases]
+            for track_name in fio2_track_names
+        }
+        for track_name in fio2_track_names:
+            print(f"Trying track name: {track_name}...")
+            if any(probe.result() for probe in probes[track_name]):
+                successful_track = track_name
+                print(f"Found FiO2 track: {track_name}")
+                break
     
     if successful_track:
         print(f"Fetching FiO2 data for all cases using track: {successful_track}...")
-        for idx, case_id in enumerate(case_ids):
-            if (idx + 1) % 100 == 0:
-                print(f"  Processed {idx + 1}/{len(case_ids)} cases...")
-            
+        
+        def fetch_case_fio2(case_id):
             try:
                 case_data = vitaldb.read_numeric_data(case_id, [successful_track])
-                if case_data is not None and not case_data.empty:
-                    # Rename columns to match our format
-                    case_data = case_data.rename(columns={'Time': 'dt', 'Value': 'FiO2'})
-                    case_data['caseid'] = case_id
-                    all_fio2_data.append(case_data)
             except Exception as e:
                 # Skip cases where FiO2 data is not available
-                continue
+                return None
+            if case_data is None or case_data.empty:
+                return None
+            # Rename columns to match our format
+            case_data = case_data.rename(columns={'Time': 'dt', 'Value': 'FiO2'})
+            case_data['caseid'] = case_id
+            return case_data
+        
+        # Downloads are network-bound, so overlap them across threads;
+        # map() keeps the results in case order
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            for idx, case_data in enumerate(executor.map(fetch_case_fio2, case_ids)):
+                if (idx + 1) % 100 == 0:
+                    print(f"  Processed {idx + 1}/{len(case_ids)} cases...")
+                if case_data is not None:
+                    all_fio2_data.append(case_data)
         
         if all_fio2_data:
             fio2_data = pd.concat(all_fio2_data, ignore_index=True)
@@ -82,9 +99,10 @@ if VITALDB_AVAILABLE:
 if fio2_data is not None and not fio2_data.empty:
     print("\nMatching FiO2 values to lab timestamps...")
     
-    # Sort both dataframes for merge_asof (requires sorted data)
-    fio2_sorted = fio2_data.sort_values(['caseid', 'dt']).reset_index(drop=True)
-    lab_times_sorted = unique_lab_times.sort_values(['caseid', 'dt']).reset_index(drop=True)
+    # merge_asof requires both sides sorted by the 'on' key itself (dt), not by
+    # caseid first; it matches within each caseid through 'by'
+    fio2_sorted = fio2_data.sort_values('dt', kind='stable')
+    lab_times_sorted = unique_lab_times.sort_values('dt', kind='stable')
     
     # Use merge_asof for efficient nearest neighbor matching
     # This finds the nearest FiO2 value in time for each lab timestamp within the same caseid
@@ -99,36 +117,31 @@ if fio2_data is not None and not fio2_data.empty:
     )
     
     print(f"Matched FiO2 values for {fio2_matched['FiO2'].notna().sum()} out of {len(fio2_matched)} lab timestamps")
-    
-    # Merge FiO2 into the original lab data
-    df = df.merge(fio2_matched[['caseid', 'dt', 'FiO2']], on=['caseid', 'dt'], how='left')
-    print("FiO2 values merged into lab data")
 else:
     print("\nNo FiO2 data available - continuing without FiO2 column")
     fio2_matched = None
 
 # Pivot the data: caseid and dt become index, name becomes columns, result becomes values
 print("\nPivoting data...")
-pivoted = df.pivot_table(
-    index=['caseid', 'dt'],
-    columns='name',
-    values='result',
-    aggfunc='first'  # Use first value if there are duplicates (shouldn't be, but just in case)
+# Same result as pivot_table(aggfunc='first'), without the groupby aggregation:
+# keep the first non-missing value per cell, then reshape the names to columns
+pivoted = (
+    df.dropna(subset=['result'])
+    .drop_duplicates(['caseid', 'dt', 'name'])
+    .set_index(['caseid', 'dt', 'name'])['result']
+    .unstack('name')
 )
 
-# Reset index to make caseid and dt regular columns
-pivoted = pivoted.reset_index()
-
-# Add FiO2 column if available (it should be the same for all rows with same caseid/dt)
-# Note: FiO2 was merged into df before pivoting, but pivot_table doesn't preserve non-index/column/value columns
-# So we need to merge it separately after pivoting
-if fio2_data is not None and not fio2_data.empty and fio2_matched is not None and not fio2_matched.empty:
-    fio2_for_pivot = fio2_matched[['caseid', 'dt', 'FiO2']].drop_duplicates()
-    pivoted = pivoted.merge(fio2_for_pivot, on=['caseid', 'dt'], how='left')
+# Add FiO2 column if available. fio2_matched has exactly one row per
+# (caseid, dt), so it is assigned by index alignment on the pivoted table
+# rather than merged into every lab row before the pivot (which dropped it)
+if fio2_matched is not None and not fio2_matched.empty:
+    pivoted['FiO2'] = fio2_matched.set_index(['caseid', 'dt'])['FiO2']
     print("FiO2 column added to pivoted data")
 
-# Sort by caseid and dt for easier reading
-pivoted = pivoted.sort_values(['caseid', 'dt'])
+# Reset index to make caseid and dt regular columns; unstack returns the
+# (caseid, dt) index sorted, so the output is already sorted by caseid and dt
+pivoted = pivoted.reset_index()
 
 # Save to new CSV file
 output_file = 'labs_reformatted.csv'